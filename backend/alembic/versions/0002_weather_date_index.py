@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "0002_weather_date_index"
+down_revision = "0001_create_schema"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_weather_date_station", "weather_data", ["date", "station_id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_weather_date_station", table_name="weather_data")
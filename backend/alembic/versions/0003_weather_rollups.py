@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0003_weather_rollups"
+down_revision = "0002_weather_date_index"
+branch_labels = None
+depends_on = None
+
+METRIC_COLUMNS = (
+    "evapotranspiration_mm",
+    "rainfall_mm",
+    "temp_max_c",
+    "temp_min_c",
+    "humidity_max_percent",
+    "humidity_min_percent",
+    "wind_speed_ms",
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "dataset_meta",
+        sa.Column("key", sa.String(length=64), primary_key=True),
+        sa.Column("value", sa.String(length=255), nullable=False),
+    )
+
+    metric_columns = []
+    for column in METRIC_COLUMNS:
+        metric_columns.extend(
+            [
+                sa.Column(f"{column}_count", sa.Integer(), nullable=False),
+                sa.Column(f"{column}_sum", sa.Float()),
+                sa.Column(f"{column}_min", sa.Float()),
+                sa.Column(f"{column}_max", sa.Float()),
+            ]
+        )
+
+    op.create_table(
+        "weather_rollups",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("station_id", sa.Integer(), nullable=False),
+        sa.Column("granularity", sa.String(length=10), nullable=False),
+        sa.Column("period", sa.String(length=10), nullable=False),
+        sa.Column("period_start", sa.Date(), nullable=False),
+        sa.Column("period_end", sa.Date(), nullable=False),
+        sa.Column("row_count", sa.Integer(), nullable=False),
+        *metric_columns,
+        sa.ForeignKeyConstraint(["station_id"], ["stations.id"], ondelete="CASCADE"),
+        sa.UniqueConstraint(
+            "station_id", "granularity", "period", name="uq_rollup_station_period"
+        ),
+    )
+    op.create_index(
+        "ix_rollup_granularity_start",
+        "weather_rollups",
+        ["granularity", "period_start", "period_end"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_rollup_granularity_start", table_name="weather_rollups")
+    op.drop_table("weather_rollups")
+    op.drop_table("dataset_meta")
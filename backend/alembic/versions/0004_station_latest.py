@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0004_station_latest"
+down_revision = "0003_weather_rollups"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "station_latest",
+        sa.Column("station_id", sa.Integer(), primary_key=True),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("evapotranspiration_mm", sa.Float()),
+        sa.Column("rainfall_mm", sa.Float()),
+        sa.Column("temp_max_c", sa.Float()),
+        sa.Column("temp_min_c", sa.Float()),
+        sa.Column("humidity_max_percent", sa.Float()),
+        sa.Column("humidity_min_percent", sa.Float()),
+        sa.Column("wind_speed_ms", sa.Float()),
+        sa.ForeignKeyConstraint(["station_id"], ["stations.id"], ondelete="CASCADE"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("station_latest")
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0005_station_watermarks"
+down_revision = "0004_station_latest"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "station_watermarks",
+        sa.Column("station_id", sa.Integer(), primary_key=True),
+        sa.Column("max_date", sa.Date(), nullable=False),
+        sa.Column("ingested_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["station_id"], ["stations.id"], ondelete="CASCADE"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("station_watermarks")
@@ -49,8 +49,8 @@ def create_app(config_name: str = "development") -> Flask:
             r"/api/*": {
                 "origins": cors_origins,
                 "methods": ["GET", "POST", "OPTIONS"],
-                "allow_headers": ["Content-Type", "Authorization"],
-                "expose_headers": ["Content-Disposition"],
+                "allow_headers": ["Content-Type", "Authorization", "If-None-Match"],
+                "expose_headers": ["Content-Disposition", "ETag", "X-Dataset-Version"],
                 "max_age": 3600,
             }
         },
@@ -74,6 +74,8 @@ def create_app(config_name: str = "development") -> Flask:
         config={
             "CACHE_TYPE": app.config.get("CACHE_TYPE", "SimpleCache"),
             "CACHE_DEFAULT_TIMEOUT": app.config.get("CACHE_DEFAULT_TIMEOUT", 300),
+            "CACHE_SQLITE_PATH": app.config.get("CACHE_SQLITE_PATH"),
+            "CACHE_SQLITE_MAX_BYTES": app.config.get("CACHE_SQLITE_MAX_BYTES"),
         },
     )
 
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from datetime import date
+from datetime import date, datetime
 from typing import List, Optional
 
-from sqlalchemy import Date, Float, ForeignKey, Index, Integer, String, UniqueConstraint
+from sqlalchemy import Date, DateTime, Float, ForeignKey, Index, Integer, String, UniqueConstraint
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -29,7 +29,6 @@ class Station(Base):
     weather_data: Mapped[List["WeatherData"]] = relationship(
         back_populates="station",
         cascade="all, delete-orphan",
-        lazy="selectin",
     )
 
 
@@ -39,6 +38,7 @@ class WeatherData(Base):
     __tablename__ = "weather_data"
     __table_args__ = (
         Index("ix_weather_station_date", "station_id", "date"),
+        Index("ix_weather_date_station", "date", "station_id"),
         UniqueConstraint("station_id", "date", name="uq_weather_station_date"),
     )
 
@@ -56,3 +56,109 @@ class WeatherData(Base):
     wind_speed_ms: Mapped[Optional[float]] = mapped_column(Float)
 
     station: Mapped[Station] = relationship(back_populates="weather_data")
+
+
+# Daily observation columns carried through to derived tables.
+WEATHER_METRIC_COLUMNS = (
+    "evapotranspiration_mm",
+    "rainfall_mm",
+    "temp_max_c",
+    "temp_min_c",
+    "humidity_max_percent",
+    "humidity_min_percent",
+    "wind_speed_ms",
+)
+
+
+class DatasetMeta(Base):
+    """Key/value metadata describing the loaded dataset and its derived tables."""
+
+    __tablename__ = "dataset_meta"
+
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    value: Mapped[str] = mapped_column(String(255), nullable=False)
+
+
+class WeatherRollup(Base):
+    """Per-station weekly, monthly and yearly aggregates of daily observations.
+
+    Each metric stores its non-null count, sum, minimum and maximum so rollups
+    can be merged into coarser periods without revisiting the daily rows.
+    """
+
+    __tablename__ = "weather_rollups"
+    __table_args__ = (
+        UniqueConstraint(
+            "station_id", "granularity", "period", name="uq_rollup_station_period"
+        ),
+        Index("ix_rollup_granularity_start", "granularity", "period_start", "period_end"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    station_id: Mapped[int] = mapped_column(
+        ForeignKey("stations.id", ondelete="CASCADE"), nullable=False
+    )
+    granularity: Mapped[str] = mapped_column(String(10), nullable=False)
+    period: Mapped[str] = mapped_column(String(10), nullable=False)
+    period_start: Mapped[date] = mapped_column(Date, nullable=False)
+    period_end: Mapped[date] = mapped_column(Date, nullable=False)
+    row_count: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    evapotranspiration_mm_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    evapotranspiration_mm_sum: Mapped[Optional[float]] = mapped_column(Float)
+    evapotranspiration_mm_min: Mapped[Optional[float]] = mapped_column(Float)
+    evapotranspiration_mm_max: Mapped[Optional[float]] = mapped_column(Float)
+    rainfall_mm_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    rainfall_mm_sum: Mapped[Optional[float]] = mapped_column(Float)
+    rainfall_mm_min: Mapped[Optional[float]] = mapped_column(Float)
+    rainfall_mm_max: Mapped[Optional[float]] = mapped_column(Float)
+    temp_max_c_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    temp_max_c_sum: Mapped[Optional[float]] = mapped_column(Float)
+    temp_max_c_min: Mapped[Optional[float]] = mapped_column(Float)
+    temp_max_c_max: Mapped[Optional[float]] = mapped_column(Float)
+    temp_min_c_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    temp_min_c_sum: Mapped[Optional[float]] = mapped_column(Float)
+    temp_min_c_min: Mapped[Optional[float]] = mapped_column(Float)
+    temp_min_c_max: Mapped[Optional[float]] = mapped_column(Float)
+    humidity_max_percent_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    humidity_max_percent_sum: Mapped[Optional[float]] = mapped_column(Float)
+    humidity_max_percent_min: Mapped[Optional[float]] = mapped_column(Float)
+    humidity_max_percent_max: Mapped[Optional[float]] = mapped_column(Float)
+    humidity_min_percent_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    humidity_min_percent_sum: Mapped[Optional[float]] = mapped_column(Float)
+    humidity_min_percent_min: Mapped[Optional[float]] = mapped_column(Float)
+    humidity_min_percent_max: Mapped[Optional[float]] = mapped_column(Float)
+    wind_speed_ms_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    wind_speed_ms_sum: Mapped[Optional[float]] = mapped_column(Float)
+    wind_speed_ms_min: Mapped[Optional[float]] = mapped_column(Float)
+    wind_speed_ms_max: Mapped[Optional[float]] = mapped_column(Float)
+
+
+class StationLatest(Base):
+    """Most recent daily observation for each station."""
+
+    __tablename__ = "station_latest"
+
+    station_id: Mapped[int] = mapped_column(
+        ForeignKey("stations.id", ondelete="CASCADE"), primary_key=True
+    )
+    date: Mapped[date] = mapped_column(Date, nullable=False)
+    evapotranspiration_mm: Mapped[Optional[float]] = mapped_column(Float)
+    rainfall_mm: Mapped[Optional[float]] = mapped_column(Float)
+    temp_max_c: Mapped[Optional[float]] = mapped_column(Float)
+    temp_min_c: Mapped[Optional[float]] = mapped_column(Float)
+    humidity_max_percent: Mapped[Optional[float]] = mapped_column(Float)
+    humidity_min_percent: Mapped[Optional[float]] = mapped_column(Float)
+    wind_speed_ms: Mapped[Optional[float]] = mapped_column(Float)
+
+
+class StationWatermark(Base):
+    """Newest observation date ingested for each station."""
+
+    __tablename__ = "station_watermarks"
+
+    station_id: Mapped[int] = mapped_column(
+        ForeignKey("stations.id", ondelete="CASCADE"), primary_key=True
+    )
+    max_date: Mapped[date] = mapped_column(Date, nullable=False)
+    ingested_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
@@ -1,9 +1,17 @@
 """Repository layer abstractions."""
 
+from .meta_repository import DatasetMetaRepository
+from .rollup_repository import RollupRepository
+from .station_latest_repository import StationLatestRepository
 from .station_repository import StationRepository
+from .watermark_repository import WatermarkRepository
 from .weather_repository import WeatherRepository
 
 __all__ = [
+    "DatasetMetaRepository",
+    "RollupRepository",
+    "StationLatestRepository",
     "StationRepository",
+    "WatermarkRepository",
     "WeatherRepository",
 ]
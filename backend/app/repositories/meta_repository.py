@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.models import DatasetMeta
+
+
+class DatasetMetaRepository:
+    """Data access layer for dataset metadata entries."""
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def get(self, key: str) -> Optional[str]:
+        entry = self._session.get(DatasetMeta, key)
+        return entry.value if entry else None
+
+    def set(self, key: str, value: str) -> None:
+        self._session.merge(DatasetMeta(key=key, value=value))
+
+    def delete(self, key: str) -> None:
+        entry = self._session.get(DatasetMeta, key)
+        if entry is not None:
+            self._session.delete(entry)
@@ -0,0 +1,326 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.models import WEATHER_METRIC_COLUMNS, Station, WeatherData, WeatherRollup
+from app.repositories.meta_repository import DatasetMetaRepository
+from app.utils.periods import (
+    ROLLUP_GRANULARITIES,
+    bounds_from_key,
+    period_bounds,
+    period_expression,
+    period_key,
+)
+
+ROLLUPS_META_KEY = "rollups_built_at"
+
+# Finer rollup used to fill the partial periods at the edges of a range.
+# Weeks do not nest inside months, so weekly and monthly edges go to raw rows.
+_FINER_GRANULARITY = {"yearly": "monthly", "monthly": None, "weekly": None}
+
+_INSERT_CHUNK_SIZE = 5000
+
+PeriodTotals = Dict[Tuple[int, str], Dict[str, object]]
+
+
+class RollupRepository:
+    """Maintains and queries the pre-aggregated ``weather_rollups`` table."""
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def is_ready(self) -> bool:
+        return DatasetMetaRepository(self._session).get(ROLLUPS_META_KEY) is not None
+
+    def rebuild(self) -> int:
+        """Recompute every rollup from the daily observations."""
+        self._session.execute(delete(WeatherRollup))
+        inserted = sum(self._build(granularity) for granularity in ROLLUP_GRANULARITIES)
+        DatasetMetaRepository(self._session).set(
+            ROLLUPS_META_KEY, datetime.now(timezone.utc).isoformat()
+        )
+        return inserted
+
+    def refresh(
+        self,
+        *,
+        station_ids: Optional[Iterable[int]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> int:
+        """Recompute only the rollup periods touched by new or changed observations."""
+        stations = tuple(station_ids) if station_ids else None
+        inserted = 0
+        for granularity in ROLLUP_GRANULARITIES:
+            window_start = period_bounds(granularity, start_date)[0] if start_date else None
+            window_end = period_bounds(granularity, end_date)[1] if end_date else None
+
+            stmt = delete(WeatherRollup).where(WeatherRollup.granularity == granularity)
+            if stations:
+                stmt = stmt.where(WeatherRollup.station_id.in_(stations))
+            if window_start:
+                stmt = stmt.where(WeatherRollup.period_end >= window_start)
+            if window_end:
+                stmt = stmt.where(WeatherRollup.period_start <= window_end)
+            self._session.execute(stmt)
+
+            inserted += self._build(
+                granularity,
+                station_ids=stations,
+                start_date=window_start,
+                end_date=window_end,
+            )
+        return inserted
+
+    def fetch_aggregations(
+        self,
+        *,
+        metric,
+        aggregation: str,
+        station_ids: Optional[Iterable[int]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> List[Tuple]:
+        """Rollup-backed equivalent of ``WeatherRepository.fetch_aggregations``."""
+        column = metric.key
+        totals = self.fetch_period_totals(
+            columns=[column],
+            aggregation=aggregation,
+            station_ids=station_ids,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        names = self._station_names({station_id for station_id, _ in totals})
+
+        rows = []
+        for (station_id, period), entry in sorted(totals.items(), key=lambda item: (item[0][1], item[0][0])):
+            count = entry[f"{column}_count"]
+            rows.append(
+                (
+                    station_id,
+                    names.get(station_id),
+                    period,
+                    entry[f"{column}_sum"] / count if count else None,
+                    entry[f"{column}_min"],
+                    entry[f"{column}_max"],
+                )
+            )
+        return rows
+
+    def fetch_period_totals(
+        self,
+        *,
+        columns: Sequence[str],
+        aggregation: str,
+        station_ids: Optional[Iterable[int]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> PeriodTotals:
+        """Return mergeable count/sum/min/max totals per ``(station_id, period)``.
+
+        Periods that lie entirely inside the range come straight from the
+        matching rollup. Partial periods at either edge are filled from the
+        next finer rollup that nests inside them, and finally from daily rows.
+        """
+        totals: PeriodTotals = {}
+        self._collect(
+            totals,
+            columns=columns,
+            key_granularity=aggregation,
+            source_granularity=aggregation,
+            station_ids=tuple(station_ids) if station_ids else None,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return totals
+
+    def _collect(
+        self,
+        totals: PeriodTotals,
+        *,
+        columns: Sequence[str],
+        key_granularity: str,
+        source_granularity: Optional[str],
+        station_ids: Optional[Tuple[int, ...]],
+        start_date: Optional[date],
+        end_date: Optional[date],
+    ) -> None:
+        if source_granularity is None:
+            self._merge(
+                totals,
+                columns,
+                self._raw_rows(key_granularity, columns, station_ids, start_date, end_date),
+                key_granularity=None,
+            )
+            return
+
+        stmt = select(
+            WeatherRollup.station_id,
+            WeatherRollup.period,
+            WeatherRollup.period_start,
+            WeatherRollup.row_count,
+            *[
+                getattr(WeatherRollup, f"{column}_{suffix}")
+                for column in columns
+                for suffix in ("count", "sum", "min", "max")
+            ],
+        ).where(WeatherRollup.granularity == source_granularity)
+        if station_ids:
+            stmt = stmt.where(WeatherRollup.station_id.in_(station_ids))
+        if start_date:
+            stmt = stmt.where(WeatherRollup.period_start >= start_date)
+        if end_date:
+            stmt = stmt.where(WeatherRollup.period_end <= end_date)
+        self._merge(
+            totals,
+            columns,
+            self._session.execute(stmt).all(),
+            key_granularity=None if key_granularity == source_granularity else key_granularity,
+        )
+
+        for edge_start, edge_end in self._edge_segments(source_granularity, start_date, end_date):
+            self._collect(
+                totals,
+                columns=columns,
+                key_granularity=key_granularity,
+                source_granularity=_FINER_GRANULARITY.get(source_granularity),
+                station_ids=station_ids,
+                start_date=edge_start,
+                end_date=edge_end,
+            )
+
+    @staticmethod
+    def _edge_segments(
+        granularity: str, start_date: Optional[date], end_date: Optional[date]
+    ) -> List[Tuple[date, date]]:
+        segments: List[Tuple[date, date]] = []
+        if start_date:
+            period_start, period_end = period_bounds(granularity, start_date)
+            if period_start != start_date:
+                edge_end = min(period_end, end_date) if end_date else period_end
+                segments.append((start_date, edge_end))
+        if end_date:
+            period_start, period_end = period_bounds(granularity, end_date)
+            if period_end != end_date:
+                edge_start = max(period_start, start_date) if start_date else period_start
+                if not segments or segments[0] != (edge_start, end_date):
+                    segments.append((edge_start, end_date))
+        return segments
+
+    def _raw_rows(
+        self,
+        granularity: str,
+        columns: Sequence[str],
+        station_ids: Optional[Tuple[int, ...]],
+        start_date: Optional[date],
+        end_date: Optional[date],
+    ):
+        period = period_expression(granularity, WeatherData.date)
+        stmt = select(
+            WeatherData.station_id,
+            period.label("period"),
+            func.count().label("row_count"),
+            *self._metric_aggregates(columns),
+        ).group_by(WeatherData.station_id, period)
+        if station_ids:
+            stmt = stmt.where(WeatherData.station_id.in_(station_ids))
+        if start_date:
+            stmt = stmt.where(WeatherData.date >= start_date)
+        if end_date:
+            stmt = stmt.where(WeatherData.date <= end_date)
+        return self._session.execute(stmt).all()
+
+    @staticmethod
+    def _merge(
+        totals: PeriodTotals,
+        columns: Sequence[str],
+        rows,
+        *,
+        key_granularity: Optional[str],
+    ) -> None:
+        for row in rows:
+            mapping = row._mapping
+            period = (
+                period_key(key_granularity, mapping["period_start"])
+                if key_granularity
+                else mapping["period"]
+            )
+            entry = totals.get((mapping["station_id"], period))
+            if entry is None:
+                entry = {"row_count": 0}
+                for column in columns:
+                    entry.update(
+                        {
+                            f"{column}_count": 0,
+                            f"{column}_sum": 0.0,
+                            f"{column}_min": None,
+                            f"{column}_max": None,
+                        }
+                    )
+                totals[(mapping["station_id"], period)] = entry
+
+            entry["row_count"] += mapping["row_count"]
+            for column in columns:
+                count = mapping[f"{column}_count"] or 0
+                if not count:
+                    continue
+                entry[f"{column}_count"] += count
+                entry[f"{column}_sum"] += mapping[f"{column}_sum"]
+                low = mapping[f"{column}_min"]
+                high = mapping[f"{column}_max"]
+                current_low = entry[f"{column}_min"]
+                current_high = entry[f"{column}_max"]
+                entry[f"{column}_min"] = low if current_low is None else min(current_low, low)
+                entry[f"{column}_max"] = high if current_high is None else max(current_high, high)
+
+    def _build(
+        self,
+        granularity: str,
+        *,
+        station_ids: Optional[Tuple[int, ...]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> int:
+        rows = self._raw_rows(
+            granularity, WEATHER_METRIC_COLUMNS, station_ids, start_date, end_date
+        )
+        mappings = []
+        for row in rows:
+            mapping = dict(row._mapping)
+            mapping["period_start"], mapping["period_end"] = bounds_from_key(
+                granularity, mapping["period"]
+            )
+            mapping["granularity"] = granularity
+            mappings.append(mapping)
+
+        for offset in range(0, len(mappings), _INSERT_CHUNK_SIZE):
+            self._session.execute(
+                insert(WeatherRollup), mappings[offset : offset + _INSERT_CHUNK_SIZE]
+            )
+        return len(mappings)
+
+    @staticmethod
+    def _metric_aggregates(columns: Sequence[str]) -> List:
+        aggregates = []
+        for column in columns:
+            attribute = getattr(WeatherData, column)
+            aggregates.extend(
+                [
+                    func.count(attribute).label(f"{column}_count"),
+                    func.sum(attribute).label(f"{column}_sum"),
+                    func.min(attribute).label(f"{column}_min"),
+                    func.max(attribute).label(f"{column}_max"),
+                ]
+            )
+        return aggregates
+
+    def _station_names(self, station_ids: Iterable[int]) -> Dict[int, str]:
+        identifiers = tuple(station_ids)
+        if not identifiers:
+            return {}
+        stmt = select(Station.id, Station.station_name).where(Station.id.in_(identifiers))
+        return dict(self._session.execute(stmt).all())
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.models import WEATHER_METRIC_COLUMNS, Station, StationLatest, WeatherData
+from app.repositories.meta_repository import DatasetMetaRepository
+
+STATION_LATEST_META_KEY = "station_latest_built_at"
+
+
+class StationLatestRepository:
+    """Maintains the ``station_latest`` snapshot of each station's newest observation."""
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def is_ready(self) -> bool:
+        return DatasetMetaRepository(self._session).get(STATION_LATEST_META_KEY) is not None
+
+    def rebuild(self) -> int:
+        self._session.execute(delete(StationLatest))
+        inserted = self._populate()
+        DatasetMetaRepository(self._session).set(
+            STATION_LATEST_META_KEY, datetime.now(timezone.utc).isoformat()
+        )
+        return inserted
+
+    def refresh(self, *, station_ids: Iterable[int]) -> int:
+        """Recompute the snapshot rows for stations that received new observations."""
+        identifiers = tuple(station_ids)
+        if not identifiers:
+            return 0
+        self._session.execute(
+            delete(StationLatest).where(StationLatest.station_id.in_(identifiers))
+        )
+        return self._populate(identifiers)
+
+    def fetch_latest_metric_values(
+        self, *, column: str, station_ids: Optional[Iterable[int]] = None
+    ) -> List[Tuple[int, str, float, float, str, Optional[float]]]:
+        stmt = (
+            select(
+                Station.id,
+                Station.station_name,
+                Station.latitude,
+                Station.longitude,
+                Station.state,
+                getattr(StationLatest, column).label("value"),
+            )
+            .join(StationLatest, Station.id == StationLatest.station_id)
+            .order_by(Station.state, Station.station_name)
+        )
+        if station_ids is not None:
+            stmt = stmt.where(Station.id.in_(station_ids))
+        return self._session.execute(stmt).all()
+
+    def _populate(self, station_ids: Optional[Tuple[int, ...]] = None) -> int:
+        latest = select(
+            WeatherData.station_id,
+            func.max(WeatherData.date).label("max_date"),
+        ).group_by(WeatherData.station_id)
+        if station_ids:
+            latest = latest.where(WeatherData.station_id.in_(station_ids))
+        latest = latest.subquery()
+
+        columns = ("station_id", "date", *WEATHER_METRIC_COLUMNS)
+        source = select(*[getattr(WeatherData, name) for name in columns]).join(
+            latest,
+            (WeatherData.station_id == latest.c.station_id)
+            & (WeatherData.date == latest.c.max_date),
+        )
+        result = self._session.execute(insert(StationLatest).from_select(columns, source))
+        return result.rowcount or 0
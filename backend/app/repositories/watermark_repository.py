@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import delete, func, insert, literal, select
+from sqlalchemy.orm import Session
+
+from app.models import StationWatermark, WeatherData
+
+
+class WatermarkRepository:
+    """Tracks the newest ingested observation date per station."""
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def rebuild(self) -> int:
+        self._session.execute(delete(StationWatermark))
+        return self._populate()
+
+    def refresh(self, *, station_ids: Iterable[int]) -> int:
+        identifiers = tuple(station_ids)
+        if not identifiers:
+            return 0
+        self._session.execute(
+            delete(StationWatermark).where(StationWatermark.station_id.in_(identifiers))
+        )
+        return self._populate(identifiers)
+
+    def fetch_watermarks(self) -> Dict[int, date]:
+        stmt = select(StationWatermark.station_id, StationWatermark.max_date)
+        return dict(self._session.execute(stmt).all())
+
+    def _populate(self, station_ids: Optional[Tuple[int, ...]] = None) -> int:
+        source = select(
+            WeatherData.station_id,
+            func.max(WeatherData.date),
+            # ingested_at is a naive column holding UTC.
+            literal(datetime.now(timezone.utc).replace(tzinfo=None)),
+        ).group_by(WeatherData.station_id)
+        if station_ids:
+            source = source.where(WeatherData.station_id.in_(station_ids))
+        result = self._session.execute(
+            insert(StationWatermark).from_select(
+                ("station_id", "max_date", "ingested_at"), source
+            )
+        )
+        return result.rowcount or 0
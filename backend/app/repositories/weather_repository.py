@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session, selectinload
+import numpy as np
+from sqlalchemy import Integer, case, cast, func, literal, select, true, tuple_, union_all
+from sqlalchemy.orm import Session
 
 from app.models import Station, WeatherData
+from app.utils.periods import period_expression
 
 
 class WeatherRepository:
@@ -24,33 +26,111 @@ class WeatherRepository:
         page: int = 1,
         page_size: int = 500,
     ) -> Tuple[List[WeatherData], int]:
-        base_stmt = select(WeatherData)
-
-        if station_ids:
-            base_stmt = base_stmt.where(WeatherData.station_id.in_(station_ids))
-        if start_date:
-            base_stmt = base_stmt.where(WeatherData.date >= start_date)
-        if end_date:
-            base_stmt = base_stmt.where(WeatherData.date <= end_date)
+        base_stmt = self._apply_filters(
+            select(WeatherData),
+            station_ids=station_ids,
+            start_date=start_date,
+            end_date=end_date,
+        )
 
         count_stmt = select(func.count()).select_from(base_stmt.subquery())
         total = int(self._session.execute(count_stmt).scalar_one())
 
         stmt = (
-            base_stmt.options(selectinload(WeatherData.station))
-            .order_by(WeatherData.date)
+            base_stmt.order_by(*self._keyset_order())
             .limit(page_size)
             .offset((page - 1) * page_size)
         )
         items = self._session.execute(stmt).scalars().all()
         return items, total
 
+    def fetch_weather_after(
+        self,
+        *,
+        after: Optional[Tuple[date, int, int]] = None,
+        station_ids: Optional[Sequence[int]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        limit: int = 500,
+    ) -> List[WeatherData]:
+        """Return up to ``limit`` rows ordered after the ``(date, station_id, id)`` position.
+
+        The row-value comparison lets the database seek through
+        ``ix_weather_date_station`` instead of skipping an OFFSET worth of rows.
+        """
+        stmt = self._apply_filters(
+            select(WeatherData),
+            station_ids=station_ids,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        if after is not None:
+            stmt = stmt.where(tuple_(*self._keyset_order()) > tuple_(*after))
+
+        stmt = stmt.order_by(*self._keyset_order()).limit(limit)
+        return self._session.execute(stmt).scalars().all()
+
+    def count_weather(
+        self,
+        *,
+        station_ids: Optional[Sequence[int]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> int:
+        stmt = self._apply_filters(
+            select(func.count()).select_from(WeatherData),
+            station_ids=station_ids,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return int(self._session.execute(stmt).scalar_one())
+
+    def fetch_date_bounds(self) -> Tuple[Optional[date], Optional[date]]:
+        """Earliest and latest observation dates, answered from the date index."""
+        stmt = select(func.min(WeatherData.date), func.max(WeatherData.date))
+        earliest, latest = self._session.execute(stmt).one()
+        return earliest, latest
+
+    def iter_weather_rows(
+        self,
+        *,
+        station_ids: Optional[Sequence[int]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        batch_size: int = 5000,
+    ) -> Iterator[Sequence]:
+        """Yield filtered observations in batches.
+
+        Rows are streamed from the cursor with ``yield_per`` so memory stays
+        bounded by ``batch_size`` regardless of how many rows match.
+        """
+        stmt = (
+            select(
+                WeatherData.station_id,
+                WeatherData.date,
+                WeatherData.temp_max_c,
+                WeatherData.temp_min_c,
+                WeatherData.rainfall_mm,
+                WeatherData.humidity_max_percent,
+                WeatherData.humidity_min_percent,
+                WeatherData.wind_speed_ms,
+                WeatherData.evapotranspiration_mm,
+            )
+            .order_by(*self._keyset_order())
+            .execution_options(yield_per=batch_size)
+        )
+        stmt = self._apply_filters(
+            stmt, station_ids=station_ids, start_date=start_date, end_date=end_date
+        )
+        yield from self._session.execute(stmt).partitions()
+
     def fetch_latest_metric_values(
         self,
         *,
         column,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
+        station_ids: Optional[Iterable[int]] = None,
     ) -> List[Tuple[int, str, float, float, str, Optional[float]]]:
         if start_date or end_date:
             stmt = (
@@ -76,8 +156,10 @@ class WeatherRepository:
                     func.max(WeatherData.date).label("max_date"),
                 )
                 .group_by(WeatherData.station_id)
-                .subquery()
             )
+            if station_ids is not None:
+                latest_subquery = latest_subquery.where(WeatherData.station_id.in_(station_ids))
+            latest_subquery = latest_subquery.subquery()
 
             stmt = (
                 select(
@@ -96,9 +178,29 @@ class WeatherRepository:
                 )
             )
 
+        if station_ids is not None:
+            stmt = stmt.where(Station.id.in_(station_ids))
         stmt = stmt.order_by(Station.state, Station.station_name)
         return self._session.execute(stmt).all()
 
+    def fetch_station_means(
+        self,
+        *,
+        columns: Sequence[str],
+        station_ids: Iterable[int],
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> List[Tuple]:
+        """Per-station means of ``columns``, as ``(station_id, *means)`` rows."""
+        stmt = select(
+            WeatherData.station_id,
+            *[func.avg(getattr(WeatherData, name)).label(name) for name in columns],
+        ).group_by(WeatherData.station_id)
+        stmt = self._apply_filters(
+            stmt, station_ids=tuple(station_ids), start_date=start_date, end_date=end_date
+        )
+        return self._session.execute(stmt).all()
+
     def fetch_aggregations(
         self,
         *,
@@ -108,13 +210,7 @@ class WeatherRepository:
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
     ) -> List[Tuple]:
-        aggregation_map = {
-            "daily": func.strftime("%Y-%m-%d", WeatherData.date),
-            "weekly": func.strftime("%Y-W%W", WeatherData.date),
-            "monthly": func.strftime("%Y-%m", WeatherData.date),
-            "yearly": func.strftime("%Y", WeatherData.date),
-        }
-        period_expr = aggregation_map.get(aggregation, aggregation_map["monthly"])
+        period_expr = period_expression(aggregation, WeatherData.date)
 
         stmt = (
             select(
@@ -135,40 +231,214 @@ class WeatherRepository:
         if end_date:
             stmt = stmt.where(WeatherData.date <= end_date)
 
-        stmt = stmt.group_by(WeatherData.station_id, period_expr).order_by(period_expr)
+        stmt = stmt.group_by(WeatherData.station_id, Station.station_name, period_expr).order_by(period_expr)
         return self._session.execute(stmt).all()
 
-    def fetch_statistics_dataset(
+    def fetch_period_totals(
+        self,
+        *,
+        columns: Sequence[str],
+        aggregation: str,
+        station_ids: Optional[Iterable[int]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Dict[Tuple[int, str], Dict[str, object]]:
+        """Count/sum/min/max of every column per ``(station_id, period)`` in one grouped scan.
+
+        Entries have the same keys as ``RollupRepository.fetch_period_totals``.
+        """
+        period_expr = period_expression(aggregation, WeatherData.date)
+        aggregates = []
+        for column in columns:
+            attribute = getattr(WeatherData, column)
+            aggregates.extend([
+                func.count(attribute).label(f"{column}_count"),
+                func.sum(attribute).label(f"{column}_sum"),
+                func.min(attribute).label(f"{column}_min"),
+                func.max(attribute).label(f"{column}_max"),
+            ])
+
+        stmt = select(
+            WeatherData.station_id,
+            period_expr.label("period"),
+            func.count().label("row_count"),
+            *aggregates,
+        ).group_by(WeatherData.station_id, period_expr)
+        stmt = self._apply_filters(
+            stmt,
+            station_ids=tuple(station_ids) if station_ids else None,
+            start_date=start_date,
+            end_date=end_date,
+        )
+
+        totals = {}
+        for row in self._session.execute(stmt):
+            entry = dict(row._mapping)
+            totals[(entry.pop("station_id"), entry.pop("period"))] = entry
+        return totals
+
+    def fetch_statistics_arrays(
         self,
         *,
+        columns: Sequence,
         station_ids: Optional[Iterable[int]] = None,
         state: Optional[str] = None,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
-    ) -> List[Tuple]:
-        stmt = (
-            select(
-                WeatherData.temp_max_c,
-                WeatherData.temp_min_c,
-                WeatherData.rainfall_mm,
-                WeatherData.humidity_max_percent,
-                WeatherData.humidity_min_percent,
-                WeatherData.wind_speed_ms,
-                WeatherData.evapotranspiration_mm,
+        chunk_size: int = 50000,
+    ) -> List[np.ndarray]:
+        """Return one contiguous float64 array per column, with NaN for missing values.
+
+        Rows are streamed in ``chunk_size`` partitions and converted block by
+        block, so no per-row Python objects outlive their chunk.
+        """
+        stmt = select(*columns)
+        if state:
+            stmt = stmt.join(Station, WeatherData.station_id == Station.id)
+        stmt = self._apply_filters(
+            stmt,
+            station_ids=tuple(station_ids) if station_ids else None,
+            state=state.upper() if state else None,
+            start_date=start_date,
+            end_date=end_date,
+        ).execution_options(yield_per=chunk_size)
+
+        blocks: List[List[np.ndarray]] = [[] for _ in columns]
+        for partition in self._session.execute(stmt).partitions():
+            block = np.array(partition, dtype=np.float64).reshape(-1, len(columns))
+            for index, column_blocks in enumerate(blocks):
+                column_blocks.append(block[:, index])
+
+        return [
+            np.concatenate(column_blocks) if column_blocks else np.empty(0, dtype=np.float64)
+            for column_blocks in blocks
+        ]
+
+    def fetch_statistics_moments(
+        self,
+        *,
+        columns: Sequence,
+        station_ids: Optional[Iterable[int]] = None,
+        state: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Dict[str, object]:
+        """Aggregate per-column and pairwise moments in a single query.
+
+        Returns the row count, per-column min/max, and ``k x k`` matrices of
+        pairwise-complete counts, sums, sums of squares and cross-products
+        (entry ``[i, j]`` only covers rows where columns ``i`` and ``j`` are
+        both present; the diagonal holds the plain per-column moments).
+        Adding ``0 * other`` to an expression makes it NULL whenever the other
+        column is missing, so SQL aggregates skip those rows.
+        """
+        size = len(columns)
+        aggregates = [func.count().label("rows")]
+        for index, column in enumerate(columns):
+            aggregates.extend(
+                [
+                    func.count(column).label(f"count_{index}_{index}"),
+                    func.sum(column).label(f"sum_{index}_{index}"),
+                    func.sum(column * column).label(f"square_{index}_{index}"),
+                    func.min(column).label(f"min_{index}"),
+                    func.max(column).label(f"max_{index}"),
+                ]
             )
-            .join(Station, WeatherData.station_id == Station.id)
+        for first in range(size):
+            for second in range(first + 1, size):
+                x, y = columns[first], columns[second]
+                aggregates.extend(
+                    [
+                        func.count(x * y).label(f"count_{first}_{second}"),
+                        func.sum(x * y).label(f"product_{first}_{second}"),
+                        func.sum(x + 0 * y).label(f"sum_{first}_{second}"),
+                        func.sum(y + 0 * x).label(f"sum_{second}_{first}"),
+                        func.sum(x * x + 0 * y).label(f"square_{first}_{second}"),
+                        func.sum(y * y + 0 * x).label(f"square_{second}_{first}"),
+                    ]
+                )
+
+        stmt = select(*aggregates).select_from(WeatherData)
+        if state:
+            stmt = stmt.join(Station, WeatherData.station_id == Station.id)
+        stmt = self._apply_filters(
+            stmt,
+            station_ids=tuple(station_ids) if station_ids else None,
+            state=state.upper() if state else None,
+            start_date=start_date,
+            end_date=end_date,
         )
+        row = self._session.execute(stmt).one()._mapping
 
-        if station_ids:
-            stmt = stmt.where(WeatherData.station_id.in_(tuple(station_ids)))
+        counts = np.zeros((size, size))
+        sums = np.zeros((size, size))
+        squares = np.zeros((size, size))
+        products = np.zeros((size, size))
+        for first in range(size):
+            for second in range(size):
+                low, high = min(first, second), max(first, second)
+                counts[first, second] = row[f"count_{low}_{high}"] or 0
+                sums[first, second] = row[f"sum_{first}_{second}"] or 0.0
+                squares[first, second] = row[f"square_{first}_{second}"] or 0.0
+                products[first, second] = (
+                    row[f"square_{first}_{first}"] if first == second
+                    else row[f"product_{low}_{high}"]
+                ) or 0.0
+
+        return {
+            "rows": int(row["rows"]),
+            "minimum": [row[f"min_{index}"] for index in range(size)],
+            "maximum": [row[f"max_{index}"] for index in range(size)],
+            "counts": counts,
+            "sums": sums,
+            "squares": squares,
+            "products": products,
+        }
+
+    def fetch_value_histograms(
+        self,
+        *,
+        columns: Sequence,
+        bin_width: float,
+        station_ids: Optional[Iterable[int]] = None,
+        state: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> List[List[Tuple[int, int]]]:
+        """Return sorted ``(bin, count)`` pairs per column for values bucketed by ``bin_width``.
+
+        The filtered rows are cross-joined with a small table of column indexes
+        so every column is binned in the same grouped pass.
+        """
+        selector = union_all(
+            *[select(literal(index).label("position")) for index in range(len(columns))]
+        ).subquery("selector")
+        value = case(
+            *[(selector.c.position == index, column) for index, column in enumerate(columns)]
+        )
+        bucket = cast(func.round(value / bin_width), Integer)
+
+        stmt = select(selector.c.position, bucket.label("bucket"), func.count())
+        stmt = stmt.select_from(WeatherData).join(selector, true())
         if state:
-            stmt = stmt.where(Station.state == state.upper())
-        if start_date:
-            stmt = stmt.where(WeatherData.date >= start_date)
-        if end_date:
-            stmt = stmt.where(WeatherData.date <= end_date)
+            stmt = stmt.join(Station, WeatherData.station_id == Station.id)
+        stmt = self._apply_filters(
+            stmt,
+            station_ids=tuple(station_ids) if station_ids else None,
+            state=state.upper() if state else None,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        stmt = (
+            stmt.where(value.is_not(None))
+            .group_by(selector.c.position, bucket)
+            .order_by(selector.c.position, bucket)
+        )
 
-        return self._session.execute(stmt).all()
+        histograms: List[List[Tuple[int, int]]] = [[] for _ in columns]
+        for position, bin_index, count in self._session.execute(stmt):
+            histograms[position].append((int(bin_index), int(count)))
+        return histograms
 
     def fetch_summary_stats(
         self,
@@ -179,6 +449,14 @@ class WeatherRepository:
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
     ) -> Dict[str, object]:
+        """Compute record totals, per-metric moments and extremes over one filtered CTE.
+
+        Plain aggregates over the filtered rows give the totals and each metric's
+        count/avg/min/max; ``FILTER`` aggregates over the same rows find the
+        earliest date holding every extreme, all in one statement. The rows
+        behind the extremes are then read through the date index.
+        """
+        metric_items = list(metric_columns.items())
         filters = {
             "station_ids": tuple(station_ids) if station_ids else None,
             "state": state.upper() if state else None,
@@ -186,124 +464,138 @@ class WeatherRepository:
             "end_date": end_date,
         }
 
-        base_count_stmt = (
-            select(func.count())
-            .select_from(WeatherData)
-            .join(Station, WeatherData.station_id == Station.id)
-        )
-        base_count_stmt = self._apply_filters(base_count_stmt, **filters)
-        total_records = int(self._session.execute(base_count_stmt).scalar_one())
+        source = select(
+            WeatherData.station_id,
+            WeatherData.date,
+            *[column.label(f"value_{index}") for index, (_, column) in enumerate(metric_items)],
+        ).select_from(WeatherData)
+        if state:
+            source = source.join(Station, WeatherData.station_id == Station.id)
+        filtered = self._apply_filters(source, **filters).cte("filtered")
 
-        distinct_stmt = (
-            select(func.count(func.distinct(WeatherData.station_id)))
-            .select_from(WeatherData)
-            .join(Station, WeatherData.station_id == Station.id)
-        )
-        distinct_stmt = self._apply_filters(distinct_stmt, **filters)
-        station_count = int(self._session.execute(distinct_stmt).scalar_one())
+        columns = [
+            func.count().label("records"),
+            func.count(func.distinct(filtered.c.station_id)).label("stations"),
+            func.min(filtered.c.date).label("earliest"),
+            func.max(filtered.c.date).label("latest"),
+        ]
+        for index in range(len(metric_items)):
+            value = filtered.c[f"value_{index}"]
+            columns.extend(
+                [
+                    func.count(value).label(f"count_{index}"),
+                    func.avg(value).label(f"avg_{index}"),
+                    func.min(value).label(f"min_{index}"),
+                    func.max(value).label(f"max_{index}"),
+                ]
+            )
+        aggregates = select(*columns).cte("aggregates")
 
-        earliest_stmt = (
-            select(func.min(WeatherData.date))
-            .select_from(WeatherData)
-            .join(Station, WeatherData.station_id == Station.id)
-        )
-        earliest_stmt = self._apply_filters(earliest_stmt, **filters)
-        earliest = self._session.execute(earliest_stmt).scalar_one()
+        first_dates = []
+        for index in range(len(metric_items)):
+            value = filtered.c[f"value_{index}"]
+            for extreme in ("max", "min"):
+                first_dates.append(
+                    func.min(filtered.c.date)
+                    .filter(value == aggregates.c[f"{extreme}_{index}"])
+                    .label(f"{extreme}_date_{index}")
+                )
+        dates = select(*first_dates).select_from(filtered).join(aggregates, true()).subquery()
+        totals = self._session.execute(
+            select(aggregates, dates).select_from(aggregates).join(dates, true())
+        ).one()._mapping
 
-        latest_stmt = (
-            select(func.max(WeatherData.date))
-            .select_from(WeatherData)
-            .join(Station, WeatherData.station_id == Station.id)
-        )
-        latest_stmt = self._apply_filters(latest_stmt, **filters)
-        latest = self._session.execute(latest_stmt).scalar_one()
+        if not totals["records"]:
+            return {
+                "records": 0,
+                "stations": 0,
+                "earliest": None,
+                "latest": None,
+                "metrics": {
+                    key: {
+                        "count": 0,
+                        "average": None,
+                        "minimum": None,
+                        "maximum": None,
+                        "max_record": None,
+                        "min_record": None,
+                    }
+                    for key, _ in metric_items
+                },
+            }
 
-        metrics_summary = {}
-        for key, column in metric_columns.items():
-            stats_stmt = (
-                select(
-                    func.count(column).label("count"),
-                    func.avg(column).label("avg"),
-                    func.min(column).label("min"),
-                    func.max(column).label("max"),
-                )
-                .select_from(WeatherData)
-                .join(Station, WeatherData.station_id == Station.id)
-                .where(column.is_not(None))
-            )
-            stats_stmt = self._apply_filters(stats_stmt, **filters)
-            count, avg, min_value, max_value = self._session.execute(stats_stmt).first()
-
-            max_record = self._fetch_extreme_record(
-                column=column,
-                station_ids=station_ids,
-                state=state,
-                start_date=start_date,
-                end_date=end_date,
-                ascending=False,
-            )
-            min_record = self._fetch_extreme_record(
-                column=column,
-                station_ids=station_ids,
-                state=state,
-                start_date=start_date,
-                end_date=end_date,
-                ascending=True,
-            )
+        extremes = {}
+        for index, (_, column) in enumerate(metric_items):
+            for extreme in ("max", "min"):
+                label = f"{extreme}_{index}"
+                extremes[label] = (column, totals[label], totals[f"{extreme}_date_{index}"])
+        records = self._fetch_extreme_records(extremes, filters)
 
+        metrics_summary = {}
+        for index, (key, _) in enumerate(metric_items):
+            avg = totals[f"avg_{index}"]
+            min_value = totals[f"min_{index}"]
+            max_value = totals[f"max_{index}"]
             metrics_summary[key] = {
-                "count": int(count or 0),
+                "count": int(totals[f"count_{index}"] or 0),
                 "average": float(avg) if avg is not None else None,
                 "minimum": float(min_value) if min_value is not None else None,
                 "maximum": float(max_value) if max_value is not None else None,
-                "max_record": max_record,
-                "min_record": min_record,
+                "max_record": records.get(f"max_{index}"),
+                "min_record": records.get(f"min_{index}"),
             }
 
         return {
-            "records": total_records,
-            "stations": station_count,
-            "earliest": earliest,
-            "latest": latest,
+            "records": int(totals["records"]),
+            "stations": int(totals["stations"]),
+            "earliest": totals["earliest"],
+            "latest": totals["latest"],
             "metrics": metrics_summary,
         }
 
-    def _fetch_extreme_record(
+    def _fetch_extreme_records(
         self,
-        *,
-        column,
-        station_ids: Optional[Iterable[int]] = None,
-        state: Optional[str] = None,
-        start_date: Optional[date] = None,
-        end_date: Optional[date] = None,
-        ascending: bool,
-    ) -> Optional[Dict[str, object]]:
-        stmt = (
-            select(WeatherData, Station)
-            .join(Station, WeatherData.station_id == Station.id)
-            .where(column.is_not(None))
-        )
-        stmt = self._apply_filters(
-            stmt,
-            station_ids=tuple(station_ids) if station_ids else None,
-            state=state.upper() if state else None,
-            start_date=start_date,
-            end_date=end_date,
-        )
-        order_clause = column.asc() if ascending else column.desc()
-        stmt = stmt.order_by(order_clause, WeatherData.date.asc()).limit(1)
-        row = self._session.execute(stmt).first()
-        if not row:
-            return None
-        weather, station = row
+        extremes: Dict[str, Tuple[WeatherData, Optional[float], Optional[date]]],
+        filters: Dict[str, object],
+    ) -> Dict[str, Dict[str, object]]:
+        """Return the first row holding each extreme value on its known earliest date, by label."""
+        lookups = []
+        for label, (column, value, observed_on) in extremes.items():
+            if value is None:
+                continue
+            lookup = (
+                select(
+                    literal(label).label("extreme"),
+                    WeatherData.station_id,
+                    WeatherData.date,
+                    Station.station_name,
+                    Station.state,
+                    column.label("value"),
+                )
+                .join(Station, WeatherData.station_id == Station.id)
+                .where(WeatherData.date == observed_on, column == value)
+            )
+            lookup = self._apply_filters(lookup, **filters)
+            lookup = lookup.order_by(WeatherData.id.asc()).limit(1)
+            lookups.append(select(lookup.subquery()))
+        if not lookups:
+            return {}
+
         return {
-            "station_id": station.id,
-            "station_name": station.station_name,
-            "state": station.state,
-            "date": weather.date.isoformat(),
-            "value": getattr(weather, column.key),
+            row.extreme: {
+                "station_id": row.station_id,
+                "station_name": row.station_name,
+                "state": row.state,
+                "date": row.date.isoformat(),
+                "value": row.value,
+            }
+            for row in self._session.execute(union_all(*lookups))
         }
 
+    @staticmethod
+    def _keyset_order():
+        return WeatherData.date, WeatherData.station_id, WeatherData.id
+
     def _apply_filters(
         self,
         stmt,
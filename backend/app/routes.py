@@ -1,29 +1,133 @@
 from __future__ import annotations
 
-from flask import Blueprint, current_app, jsonify, make_response, request
+from functools import wraps
+from itertools import chain
+from typing import Callable, Dict, Optional
+
+from flask import Blueprint, Response, current_app, jsonify, request, stream_with_context
+from werkzeug.http import quote_etag
 
 from app import limiter
 from app.services import (
     aggregation_service,
+    cache_service,
+    cluster_service,
+    dashboard_service,
+    dataset_service,
     export_service,
     station_service,
     statistics_service,
+    tile_service,
     weather_service,
     insights_service,
 )
 from app.utils.validators import (
     handle_validation_error,
     validate_aggregation,
+    validate_bbox,
+    validate_coordinate,
+    validate_correlation_method,
+    validate_cursor,
     validate_date,
+    validate_flag,
+    validate_metric,
     validate_metrics,
+    validate_neighbours,
     validate_pagination,
+    validate_sections,
     validate_state,
     validate_station_ids,
+    validate_tile,
+    validate_tile_format,
+    validate_tile_method,
+    validate_zoom,
 )
 
 api_bp = Blueprint("api", __name__)
 
 
+@api_bp.before_request
+def sync_dataset_version():
+    """Pick up datasets reloaded by another process before serving cached state."""
+    try:
+        dataset_service.sync_dataset_version()
+    except Exception:  # pragma: no cover - keep serving the previous snapshot
+        current_app.logger.warning("Dataset version check failed", exc_info=True)
+
+
+def conditional_get(
+    route: str,
+    params: Optional[Callable[..., Dict[str, object]]] = None,
+    max_age_route: Optional[str] = None,
+):
+    """Tag successful responses with an ETag and answer ``If-None-Match`` with 304.
+
+    ``params`` validates the request (it receives the URL's view arguments) into
+    the keyword arguments the view is called with, which are the parameters it
+    keys its cache entry on. The ETag covers the dataset version and those
+    validated values, so equivalent requests share a validator and a
+    revalidation is answered before any cache lookup or query runs.
+    Requests pinned to the current dataset with ``?version=`` may be cached for
+    ``PINNED_CACHE_MAX_AGE``. Other responses keep a ``Cache-Control`` the view
+    set; otherwise they must revalidate, or stay fresh for ``max_age_route``'s
+    cache timeout when one is given.
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(**view_args):
+            try:
+                arguments = params(**view_args) if params else view_args
+            except ValueError as exc:
+                return handle_validation_error(exc)
+            version = dataset_service.get_dataset_version()
+            etag = dataset_service.build_etag(route, arguments)
+            if etag is None:
+                return view(**arguments)
+
+            matched = _matching_etag(etag)
+            if matched is not None:
+                response = Response(status=304)
+                response.headers["ETag"] = matched
+            else:
+                response = current_app.make_response(view(**arguments))
+                # Skip errors, and responses computed across a dataset reload.
+                if response.status_code != 200 or dataset_service.get_dataset_version() != version:
+                    return response
+                response.set_etag(etag)
+
+            response.headers["X-Dataset-Version"] = version
+            if request.args.get("version") == version:
+                max_age = current_app.config.get("PINNED_CACHE_MAX_AGE", 365 * 24 * 3600)
+                response.headers["Cache-Control"] = f"public, max-age={max_age}, immutable"
+            elif "Cache-Control" not in response.headers:
+                response.headers["Cache-Control"] = (
+                    f"public, max-age={cache_service.get_route_timeout(max_age_route)}"
+                    if max_age_route
+                    else "public, no-cache"
+                )
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def _matching_etag(etag: str) -> Optional[str]:
+    """The ``If-None-Match`` entry matching ``etag``, as the client sent it.
+
+    Flask-Compress rewrites strong ETags on compressed responses to
+    ``"<etag>:<algorithm>"``, so browsers revalidate with that form.
+    """
+    if_none_match = request.if_none_match
+    if if_none_match.star_tag:
+        return quote_etag(etag)
+    for candidate in if_none_match.as_set(include_weak=True):
+        if candidate.split(":", 1)[0] == etag:
+            return quote_etag(candidate, weak=if_none_match.is_weak(candidate))
+    return None
+
+
 @api_bp.route("/test")
 def test_api():
     """Simple heartbeat endpoint for smoke testing."""
@@ -32,6 +136,7 @@ def test_api():
 
 @api_bp.route("/states")
 @limiter.limit("60 per minute")
+@conditional_get("states")
 def get_states():
     """
     Retrieve all supported state/territory codes.
@@ -41,16 +146,25 @@ def get_states():
         description: List of state codes.
     """
     try:
-        states = station_service.get_states()
+        states = cache_service.get_or_compute("states", station_service.get_states)
         return jsonify(states)
     except Exception as exc:  # pragma: no cover - safety net
         current_app.logger.exception("Failed to fetch states")
         return jsonify({"error": "Internal server error"}), 500
 
 
+def _stations_params():
+    return {
+        "state": validate_state(request.args.get("state")),
+        "bbox": validate_bbox(request.args.get("bbox")),
+        "zoom": validate_zoom(request.args.get("zoom")),
+    }
+
+
 @api_bp.route("/stations")
 @limiter.limit("60 per minute")
-def get_stations():
+@conditional_get("stations", _stations_params)
+def get_stations(state, bbox, zoom):
     """
     Retrieve metadata for weather stations.
     ---
@@ -59,13 +173,26 @@ def get_stations():
         name: state
         type: string
         description: Optional Australian state/territory filter.
+      - in: query
+        name: bbox
+        type: string
+        description: Optional viewport as min_lon,min_lat,max_lon,max_lat.
+      - in: query
+        name: zoom
+        type: integer
+        description: Optional map zoom level; low zooms return an evenly spread subset.
     responses:
       200:
         description: Paginated station metadata
     """
     try:
-        state = validate_state(request.args.get("state"))
-        stations = station_service.get_all_stations(state=state)
+        stations = cache_service.get_or_compute(
+            "stations",
+            lambda: station_service.get_all_stations(state=state, bbox=bbox, zoom=zoom),
+            state=state,
+            bbox=bbox,
+            zoom=zoom,
+        )
         return jsonify({"items": stations, "count": len(stations)})
     except ValueError as exc:
         return handle_validation_error(exc)
@@ -74,8 +201,124 @@ def get_stations():
         return jsonify({"error": "Internal server error"}), 500
 
 
+def _nearest_params():
+    return {
+        "latitude": validate_coordinate(request.args.get("lat"), "lat", 90),
+        "longitude": validate_coordinate(request.args.get("lon"), "lon", 180),
+        "k": validate_neighbours(request.args.get("k")),
+    }
+
+
+@api_bp.route("/stations/nearest")
+@limiter.limit("120 per minute")
+@conditional_get("nearest", _nearest_params)
+def get_nearest_stations(latitude, longitude, k):
+    """
+    Retrieve the stations closest to a point.
+    ---
+    parameters:
+      - in: query
+        name: lat
+        type: number
+        required: true
+      - in: query
+        name: lon
+        type: number
+        required: true
+      - in: query
+        name: k
+        type: integer
+        description: Number of stations to return (default 4, max 32).
+    responses:
+      200:
+        description: Stations ordered by great-circle distance
+    """
+    try:
+        stations = station_service.get_nearest_stations(latitude, longitude, k)
+        return jsonify({"items": stations, "count": len(stations)})
+    except ValueError as exc:
+        return handle_validation_error(exc)
+    except Exception:  # pragma: no cover - safety net
+        current_app.logger.exception("Failed to find nearest stations")
+        return jsonify({"error": "Internal server error"}), 500
+
+
+def _clusters_params():
+    zoom = validate_zoom(request.args.get("zoom"))
+    if zoom is None:
+        raise ValueError("zoom is required")
+    return {
+        "zoom": zoom,
+        "bbox": validate_bbox(request.args.get("bbox")),
+        "metric": validate_metric(request.args.get("metric")),
+        "start_date": validate_date(request.args.get("start_date"), "start_date"),
+        "end_date": validate_date(request.args.get("end_date"), "end_date"),
+    }
+
+
+@api_bp.route("/stations/clusters")
+@limiter.limit("120 per minute")
+@conditional_get("clusters", _clusters_params)
+def get_station_clusters(zoom, bbox, metric, start_date, end_date):
+    """
+    Retrieve station clusters for a map zoom level.
+    ---
+    parameters:
+      - in: query
+        name: zoom
+        type: integer
+        required: true
+      - in: query
+        name: bbox
+        type: string
+        description: Optional viewport as min_lon,min_lat,max_lon,max_lat.
+      - in: query
+        name: metric
+        type: string
+        description: Metric summarised per cluster (mean/min/max).
+      - in: query
+        name: start_date
+        type: string
+      - in: query
+        name: end_date
+        type: string
+    responses:
+      200:
+        description: Cluster centroids with station counts and metric summaries
+    """
+    try:
+        data = cache_service.get_or_compute(
+            "clusters",
+            lambda: cluster_service.get_station_clusters(
+                zoom=zoom,
+                bbox=bbox,
+                metric=metric,
+                start_date=start_date,
+                end_date=end_date,
+            ),
+            zoom=zoom,
+            bbox=bbox,
+            metric=metric,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return jsonify(data)
+    except ValueError as exc:
+        return handle_validation_error(exc)
+    except Exception:  # pragma: no cover - safety net
+        current_app.logger.exception("Failed to fetch station clusters")
+        return jsonify({"error": "Internal server error"}), 500
+
+
+def _station_params(station_id: int):
+    if station_id <= 0:
+        raise ValueError("Station ID must be a positive integer")
+    return {"station_id": station_id}
+
+
 @api_bp.route("/stations/<int:station_id>")
 @limiter.limit("120 per minute")
+@conditional_get("station", _station_params)
 def get_station(station_id: int):
     """
     Retrieve metadata for a specific station.
@@ -92,9 +335,11 @@ def get_station(station_id: int):
         description: Station not found
     """
     try:
-        if station_id <= 0:
-            raise ValueError("Station ID must be a positive integer")
-        station = station_service.get_station_by_id(station_id)
+        station = cache_service.get_or_compute(
+            "station",
+            lambda: station_service.get_station_by_id(station_id),
+            station_id=station_id,
+        )
         if station:
             return jsonify(station)
         return jsonify({"error": "Station not found"}), 404
@@ -105,9 +350,33 @@ def get_station(station_id: int):
         return jsonify({"error": "Internal server error"}), 500
 
 
+def _weather_params():
+    station_ids = validate_station_ids(request.args.get("station_ids"))
+    start_date = validate_date(request.args.get("start_date"), "start_date")
+    end_date = validate_date(request.args.get("end_date"), "end_date")
+    metrics = validate_metrics(request.args.get("metrics"))
+    page, page_size = validate_pagination(request.args.get("page"), request.args.get("page_size"))
+    cursor = validate_cursor(request.args.get("cursor"))
+    include_total = validate_flag(request.args.get("include_total"), "include_total")
+    return {
+        "station_ids": station_ids,
+        "start_date": start_date,
+        "end_date": end_date,
+        "metrics": sorted(metrics) if metrics else None,
+        # A cursor replaces the page number, and page-based requests always count.
+        "page": page if cursor is None else None,
+        "page_size": page_size,
+        "cursor": cursor,
+        "include_total": include_total if cursor else None,
+    }
+
+
 @api_bp.route("/weather")
 @limiter.limit("60 per minute")
-def get_weather():
+@conditional_get("weather", _weather_params)
+def get_weather(
+    station_ids, start_date, end_date, metrics, page, page_size, cursor, include_total
+):
     """
     Retrieve paginated weather observations.
     ---
@@ -136,26 +405,39 @@ def get_weather():
         name: page_size
         type: integer
         description: Items per page (max 2000).
+      - in: query
+        name: cursor
+        type: string
+        description: Opaque next_cursor from a previous page; seeks past it instead of using page.
+      - in: query
+        name: include_total
+        type: boolean
+        description: Count matching rows when paging by cursor (always counted for page-based requests).
     responses:
       200:
         description: Weather data payload
     """
     try:
-        station_ids = validate_station_ids(request.args.get("station_ids"))
-        start_date = validate_date(request.args.get("start_date"), "start_date")
-        end_date = validate_date(request.args.get("end_date"), "end_date")
-        metrics = validate_metrics(request.args.get("metrics"))
-        page, page_size = validate_pagination(
-            request.args.get("page"), request.args.get("page_size")
-        )
-
-        data = weather_service.get_weather_data(
+        data = cache_service.get_or_compute(
+            "weather",
+            lambda: weather_service.get_weather_data(
+                station_ids=station_ids,
+                start_date=start_date,
+                end_date=end_date,
+                metrics=metrics,
+                page=page or 1,
+                page_size=page_size,
+                cursor=cursor,
+                include_total=bool(include_total),
+            ),
             station_ids=station_ids,
             start_date=start_date,
             end_date=end_date,
             metrics=metrics,
             page=page,
             page_size=page_size,
+            cursor=cursor,
+            include_total=include_total,
         )
         return jsonify(data)
     except ValueError as exc:
@@ -165,9 +447,20 @@ def get_weather():
         return jsonify({"error": "Internal server error"}), 500
 
 
+def _heatmap_params():
+    return {
+        "metric": validate_metric(request.args.get("metric")),
+        "start_date": validate_date(request.args.get("start_date"), "start_date"),
+        "end_date": validate_date(request.args.get("end_date"), "end_date"),
+        "bbox": validate_bbox(request.args.get("bbox")),
+        "zoom": validate_zoom(request.args.get("zoom")),
+    }
+
+
 @api_bp.route("/weather/heatmap")
 @limiter.limit("60 per minute")
-def get_heatmap_data():
+@conditional_get("heatmap", _heatmap_params)
+def get_heatmap_data(metric, start_date, end_date, bbox, zoom):
     """
     Retrieve aggregated values suitable for map heatmaps.
     ---
@@ -182,18 +475,33 @@ def get_heatmap_data():
       - in: query
         name: end_date
         type: string
+      - in: query
+        name: bbox
+        type: string
+        description: Optional viewport as min_lon,min_lat,max_lon,max_lat.
+      - in: query
+        name: zoom
+        type: integer
+        description: Optional map zoom level; low zooms return an evenly spread subset.
     responses:
       200:
         description: Heatmap friendly dataset
     """
     try:
-        metric = request.args.get("metric", "temperature").lower()
-        if metric not in ["temperature", "rainfall", "humidity", "wind", "evapotranspiration"]:
-            raise ValueError(f"Invalid metric: {metric}")
-        start_date = validate_date(request.args.get("start_date"), "start_date")
-        end_date = validate_date(request.args.get("end_date"), "end_date")
-        data = weather_service.get_station_latest_values(
-            metric=metric, start_date=start_date, end_date=end_date
+        data = cache_service.get_or_compute(
+            "heatmap",
+            lambda: weather_service.get_station_latest_values(
+                metric=metric,
+                start_date=start_date,
+                end_date=end_date,
+                bbox=bbox,
+                zoom=zoom,
+            ),
+            metric=metric,
+            start_date=start_date,
+            end_date=end_date,
+            bbox=bbox,
+            zoom=zoom,
         )
         return jsonify(data)
     except ValueError as exc:
@@ -203,9 +511,243 @@ def get_heatmap_data():
         return jsonify({"error": "Internal server error"}), 500
 
 
+def _frames_params():
+    return {
+        "metric": validate_metric(request.args.get("metric")),
+        "start_date": validate_date(request.args.get("start_date"), "start_date"),
+        "end_date": validate_date(request.args.get("end_date"), "end_date"),
+        "step": validate_aggregation(request.args.get("step", "monthly")),
+        "delta": validate_flag(request.args.get("delta"), "delta"),
+        "compress": validate_flag(request.args.get("compress"), "compress", default=True),
+    }
+
+
+@api_bp.route("/weather/heatmap/frames")
+@limiter.limit("30 per minute")
+@conditional_get("frames", _frames_params)
+def get_heatmap_frames(metric, start_date, end_date, step, delta, compress):
+    """
+    Retrieve a heatmap animation as one binary station x period matrix.
+    ---
+    parameters:
+      - in: query
+        name: metric
+        type: string
+      - in: query
+        name: start_date
+        type: string
+      - in: query
+        name: end_date
+        type: string
+      - in: query
+        name: step
+        type: string
+        enum: [daily, weekly, monthly, yearly]
+        description: daily requires start_date and end_date; open ends default to the dataset's first or last date. At most 420 frames per request.
+      - in: query
+        name: delta
+        type: boolean
+        description: XOR-delta encode each frame against the previous one (default false).
+      - in: query
+        name: compress
+        type: boolean
+        description: zlib-compress the matrix (default true).
+    responses:
+      200:
+        description: Binary frames payload, see app/utils/frames.py for the layout
+    """
+    try:
+        payload = cache_service.get_or_compute(
+            "frames",
+            lambda: aggregation_service.get_heatmap_frames(
+                metric=metric,
+                start_date=start_date,
+                end_date=end_date,
+                step=step,
+                delta=delta,
+                compress=compress,
+            ),
+            metric=metric,
+            start_date=start_date,
+            end_date=end_date,
+            step=step,
+            delta=delta,
+            compress=compress,
+        )
+        return Response(payload, mimetype="application/octet-stream")
+    except ValueError as exc:
+        return handle_validation_error(exc)
+    except Exception:  # pragma: no cover - safety net
+        current_app.logger.exception("Failed to build heatmap frames")
+        return jsonify({"error": "Internal server error"}), 500
+
+
+def _tile_params(z: int, x: int, y: int):
+    validate_tile(z, x, y)
+    return {
+        "z": z,
+        "x": x,
+        "y": y,
+        "metric": validate_metric(request.args.get("metric")),
+        "start_date": validate_date(request.args.get("start_date"), "start_date"),
+        "end_date": validate_date(request.args.get("end_date"), "end_date"),
+        "method": validate_tile_method(request.args.get("method")),
+        "fmt": validate_tile_format(request.args.get("format")),
+    }
+
+
+@api_bp.route("/weather/heatmap/tiles/<int:z>/<int:x>/<int:y>")
+@limiter.limit("600 per minute")
+@conditional_get("tiles", _tile_params, max_age_route="heatmap")
+def get_heatmap_tile(z: int, x: int, y: int, metric, start_date, end_date, method, fmt):
+    """
+    Render one Web Mercator tile of the interpolated heatmap surface.
+    ---
+    parameters:
+      - in: path
+        name: z
+        type: integer
+        required: true
+      - in: path
+        name: x
+        type: integer
+        required: true
+      - in: path
+        name: y
+        type: integer
+        required: true
+      - in: query
+        name: metric
+        type: string
+      - in: query
+        name: start_date
+        type: string
+      - in: query
+        name: end_date
+        type: string
+      - in: query
+        name: method
+        type: string
+        description: Interpolation kernel, idw (default) or gaussian.
+      - in: query
+        name: format
+        type: string
+        description: png (default, coloured RGBA) or f16 (raw little-endian float16, NaN where empty).
+    responses:
+      200:
+        description: 256x256 tile; X-Value-Min/X-Value-Max give the colour scale bounds
+    """
+    try:
+        tile = tile_service.render_tile(
+            z,
+            x,
+            y,
+            metric=metric,
+            start_date=start_date,
+            end_date=end_date,
+            method=method,
+            fmt=fmt,
+        )
+        response = Response(tile.body, mimetype=tile.mimetype)
+        low, high = tile.value_range
+        if low is not None:
+            response.headers["X-Value-Min"] = f"{low:.2f}"
+            response.headers["X-Value-Max"] = f"{high:.2f}"
+        response.headers["Cache-Control"] = (
+            f"public, max-age={cache_service.get_route_timeout('heatmap')}"
+        )
+        return response
+    except ValueError as exc:
+        return handle_validation_error(exc)
+    except Exception:  # pragma: no cover - safety net
+        current_app.logger.exception("Failed to render heatmap tile")
+        return jsonify({"error": "Internal server error"}), 500
+
+
+def _point_params():
+    return {
+        **_nearest_params(),
+        "start_date": validate_date(request.args.get("start_date"), "start_date"),
+        "end_date": validate_date(request.args.get("end_date"), "end_date"),
+        "metrics": validate_metrics(request.args.get("metrics")),
+    }
+
+
+@api_bp.route("/weather/point")
+@limiter.limit("60 per minute")
+@conditional_get("point", _point_params)
+def get_point_estimate(latitude, longitude, k, start_date, end_date, metrics):
+    """
+    Estimate weather at a point by inverse-distance weighting of nearby stations.
+    ---
+    parameters:
+      - in: query
+        name: lat
+        type: number
+        required: true
+      - in: query
+        name: lon
+        type: number
+        required: true
+      - in: query
+        name: k
+        type: integer
+        description: Number of stations to weight (default 4, max 32).
+      - in: query
+        name: start_date
+        type: string
+      - in: query
+        name: end_date
+        type: string
+      - in: query
+        name: metrics
+        type: string
+        description: Comma-separated metric keys; defaults to all metrics.
+    responses:
+      200:
+        description: Interpolated values and the contributing stations
+    """
+    try:
+        data = cache_service.get_or_compute(
+            "point",
+            lambda: weather_service.interpolate_point(
+                latitude=latitude,
+                longitude=longitude,
+                k=k,
+                start_date=start_date,
+                end_date=end_date,
+                metrics=metrics,
+            ),
+            latitude=latitude,
+            longitude=longitude,
+            k=k,
+            start_date=start_date,
+            end_date=end_date,
+            metrics=metrics,
+        )
+        return jsonify(data)
+    except ValueError as exc:
+        return handle_validation_error(exc)
+    except Exception:  # pragma: no cover - safety net
+        current_app.logger.exception("Failed to interpolate point")
+        return jsonify({"error": "Internal server error"}), 500
+
+
+def _summary_params():
+    metrics = validate_metrics(request.args.get("metrics"))
+    return {
+        "station_ids": validate_station_ids(request.args.get("station_ids")),
+        "start_date": validate_date(request.args.get("start_date"), "start_date"),
+        "end_date": validate_date(request.args.get("end_date"), "end_date"),
+        "state": validate_state(request.args.get("state")),
+        "metrics": sorted(metrics) if metrics else None,
+    }
+
+
 @api_bp.route("/weather/summary")
 @limiter.limit("30 per minute")
-def get_weather_summary():
+@conditional_get("summary", _summary_params)
+def get_weather_summary(station_ids, start_date, end_date, state, metrics):
     """
     Provide aggregated statistics and highlights for the current filters.
     ---
@@ -230,13 +772,15 @@ def get_weather_summary():
         description: Weather summary payload
     """
     try:
-        station_ids = validate_station_ids(request.args.get("station_ids"))
-        start_date = validate_date(request.args.get("start_date"), "start_date")
-        end_date = validate_date(request.args.get("end_date"), "end_date")
-        state = validate_state(request.args.get("state"))
-        metrics = validate_metrics(request.args.get("metrics"))
-
-        summary = insights_service.get_weather_summary(
+        summary = cache_service.get_or_compute(
+            "summary",
+            lambda: insights_service.get_weather_summary(
+                station_ids=station_ids,
+                state=state,
+                start_date=start_date,
+                end_date=end_date,
+                metrics=metrics,
+            ),
             station_ids=station_ids,
             state=state,
             start_date=start_date,
@@ -250,9 +794,23 @@ def get_weather_summary():
         current_app.logger.exception("Failed to fetch weather summary")
         return jsonify({"error": "Internal server error"}), 500
 
+def _aggregate_params():
+    metrics = validate_metrics(request.args.get("metrics"))
+    return {
+        "station_ids": validate_station_ids(request.args.get("station_ids")),
+        "start_date": validate_date(request.args.get("start_date"), "start_date"),
+        "end_date": validate_date(request.args.get("end_date"), "end_date"),
+        "metrics": metrics,
+        # ``metric`` only applies to the single-metric response.
+        "metric": None if metrics else validate_metric(request.args.get("metric")),
+        "aggregation": validate_aggregation(request.args.get("aggregation", "monthly")),
+    }
+
+
 @api_bp.route("/weather/aggregate")
 @limiter.limit("60 per minute")
-def get_aggregate():
+@conditional_get("aggregate", _aggregate_params)
+def get_aggregate(station_ids, start_date, end_date, metrics, metric, aggregation):
     """
     Retrieve aggregated weather summaries.
     ---
@@ -269,6 +827,12 @@ def get_aggregate():
       - in: query
         name: metric
         type: string
+      - in: query
+        name: metrics
+        type: string
+        description: >
+          Comma-separated metrics aggregated in one pass; the response is then
+          columnar (row index lists plus avg/min/max/count/null_count per metric).
       - in: query
         name: aggregation
         type: string
@@ -278,15 +842,32 @@ def get_aggregate():
         description: Aggregated dataset
     """
     try:
-        station_ids = validate_station_ids(request.args.get("station_ids"))
-        start_date = validate_date(request.args.get("start_date"), "start_date")
-        end_date = validate_date(request.args.get("end_date"), "end_date")
-        metric = request.args.get("metric", "temperature").lower()
-        if metric not in ["temperature", "rainfall", "humidity", "wind", "evapotranspiration"]:
-            raise ValueError(f"Invalid metric: {metric}")
-        aggregation = validate_aggregation(request.args.get("aggregation", "monthly"))
-
-        data = aggregation_service.get_aggregated_data(
+        if metrics:
+            columnar = cache_service.get_or_compute(
+                "aggregate",
+                lambda: aggregation_service.get_aggregated_metrics(
+                    station_ids=station_ids,
+                    start_date=start_date,
+                    end_date=end_date,
+                    metrics=metrics,
+                    aggregation=aggregation,
+                ),
+                station_ids=station_ids,
+                start_date=start_date,
+                end_date=end_date,
+                metrics=metrics,
+                aggregation=aggregation,
+            )
+            return jsonify(columnar)
+        data = cache_service.get_or_compute(
+            "aggregate",
+            lambda: aggregation_service.get_aggregated_data(
+                station_ids=station_ids,
+                start_date=start_date,
+                end_date=end_date,
+                metric=metric,
+                aggregation=aggregation,
+            ),
             station_ids=station_ids,
             start_date=start_date,
             end_date=end_date,
@@ -301,11 +882,22 @@ def get_aggregate():
         return jsonify({"error": "Internal server error"}), 500
 
 
+def _export_params():
+    return {
+        "station_ids": validate_station_ids(request.args.get("station_ids")),
+        "start_date": validate_date(request.args.get("start_date"), "start_date"),
+        "end_date": validate_date(request.args.get("end_date"), "end_date"),
+        "metrics": validate_metrics(request.args.get("metrics")),
+    }
+
+
 @api_bp.route("/weather/export")
 @limiter.limit("10 per minute")
-def export_weather():
+@conditional_get("export", _export_params)
+def export_weather(station_ids, start_date, end_date, metrics):
     """
     Export weather data to CSV.
+    The file is streamed in chunks, so exports are not capped by row count.
     ---
     parameters:
       - in: query
@@ -327,23 +919,21 @@ def export_weather():
         description: No data found
     """
     try:
-        station_ids = validate_station_ids(request.args.get("station_ids"))
-        start_date = validate_date(request.args.get("start_date"), "start_date")
-        end_date = validate_date(request.args.get("end_date"), "end_date")
-        metrics = validate_metrics(request.args.get("metrics"))
-
-        csv_content = export_service.export_weather_csv(
+        chunks = export_service.stream_weather_csv(
             station_ids=station_ids,
             start_date=start_date,
             end_date=end_date,
             metrics=metrics,
         )
+        first_chunk = next(chunks, None)
 
-        if not csv_content:
+        if first_chunk is None:
             return jsonify({"error": "No data found for the given filters"}), 404
 
-        response = make_response(csv_content)
-        response.headers["Content-Type"] = "text/csv"
+        response = Response(
+            stream_with_context(chain([first_chunk], chunks)),
+            mimetype="text/csv",
+        )
         response.headers["Content-Disposition"] = (
             "attachment; filename=weather_data.csv"
         )
@@ -356,9 +946,30 @@ def export_weather():
         return jsonify({"error": "Internal server error"}), 500
 
 
+def _statistics_loads_rows() -> bool:
+    """Exact and Spearman statistics load every row, so they keep a tighter limit."""
+    exact = request.args.get("exact", "").lower() in ("1", "true", "yes")
+    return exact or request.args.get("correlation_method", "").lower() == "spearman"
+
+
+def _statistics_params():
+    return {
+        "station_ids": validate_station_ids(request.args.get("station_ids")),
+        "start_date": validate_date(request.args.get("start_date"), "start_date"),
+        "end_date": validate_date(request.args.get("end_date"), "end_date"),
+        "state": validate_state(request.args.get("state")),
+        "correlation_method": validate_correlation_method(
+            request.args.get("correlation_method")
+        ),
+        "exact": validate_flag(request.args.get("exact"), "exact"),
+    }
+
+
 @api_bp.route("/statistics")
-@limiter.limit("20 per minute")
-def get_statistics():
+@limiter.limit("60 per minute")
+@limiter.limit("20 per minute", exempt_when=lambda: not _statistics_loads_rows())
+@conditional_get("statistics", _statistics_params)
+def get_statistics(station_ids, start_date, end_date, state, correlation_method, exact):
     """
     Retrieve statistical insights for selected filters.
     ---
@@ -375,21 +986,36 @@ def get_statistics():
       - in: query
         name: state
         type: string
+      - in: query
+        name: correlation_method
+        type: string
+        enum: [pearson, spearman]
+        description: Coefficient used for the pairwise-complete correlation matrix.
+      - in: query
+        name: exact
+        type: boolean
+        description: Load rows for exact medians instead of aggregating in the database.
     responses:
       200:
         description: Statistical summary
     """
     try:
-        station_ids = validate_station_ids(request.args.get("station_ids"))
-        start_date = validate_date(request.args.get("start_date"), "start_date")
-        end_date = validate_date(request.args.get("end_date"), "end_date")
-        state = validate_state(request.args.get("state"))
-
-        stats = statistics_service.calculate_statistics(
+        stats = cache_service.get_or_compute(
+            "statistics",
+            lambda: statistics_service.calculate_statistics(
+                station_ids=station_ids,
+                start_date=start_date,
+                end_date=end_date,
+                state=state,
+                correlation_method=correlation_method,
+                exact=exact,
+            ),
             station_ids=station_ids,
             start_date=start_date,
             end_date=end_date,
             state=state,
+            correlation_method=correlation_method,
+            exact=exact,
         )
         return jsonify(stats)
 
@@ -398,3 +1024,89 @@ def get_statistics():
     except Exception:  # pragma: no cover - safety net
         current_app.logger.exception("Failed to calculate statistics")
         return jsonify({"error": "Internal server error"}), 500
+
+
+
+def _dashboard_params():
+    metrics = validate_metrics(request.args.get("metrics"))
+    return {
+        "sections": validate_sections(request.args.get("sections")),
+        "station_ids": validate_station_ids(request.args.get("station_ids")),
+        "state": validate_state(request.args.get("state")),
+        "start_date": validate_date(request.args.get("start_date"), "start_date"),
+        "end_date": validate_date(request.args.get("end_date"), "end_date"),
+        "metric": validate_metric(request.args.get("metric")),
+        "metrics": sorted(metrics) if metrics else None,
+        "aggregation": validate_aggregation(request.args.get("aggregation", "monthly")),
+        "bbox": validate_bbox(request.args.get("bbox")),
+        "zoom": validate_zoom(request.args.get("zoom")),
+    }
+
+
+@api_bp.route("/dashboard")
+@limiter.limit("60 per minute")
+@conditional_get("dashboard", _dashboard_params)
+def get_dashboard(**filters):
+    """
+    Retrieve every dashboard panel for one filter set in a single request.
+    ---
+    parameters:
+      - in: query
+        name: sections
+        type: string
+        description: Comma-separated subset of heatmap, aggregate, summary, statistics (default all).
+      - in: query
+        name: station_ids
+        type: string
+      - in: query
+        name: state
+        type: string
+      - in: query
+        name: start_date
+        type: string
+      - in: query
+        name: end_date
+        type: string
+      - in: query
+        name: metric
+        type: string
+        description: Metric for the heatmap and aggregate sections.
+      - in: query
+        name: metrics
+        type: string
+        description: Metrics for the summary section.
+      - in: query
+        name: aggregation
+        type: string
+        enum: [daily, weekly, monthly, yearly]
+      - in: query
+        name: bbox
+        type: string
+      - in: query
+        name: zoom
+        type: integer
+    responses:
+      200:
+        description: One key per requested section, each shaped like its standalone endpoint
+    """
+    try:
+        data = dashboard_service.get_dashboard(**filters)
+        return jsonify(data)
+    except ValueError as exc:
+        return handle_validation_error(exc)
+    except Exception:  # pragma: no cover - safety net
+        current_app.logger.exception("Failed to build dashboard")
+        return jsonify({"error": "Internal server error"}), 500
+
+
+@api_bp.route("/cache/stats")
+@limiter.limit("60 per minute")
+def get_cache_stats():
+    """
+    Report response cache hit/miss counters for this worker process.
+    ---
+    responses:
+      200:
+        description: Cache counters per route
+    """
+    return jsonify(cache_service.get_stats())
@@ -1,15 +1,24 @@
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
 
 from app.models import WeatherData
-from app.repositories import WeatherRepository
+from app.repositories import RollupRepository, WeatherRepository
 from app.services.database_service import get_db_session
+from app.services.station_catalog import get_catalog
 from app.utils.date_utils import parse_iso_date
+from app.utils.frames import encode_frames
 from app.utils.logging import get_logger
+from app.utils.periods import period_count
 
 logger = get_logger(__name__)
 
+# Upper bound on animation frames per request (eight years of weeks, so the
+# whole dataset fits in one weekly animation).
+MAX_HEATMAP_FRAMES = 420
+
 _metric_map: Dict[str, WeatherData] = {
     "temperature": WeatherData.temp_max_c,
     "rainfall": WeatherData.rainfall_mm,
@@ -27,12 +36,183 @@ def get_aggregated_data(
     metric: str = "temperature",
     aggregation: str = "monthly",
 ) -> List[Dict[str, object]]:
+    rows = _fetch_aggregations(
+        station_ids=station_ids,
+        start_date=start_date,
+        end_date=end_date,
+        metric=metric,
+        aggregation=aggregation,
+    )
+
+    results: List[Dict[str, object]] = []
+    for station_id, station_name, period, avg_value, min_value, max_value in rows:
+        results.append(
+            {
+                "station_id": station_id,
+                "station_name": station_name,
+                "period": period,
+                "avg_value": round(avg_value, 2) if avg_value is not None else None,
+                "min_value": round(min_value, 2) if min_value is not None else None,
+                "max_value": round(max_value, 2) if max_value is not None else None,
+            }
+        )
+    return results
+
+
+def get_aggregated_metrics(
+    *,
+    station_ids: Optional[Iterable[int]] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    metrics: Sequence[str] = ("temperature",),
+    aggregation: str = "monthly",
+) -> Dict[str, object]:
+    """Aggregate several metrics in one grouped pass, as a columnar payload.
+
+    ``station_id``/``station_name``/``period`` are the row index; every metric
+    carries ``avg``/``min``/``max``/``count``/``null_count`` lists aligned with it.
+    """
+    start = parse_iso_date(start_date)
+    end = parse_iso_date(end_date)
+    columns = {metric: _metric_map.get(metric, WeatherData.temp_max_c).key for metric in metrics}
+    unique_columns = list(dict.fromkeys(columns.values()))
+
+    with get_db_session() as session:
+        rollups = RollupRepository(session)
+        use_rollups = aggregation != "daily" and rollups.is_ready()
+        repository = rollups if use_rollups else WeatherRepository(session)
+        totals = repository.fetch_period_totals(
+            columns=unique_columns,
+            aggregation=aggregation,
+            station_ids=station_ids,
+            start_date=start,
+            end_date=end,
+        )
+
+    logger.debug(
+        "Fetched multi-metric aggregates",
+        extra={
+            "aggregation": aggregation,
+            "metrics": list(columns),
+            "count": len(totals),
+            "rollups": use_rollups,
+        },
+    )
+
+    keys = sorted(totals, key=lambda key: (key[1], key[0]))
+    catalog = get_catalog()
+    payload: Dict[str, object] = {
+        "aggregation": aggregation,
+        "count": len(keys),
+        "station_id": [station_id for station_id, _ in keys],
+        "station_name": [
+            station.station_name if station else None
+            for station in (catalog.get(station_id) for station_id, _ in keys)
+        ],
+        "period": [period for _, period in keys],
+        "metrics": {},
+    }
+    for metric, column in columns.items():
+        entries = [totals[key] for key in keys]
+        counts = [entry[f"{column}_count"] or 0 for entry in entries]
+        payload["metrics"][metric] = {
+            "column": column,
+            "avg": [
+                round(entry[f"{column}_sum"] / count, 2) if count else None
+                for entry, count in zip(entries, counts)
+            ],
+            "min": [_round(entry[f"{column}_min"]) for entry in entries],
+            "max": [_round(entry[f"{column}_max"]) for entry in entries],
+            "count": counts,
+            "null_count": [entry["row_count"] - count for entry, count in zip(entries, counts)],
+        }
+    return payload
+
+
+def get_heatmap_frames(
+    *,
+    metric: str = "temperature",
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    step: str = "monthly",
+    delta: bool = False,
+    compress: bool = True,
+) -> bytes:
+    """Every station's ``step`` means as one ``periods x stations`` float32 payload.
+
+    The matrix comes from the same rollup-backed query as ``/weather/aggregate``
+    and is packed with :func:`app.utils.frames.encode_frames`. The frame count
+    is bounded from the requested range, with open ends taken from the
+    dataset's own date bounds, before anything is aggregated.
+    """
+    if step == "daily" and not (start_date and end_date):
+        raise ValueError("step=daily requires start_date and end_date")
+    start = parse_iso_date(start_date)
+    end = parse_iso_date(end_date)
+    if start is None or end is None:
+        with get_db_session() as session:
+            earliest, latest = WeatherRepository(session).fetch_date_bounds()
+        start = start or earliest
+        end = end or latest
+    frames = period_count(step, start, end) if start and end else 0
+    if frames > MAX_HEATMAP_FRAMES:
+        raise ValueError(
+            f"Range spans {frames} {step} frames; the maximum is {MAX_HEATMAP_FRAMES}."
+        )
+
+    rows = _fetch_aggregations(
+        start_date=start_date,
+        end_date=end_date,
+        metric=metric,
+        aggregation=step,
+    )
+
+    periods, period_index = np.unique(
+        np.array([row[2] for row in rows], dtype=object), return_inverse=True
+    )
+    stations, station_index = np.unique(
+        np.array([row[0] for row in rows], dtype=np.int64), return_inverse=True
+    )
+
+    matrix = np.full((len(periods), len(stations)), np.nan, dtype=np.float32)
+    matrix[period_index, station_index] = np.array([row[3] for row in rows], dtype=np.float64)
+
+    catalog = get_catalog()
+    station_index_entries = []
+    for station_id in stations.tolist():
+        record = catalog.get(station_id)
+        station_index_entries.append(
+            [station_id, record.latitude, record.longitude] if record else [station_id, None, None]
+        )
+    header = {
+        "metric": metric,
+        "step": step,
+        "periods": [str(period) for period in periods],
+        "stations": station_index_entries,
+    }
+    return encode_frames(matrix, header, delta=delta, compress=compress)
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 2) if value is not None else None
+
+
+def _fetch_aggregations(
+    *,
+    station_ids: Optional[Iterable[int]] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    metric: str,
+    aggregation: str,
+) -> List:
     start = parse_iso_date(start_date)
     end = parse_iso_date(end_date)
     metric_column = _metric_map.get(metric, WeatherData.temp_max_c)
 
     with get_db_session() as session:
-        repository = WeatherRepository(session)
+        rollups = RollupRepository(session)
+        use_rollups = aggregation != "daily" and rollups.is_ready()
+        repository = rollups if use_rollups else WeatherRepository(session)
         rows = repository.fetch_aggregations(
             metric=metric_column,
             aggregation=aggregation,
@@ -43,19 +223,11 @@ def get_aggregated_data(
 
     logger.debug(
         "Fetched aggregated data",
-        extra={"aggregation": aggregation, "metric": metric, "count": len(rows)},
+        extra={
+            "aggregation": aggregation,
+            "metric": metric,
+            "count": len(rows),
+            "rollups": use_rollups,
+        },
     )
-
-    results: List[Dict[str, object]] = []
-    for station_id, station_name, period, avg_value, min_value, max_value in rows:
-        results.append(
-            {
-                "station_id": station_id,
-                "station_name": station_name,
-                "period": period,
-                "avg_value": round(avg_value, 2) if avg_value is not None else None,
-                "min_value": round(min_value, 2) if min_value is not None else None,
-                "max_value": round(max_value, 2) if max_value is not None else None,
-            }
-        )
-    return results
+    return rows
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from datetime import date
+from typing import Callable, Dict, Iterator, Optional, TypeVar
+
+from flask import current_app
+
+from app import cache
+from app.utils.logging import get_logger
+from app.utils.private_files import ensure_private_directory
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms skip the cross-worker lease
+    fcntl = None
+
+logger = get_logger(__name__)
+
+KEY_PREFIX = "api"
+# Backends whose entries other gunicorn workers cannot see; waiting on them gains nothing.
+_PROCESS_LOCAL_CACHES = {"SimpleCache", "NullCache", "simple", "null"}
+# Enumerated parameters whose values name a fixed option regardless of case.
+CASE_INSENSITIVE_PARAMS = frozenset(
+    {"aggregation", "correlation_method", "metric", "metrics", "state", "step"}
+)
+# Parameters holding a set of integer IDs, so order and repeats do not matter.
+ID_SET_PARAMS = frozenset({"station_ids"})
+
+T = TypeVar("T")
+
+_stats_lock = threading.Lock()
+_stats: Dict[str, Dict[str, int]] = {}
+
+_inflight_lock = threading.Lock()
+_inflight: Dict[str, Future] = {}
+
+
+def build_cache_key(route: str, **params) -> str:
+    """Build a cache key from validated request parameters.
+
+    Parameters are normalised so equivalent requests share an entry: enumerated
+    values (``CASE_INSENSITIVE_PARAMS``) are lower-cased, ``station_ids`` are sorted
+    and de-duplicated and ``None`` values are dropped. Anything else, such as a
+    decoded cursor, is kept as given.
+    """
+    normalised = {
+        name: _normalise(name, value) for name, value in params.items() if value is not None
+    }
+    encoded = json.dumps(normalised, sort_keys=True, separators=(",", ":"))
+    digest = hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+    return f"{KEY_PREFIX}:{route}:{digest}"
+
+
+def get_or_compute(route: str, compute: Callable[[], T], **params) -> T:
+    """Return the cached payload for ``route`` or compute and store it.
+
+    Routes listed in ``CACHE_COALESCE_ROUTES`` are single-flight: concurrent
+    misses for the same key wait for one computation instead of each running it.
+    """
+    key = build_cache_key(route, **params)
+    payload = cache.get(key)
+    if payload is not None:
+        _record(route, hit=True)
+        return payload
+
+    if route in current_app.config.get("CACHE_COALESCE_ROUTES", ()):
+        return _compute_once(route, key, compute)
+
+    _record(route, hit=False)
+    return _compute_and_store(route, key, compute)
+
+
+def _compute_and_store(route: str, key: str, compute: Callable[[], T]) -> T:
+    payload = compute()
+    if payload is not None:
+        cache.set(key, payload, timeout=get_route_timeout(route))
+    return payload
+
+
+def _compute_once(route: str, key: str, compute: Callable[[], T]) -> T:
+    """Run ``compute`` once per key at a time, in this worker and across workers.
+
+    The first caller becomes the leader; later callers in this process wait on
+    its future and count as hits. The leader also takes a file lease so leaders
+    in other workers wait too, then re-check the shared cache before computing.
+    """
+    with _inflight_lock:
+        future = _inflight.get(key)
+        leader = future is None
+        if leader:
+            future = _inflight[key] = Future()
+
+    if not leader:
+        _record(route, hit=True)
+        return future.result()
+
+    try:
+        with _worker_lease(key):
+            payload = cache.get(key)
+            if payload is not None:
+                _record(route, hit=True)
+            else:
+                _record(route, hit=False)
+                payload = _compute_and_store(route, key, compute)
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    else:
+        future.set_result(payload)
+        return payload
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+
+def is_shared_backend(cache_type: str) -> bool:
+    """Whether ``CACHE_TYPE`` keeps entries outside this process, visible to other workers."""
+    return cache_type not in _PROCESS_LOCAL_CACHES
+
+
+@contextmanager
+def _worker_lease(key: str) -> Iterator[None]:
+    """Hold an exclusive ``flock`` on the key's own lock file, shared by all workers on the host.
+
+    Only requests for the same key wait on each other. The holder unlinks the
+    file before unlocking, so the directory holds one file per in-flight key.
+    Gives up after ``CACHE_COALESCE_TIMEOUT`` seconds and computes anyway, so a
+    stuck worker can delay requests but never block them outright.
+    """
+    config = current_app.config
+    if fcntl is None or not is_shared_backend(config.get("CACHE_TYPE", "SimpleCache")):
+        yield
+        return
+
+    directory = ensure_private_directory(config.get("CACHE_LOCK_DIR"))
+    path = os.path.join(directory, f"{key.replace(':', '-')}.lock")
+    deadline = time.monotonic() + config.get("CACHE_COALESCE_TIMEOUT", 60)
+
+    handle = _lock_file(path, deadline)
+    if handle is None:
+        logger.warning("Timed out waiting for cache lease", extra={"key": key})
+    try:
+        yield
+    finally:
+        if handle is not None:
+            os.unlink(path)
+            fcntl.flock(handle, fcntl.LOCK_UN)
+            handle.close()
+
+
+def _lock_file(path: str, deadline: float):
+    """Open and ``flock`` ``path``, or return ``None`` once ``deadline`` passes.
+
+    A previous holder may unlink the file between our open and our lock; the
+    inode check retries on the fresh file instead of locking the orphaned one.
+    """
+    while True:
+        handle = open(path, "a")
+        while True:
+            try:
+                fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    handle.close()
+                    return None
+                time.sleep(0.05)
+        try:
+            if os.stat(path).st_ino == os.fstat(handle.fileno()).st_ino:
+                return handle
+        except FileNotFoundError:
+            pass
+        handle.close()
+
+
+def get_route_timeout(route: str) -> int:
+    timeouts = current_app.config.get("CACHE_ROUTE_TIMEOUTS", {})
+    return int(timeouts.get(route, current_app.config.get("CACHE_DEFAULT_TIMEOUT", 300)))
+
+
+def invalidate_all() -> None:
+    """Drop every cached response, e.g. after the dataset has been reloaded."""
+    cache.clear()
+    logger.info("Response cache invalidated")
+
+
+def get_stats() -> Dict[str, object]:
+    """Return per-route hit/miss counters for the current process.
+
+    Backends that track their size (``SQLiteCache``) add a host-wide ``storage`` entry.
+    """
+    with _stats_lock:
+        routes = {route: dict(counters) for route, counters in _stats.items()}
+
+    hits = sum(counters["hits"] for counters in routes.values())
+    misses = sum(counters["misses"] for counters in routes.values())
+    stats: Dict[str, object] = {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": _hit_rate(hits, misses),
+        "routes": {
+            route: {**counters, "hit_rate": _hit_rate(counters["hits"], counters["misses"])}
+            for route, counters in sorted(routes.items())
+        },
+    }
+    usage = getattr(cache.cache, "usage", None)
+    storage = usage() if callable(usage) else None
+    if storage is not None:
+        stats["storage"] = storage
+    return stats
+
+
+def reset_stats() -> None:
+    with _stats_lock:
+        _stats.clear()
+
+
+def _record(route: str, *, hit: bool) -> None:
+    with _stats_lock:
+        counters = _stats.setdefault(route, {"hits": 0, "misses": 0})
+        counters["hits" if hit else "misses"] += 1
+
+
+def _hit_rate(hits: int, misses: int) -> Optional[float]:
+    total = hits + misses
+    return round(hits / total, 4) if total else None
+
+
+def _normalise(name: str, value):
+    if name in ID_SET_PARAMS:
+        return sorted(set(value))
+    if name in CASE_INSENSITIVE_PARAMS:
+        return value.lower() if isinstance(value, str) else [item.lower() for item in value]
+    return _encode(value)
+
+
+def _encode(value):
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, (list, tuple)):
+        # Positional values (bounding boxes, cursors) keep their order and duplicates.
+        return [_encode(item) for item in value]
+    return value
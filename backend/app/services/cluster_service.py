@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from typing import Dict, Optional
+
+import numpy as np
+
+from app.services.station_catalog import get_catalog
+from app.services.weather_service import get_station_latest_values
+from app.utils.geo import BoundingBox
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def get_station_clusters(
+    *,
+    zoom: int,
+    bbox: Optional[BoundingBox] = None,
+    metric: str = "temperature",
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+) -> Dict[str, object]:
+    """Precomputed catalog clusters for ``zoom`` with mean/min/max of the heatmap metric.
+
+    Only clusters whose centroid lies inside ``bbox`` are returned, so the
+    payload grows with the clusters on screen rather than the station count.
+    """
+    catalog = get_catalog()
+    level = catalog.cluster_level(zoom)
+    records = catalog.stations()
+
+    by_station = {
+        row["station_id"]: row["value"]
+        for row in get_station_latest_values(metric=metric, start_date=start_date, end_date=end_date)
+    }
+    values = np.array([by_station.get(record.id) for record in records], dtype=np.float64)
+    present = ~np.isnan(values)
+    labels = level.labels[present]
+    values = values[present]
+
+    clusters = len(level.counts)
+    measured = np.bincount(labels, minlength=clusters)
+    sums = np.bincount(labels, values, minlength=clusters)
+    minimums = np.full(clusters, np.inf)
+    maximums = np.full(clusters, -np.inf)
+    np.minimum.at(minimums, labels, values)
+    np.maximum.at(maximums, labels, values)
+
+    visible = np.ones(clusters, dtype=bool)
+    if bbox is not None:
+        visible = (
+            (level.latitudes >= bbox.min_lat)
+            & (level.latitudes <= bbox.max_lat)
+            & (level.longitudes >= bbox.min_lon)
+            & (level.longitudes <= bbox.max_lon)
+        )
+
+    items = []
+    for index in np.flatnonzero(visible).tolist():
+        count = int(level.counts[index])
+        expansion = int(level.expansion_zooms[index])
+        items.append({
+            "latitude": round(float(level.latitudes[index]), 5),
+            "longitude": round(float(level.longitudes[index]), 5),
+            "count": count,
+            "station_id": records[level.first[index]].id if count == 1 else None,
+            "expansion_zoom": expansion if expansion >= 0 else None,
+            "value": {
+                "mean": round(float(sums[index] / measured[index]), 2),
+                "min": round(float(minimums[index]), 2),
+                "max": round(float(maximums[index]), 2),
+            } if measured[index] else None,
+        })
+
+    logger.debug("Built station clusters", extra={"zoom": zoom, "clusters": len(items)})
+    return {"zoom": zoom, "metric": metric, "count": len(items), "items": items}
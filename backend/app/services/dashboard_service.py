@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Callable, Dict, Optional, Sequence
+
+from flask import current_app
+
+from app.services import (
+    aggregation_service,
+    cache_service,
+    database_service,
+    insights_service,
+    statistics_service,
+    weather_service,
+)
+from app.utils.geo import BoundingBox
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+DASHBOARD_SECTIONS = ("heatmap", "aggregate", "summary", "statistics")
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_dashboard(
+    *,
+    sections: Sequence[str] = DASHBOARD_SECTIONS,
+    station_ids: Optional[Sequence[int]] = None,
+    state: Optional[str] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    metric: str = "temperature",
+    metrics: Optional[Sequence[str]] = None,
+    aggregation: str = "monthly",
+    bbox: Optional[BoundingBox] = None,
+    zoom: Optional[int] = None,
+) -> Dict[str, object]:
+    """Run the dashboard's queries concurrently for one shared filter set.
+
+    Each section goes through the response cache under the same route and key
+    as its standalone endpoint, so the batch and the individual endpoints warm
+    each other. The aggregate chart needs a station selection and is ``None``
+    without one. Sections run on a bounded pool, each with its own session.
+    """
+    # /weather/summary sorts its metrics; match it so both share one cache entry.
+    summary_metrics = sorted(metrics) if metrics else None
+    tasks: Dict[str, Callable[[], object]] = {
+        "heatmap": lambda: cache_service.get_or_compute(
+            "heatmap",
+            lambda: weather_service.get_station_latest_values(
+                metric=metric, start_date=start_date, end_date=end_date, bbox=bbox, zoom=zoom
+            ),
+            metric=metric,
+            start_date=start_date,
+            end_date=end_date,
+            bbox=bbox,
+            zoom=zoom,
+        ),
+        "aggregate": lambda: cache_service.get_or_compute(
+            "aggregate",
+            lambda: aggregation_service.get_aggregated_data(
+                station_ids=station_ids,
+                start_date=start_date,
+                end_date=end_date,
+                metric=metric,
+                aggregation=aggregation,
+            ),
+            station_ids=station_ids,
+            start_date=start_date,
+            end_date=end_date,
+            metric=metric,
+            aggregation=aggregation,
+        ) if station_ids else None,
+        "summary": lambda: cache_service.get_or_compute(
+            "summary",
+            lambda: insights_service.get_weather_summary(
+                station_ids=station_ids,
+                state=state,
+                start_date=start_date,
+                end_date=end_date,
+                metrics=summary_metrics,
+            ),
+            station_ids=station_ids,
+            state=state,
+            start_date=start_date,
+            end_date=end_date,
+            metrics=summary_metrics,
+        ),
+        "statistics": lambda: cache_service.get_or_compute(
+            "statistics",
+            lambda: statistics_service.calculate_statistics(
+                station_ids=station_ids,
+                start_date=start_date,
+                end_date=end_date,
+                state=state,
+                correlation_method="pearson",
+                exact=False,
+            ),
+            station_ids=station_ids,
+            start_date=start_date,
+            end_date=end_date,
+            state=state,
+            correlation_method="pearson",
+            exact=False,
+        ),
+    }
+
+    app = current_app._get_current_object()
+    executor = _get_executor(app.config.get("DASHBOARD_MAX_WORKERS", 4))
+    futures = {
+        name: executor.submit(_run_in_app_context, app, tasks[name]) for name in sections
+    }
+    # result() re-raises the first failing section's exception in this thread.
+    results = {name: future.result() for name, future in futures.items()}
+
+    logger.debug("Built dashboard", extra={"sections": list(sections)})
+    return results
+
+
+def _run_in_app_context(app, task: Callable[[], object]):
+    with app.app_context():
+        try:
+            return task()
+        finally:
+            # Worker threads are reused; drop their thread-local session.
+            database_service.SessionLocal.remove()
+
+
+def _get_executor(max_workers: int) -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="dashboard"
+                )
+    return _executor
@@ -4,16 +4,75 @@ import os
 from contextlib import contextmanager
 from typing import Generator
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import scoped_session, sessionmaker
 
+from config import Config, config_by_name
+
 DB_PATH = os.getenv("DATABASE_URL", "sqlite:///bom_data.db")
 
-engine = create_engine(
-    DB_PATH,
-    pool_pre_ping=True,
-    pool_recycle=3600,
-    future=True,
+
+def create_database_engine(database_url: str, settings=Config) -> Engine:
+    """Create the API engine: pooled for server databases, SQLite gets the serving profile."""
+    url = make_url(database_url)
+    if url.get_backend_name() != "sqlite":
+        return create_engine(
+            url,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_pre_ping=True,
+            pool_recycle=3600,
+            future=True,
+        )
+
+    in_memory = url.database in (None, "", ":memory:")
+    if settings.SQLITE_IMMUTABLE and not in_memory:
+        # The OS page cache is shared by every worker and no locks are taken.
+        url = url.set(
+            database=f"file:{url.database}",
+            query={**url.query, "mode": "ro", "immutable": "1", "uri": "true"},
+        )
+
+    engine = create_engine(url, pool_pre_ping=True, pool_recycle=3600, future=True)
+    pragmas = _sqlite_pragmas(settings, in_memory=in_memory)
+
+    @event.listens_for(engine, "connect")
+    def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+    return engine
+
+
+def _sqlite_pragmas(settings, *, in_memory: bool):
+    pragmas = []
+    # journal_mode is persistent and needs write access, so read-only profiles skip it.
+    if (
+        settings.SQLITE_JOURNAL_MODE
+        and not in_memory
+        and not settings.SQLITE_IMMUTABLE
+        and not settings.SQLITE_QUERY_ONLY
+    ):
+        pragmas.append(f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}")
+    if settings.SQLITE_MMAP_SIZE and not in_memory:
+        pragmas.append(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+    if settings.SQLITE_CACHE_SIZE_KIB:
+        pragmas.append(f"PRAGMA cache_size=-{int(settings.SQLITE_CACHE_SIZE_KIB)}")
+    if settings.SQLITE_TEMP_STORE:
+        pragmas.append(f"PRAGMA temp_store={settings.SQLITE_TEMP_STORE}")
+    if settings.SQLITE_QUERY_ONLY:
+        pragmas.append("PRAGMA query_only=1")
+    return pragmas
+
+
+engine = create_database_engine(
+    DB_PATH, config_by_name.get(os.getenv("FLASK_CONFIG", "development"), Config)
 )
 SessionLocal = scoped_session(
     sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
@@ -37,4 +96,4 @@ def get_session():
     return SessionLocal()
 
 
-__all__ = ["engine", "get_db_session", "get_session"]
+__all__ = ["create_database_engine", "engine", "get_db_session", "get_session"]
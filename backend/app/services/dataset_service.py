@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Mapping, Optional
+
+from flask import current_app
+
+from app.repositories import DatasetMetaRepository
+from app.services import cache_service, station_catalog
+from app.services.database_service import get_db_session
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+DATASET_VERSION_META_KEY = "dataset_version"
+
+_version_lock = threading.Lock()
+_version: Optional[str] = None
+_checked_at: Optional[float] = None
+
+
+def bump_dataset_version(session) -> str:
+    """Record that the dataset changed; running workers pick the new token up on their next check."""
+    version = f"{datetime.now(timezone.utc):%Y%m%d%H%M%S}-{uuid.uuid4().hex[:8]}"
+    DatasetMetaRepository(session).set(DATASET_VERSION_META_KEY, version)
+    return version
+
+
+def ensure_dataset_version(session) -> str:
+    """Return the recorded dataset version, recording one for databases loaded before versioning."""
+    version = DatasetMetaRepository(session).get(DATASET_VERSION_META_KEY)
+    return version or bump_dataset_version(session)
+
+
+def get_dataset_version() -> Optional[str]:
+    """Return the dataset version this process last observed."""
+    return _version
+
+
+def build_etag(route: str, params: Mapping[str, object]) -> Optional[str]:
+    """Strong validator for a read response: the dataset version plus the normalised query.
+
+    ``None`` until a dataset version has been recorded.
+    """
+    version = _version
+    if version is None:
+        return None
+    key = cache_service.build_cache_key(route, **params)
+    return hashlib.sha1(f"{version}:{key}".encode("utf-8")).hexdigest()
+
+
+def sync_dataset_version(force: bool = False) -> Optional[str]:
+    """Re-read the dataset version at most every ``DATASET_VERSION_CHECK_SECONDS``.
+
+    When another process (``init_db.py``) has changed the dataset, the station
+    catalog is reloaded and cached responses are dropped so this worker stops
+    serving data from before the ingest.
+    """
+    global _version, _checked_at
+
+    interval = current_app.config.get("DATASET_VERSION_CHECK_SECONDS", 30)
+    now = time.monotonic()
+    if not force and _checked_at is not None and now - _checked_at < interval:
+        return _version
+
+    with _version_lock:
+        if not force and _checked_at is not None and now - _checked_at < interval:
+            return _version
+
+        with get_db_session() as session:
+            version = DatasetMetaRepository(session).get(DATASET_VERSION_META_KEY)
+
+        changed = _checked_at is not None and version != _version
+        _version = version
+        _checked_at = now
+
+    if changed:
+        logger.info("Dataset version changed to %s - refreshing in-memory state", version)
+        station_catalog.refresh_catalog()
+        cache_service.invalidate_all()
+    return version
@@ -2,16 +2,18 @@ from __future__ import annotations
 
 import csv
 import io
-from typing import Iterable, Optional, Sequence
+from typing import Iterable, Iterator, List, Optional, Sequence
 
 from app.repositories import WeatherRepository
 from app.services.database_service import get_db_session
+from app.services.station_catalog import StationRecord, get_catalog
 from app.utils.date_utils import parse_iso_date, safe_float
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 MAX_EXPORT_ROWS = 20000
+EXPORT_CHUNK_ROWS = 5000
 
 _metric_headers = {
     "temperature": ["Max Temperature (degC)", "Min Temperature (degC)"],
@@ -55,46 +57,101 @@ def export_weather_csv(
                 f"Export exceeds maximum row limit of {MAX_EXPORT_ROWS}. Please refine your filters."
             )
 
+        catalog = get_catalog()
         output = io.StringIO()
         writer = csv.writer(output)
-
-        headers = ["State", "Station Name", "Date"]
-        if metric_filter:
-            for metric in metric_filter:
-                headers.extend(_metric_headers.get(metric, []))
-        else:
-            for header_list in _metric_headers.values():
-                headers.extend(header_list)
-        writer.writerow(headers)
+        writer.writerow(_build_headers(metric_filter))
 
         for row in rows:
-            station = row.station
-            record = [
-                station.state,
-                station.station_name.replace("\n", " "),
-                row.date.isoformat(),
-            ]
-            include_all = not metric_filter
-            if include_all or "temperature" in metric_filter:
-                record.extend([
-                    safe_float(row.temp_max_c),
-                    safe_float(row.temp_min_c),
-                ])
-            if include_all or "rainfall" in metric_filter:
-                record.append(safe_float(row.rainfall_mm))
-            if include_all or "humidity" in metric_filter:
-                record.extend([
-                    safe_float(row.humidity_max_percent),
-                    safe_float(row.humidity_min_percent),
-                ])
-            if include_all or "wind" in metric_filter:
-                record.append(safe_float(row.wind_speed_ms))
-            if include_all or "evapotranspiration" in metric_filter:
-                record.append(safe_float(row.evapotranspiration_mm))
-
-            writer.writerow(record)
+            writer.writerow(_build_record(catalog.get(row.station_id), row, metric_filter))
 
         csv_content = output.getvalue()
         output.close()
 
     return csv_content
+
+
+def stream_weather_csv(
+    *,
+    station_ids: Optional[Sequence[int]] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    metrics: Optional[Iterable[str]] = None,
+    chunk_rows: int = EXPORT_CHUNK_ROWS,
+) -> Iterator[str]:
+    """Yield the CSV export in chunks of at most ``chunk_rows`` rows.
+
+    Unlike :func:`export_weather_csv` there is no row cap: rows are paged from a
+    streaming cursor and each chunk is released once yielded. Nothing is yielded
+    when no rows match, so callers can peek at the first chunk to detect that.
+    """
+    start = parse_iso_date(start_date)
+    end = parse_iso_date(end_date)
+    metric_filter = [m.lower() for m in metrics] if metrics else []
+
+    catalog = get_catalog()
+    with get_db_session() as session:
+        repository = WeatherRepository(session)
+        output = io.StringIO()
+        writer = csv.writer(output)
+        exported = 0
+
+        for batch in repository.iter_weather_rows(
+            station_ids=station_ids,
+            start_date=start,
+            end_date=end,
+            batch_size=chunk_rows,
+        ):
+            if not exported:
+                writer.writerow(_build_headers(metric_filter))
+            for row in batch:
+                writer.writerow(_build_record(catalog.get(row.station_id), row, metric_filter))
+            exported += len(batch)
+
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate(0)
+
+        logger.debug(
+            "Streamed CSV export",
+            extra={"total_rows": exported, "metrics": metric_filter or "all"},
+        )
+
+
+def _build_headers(metric_filter: List[str]) -> List[str]:
+    headers = ["State", "Station Name", "Date"]
+    if metric_filter:
+        for metric in metric_filter:
+            headers.extend(_metric_headers.get(metric, []))
+    else:
+        for header_list in _metric_headers.values():
+            headers.extend(header_list)
+    return headers
+
+
+def _build_record(
+    station: Optional[StationRecord], row, metric_filter: List[str]
+) -> List[str]:
+    record = [
+        station.state if station else "",
+        station.station_name.replace("\n", " ") if station else "",
+        row.date.isoformat(),
+    ]
+    include_all = not metric_filter
+    if include_all or "temperature" in metric_filter:
+        record.extend([
+            safe_float(row.temp_max_c),
+            safe_float(row.temp_min_c),
+        ])
+    if include_all or "rainfall" in metric_filter:
+        record.append(safe_float(row.rainfall_mm))
+    if include_all or "humidity" in metric_filter:
+        record.extend([
+            safe_float(row.humidity_max_percent),
+            safe_float(row.humidity_min_percent),
+        ])
+    if include_all or "wind" in metric_filter:
+        record.append(safe_float(row.wind_speed_ms))
+    if include_all or "evapotranspiration" in metric_filter:
+        record.append(safe_float(row.evapotranspiration_mm))
+    return record
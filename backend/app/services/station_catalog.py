@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import math
+import threading
+from types import MappingProxyType
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from app.repositories import StationRepository
+from app.services.database_service import get_db_session
+from app.utils.geo import BoundingBox, haversine_km, unit_vectors
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Side of the square cells in the viewport index; stations are about 1 degree apart.
+GRID_CELL_DEGREES = 1.0
+# Map clusters group stations per CLUSTER_CELL_PX-wide cell of the 256px Web Mercator
+# tiles. Each zoom halves the cells, so clusters nest from one zoom to the next.
+CLUSTER_CELL_PX = 64
+MAX_CLUSTER_ZOOM = 16
+
+
+class StationRecord(NamedTuple):
+    id: int
+    state: str
+    station_name: str
+    latitude: float
+    longitude: float
+
+    def to_dict(self) -> Dict[str, object]:
+        return self._asdict()
+
+
+class ClusterLevel(NamedTuple):
+    """Station clusters at one zoom; arrays are indexed by cluster unless noted."""
+
+    labels: np.ndarray  # cluster of each catalog station, in catalog order
+    first: np.ndarray  # catalog position of each cluster's first station
+    counts: np.ndarray
+    latitudes: np.ndarray
+    longitudes: np.ndarray
+    expansion_zooms: np.ndarray  # zoom at which the cluster splits, -1 if it never does
+
+
+class StationCatalog:
+    """Immutable, process-wide snapshot of station metadata.
+
+    Stations change only when the dataset is reloaded, so lookups by ID or
+    state are served from memory instead of hydrating ORM objects per request.
+    """
+
+    def __init__(self, records: Iterable[StationRecord]) -> None:
+        ordered = tuple(sorted(records, key=lambda record: (record.state, record.station_name)))
+        by_state: Dict[str, List[StationRecord]] = {}
+        for record in ordered:
+            by_state.setdefault(record.state, []).append(record)
+
+        grid: Dict[Tuple[int, int], List[int]] = {}
+        for position, record in enumerate(ordered):
+            grid.setdefault(_grid_cell(record.latitude, record.longitude), []).append(position)
+
+        self._records = ordered
+        self._by_id = MappingProxyType({record.id: record for record in ordered})
+        self._by_state = MappingProxyType(
+            {state: tuple(records) for state, records in sorted(by_state.items())}
+        )
+        self._grid = MappingProxyType({cell: tuple(positions) for cell, positions in grid.items()})
+        rows = [row for row, _ in grid]
+        cols = [col for _, col in grid]
+        self._grid_rows = (min(rows, default=0), max(rows, default=-1))
+        self._grid_cols = (min(cols, default=0), max(cols, default=-1))
+        self._latitudes = np.array([record.latitude for record in ordered], dtype=np.float64)
+        self._longitudes = np.array([record.longitude for record in ordered], dtype=np.float64)
+        self._tree = (
+            cKDTree(unit_vectors(self._latitudes, self._longitudes)) if ordered else None
+        )
+        self._cluster_levels = _build_cluster_levels(self._latitudes, self._longitudes)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def get(self, station_id: int) -> Optional[StationRecord]:
+        return self._by_id.get(station_id)
+
+    def stations(self, state: Optional[str] = None) -> Tuple[StationRecord, ...]:
+        if state:
+            return self._by_state.get(state.upper(), ())
+        return self._records
+
+    def states(self) -> List[str]:
+        return list(self._by_state)
+
+    def cluster_level(self, zoom: int) -> ClusterLevel:
+        return self._cluster_levels[min(max(zoom, 0), MAX_CLUSTER_ZOOM)]
+
+    def within(self, bbox: BoundingBox) -> Tuple[StationRecord, ...]:
+        """Stations inside ``bbox``, visiting only the grid cells it overlaps."""
+        low_row, low_col = _grid_cell(bbox.min_lat, bbox.min_lon)
+        high_row, high_col = _grid_cell(bbox.max_lat, bbox.max_lon)
+        rows = range(max(low_row, self._grid_rows[0]), min(high_row, self._grid_rows[1]) + 1)
+        cols = range(max(low_col, self._grid_cols[0]), min(high_col, self._grid_cols[1]) + 1)
+
+        positions = []
+        for row in rows:
+            for col in cols:
+                for position in self._grid.get((row, col), ()):
+                    record = self._records[position]
+                    if bbox.contains(record.latitude, record.longitude):
+                        positions.append(position)
+        return tuple(self._records[position] for position in sorted(positions))
+
+    def nearest(
+        self, latitude: float, longitude: float, k: int = 1
+    ) -> List[Tuple[StationRecord, float]]:
+        """The ``k`` closest stations with their great-circle distance in km, nearest first.
+
+        The KD-tree indexes unit-sphere vectors, whose chord distance ranks
+        neighbours exactly as the haversine distance does.
+        """
+        if self._tree is None or k < 1:
+            return []
+        count = min(k, len(self._records))
+        _, positions = self._tree.query(unit_vectors([latitude], [longitude])[0], k=count)
+        positions = np.atleast_1d(positions)
+        distances = haversine_km(
+            latitude, longitude, self._latitudes[positions], self._longitudes[positions]
+        )
+        return [
+            (self._records[position], float(distance))
+            for position, distance in zip(positions.tolist(), distances)
+        ]
+
+
+def _build_cluster_levels(latitudes: np.ndarray, longitudes: np.ndarray) -> List[ClusterLevel]:
+    """Hierarchical grid clusters for zooms ``0..MAX_CLUSTER_ZOOM``."""
+    x = (longitudes + 180.0) / 360.0
+    lat = np.radians(np.clip(latitudes, -85.0511, 85.0511))
+    y = (1 - np.log(np.tan(lat) + 1 / np.cos(lat)) / np.pi) / 2
+    cells_per_tile = 256 // CLUSTER_CELL_PX
+
+    labels_by_zoom = []
+    for zoom in range(MAX_CLUSTER_ZOOM + 1):
+        cells = 2 ** zoom * cells_per_tile
+        codes = np.floor(x * cells).astype(np.int64) * cells + np.floor(y * cells).astype(np.int64)
+        labels_by_zoom.append(np.unique(codes, return_inverse=True)[1].ravel())
+
+    levels = []
+    for zoom, labels in enumerate(labels_by_zoom):
+        first = np.unique(labels, return_index=True)[1]
+        counts = np.bincount(labels, minlength=len(first))
+        expansion = np.full(len(first), -1, dtype=np.int64)
+        for finer_zoom in range(zoom + 1, MAX_CLUSTER_ZOOM + 1):
+            pending = expansion < 0
+            if not pending.any():
+                break
+            finer = labels_by_zoom[finer_zoom]
+            stride = finer.max(initial=0) + 1
+            # Distinct (cluster, finer cluster) pairs count the children of each cluster.
+            children = np.bincount(np.unique(labels * stride + finer) // stride, minlength=len(first))
+            expansion[pending & (children > 1)] = finer_zoom
+        levels.append(ClusterLevel(
+            labels=labels,
+            first=first,
+            counts=counts,
+            latitudes=np.bincount(labels, latitudes, minlength=len(first)) / counts,
+            longitudes=np.bincount(labels, longitudes, minlength=len(first)) / counts,
+            expansion_zooms=expansion,
+        ))
+    return levels
+
+
+def _grid_cell(latitude: float, longitude: float) -> Tuple[int, int]:
+    return math.floor(latitude / GRID_CELL_DEGREES), math.floor(longitude / GRID_CELL_DEGREES)
+
+
+_catalog: Optional[StationCatalog] = None
+_catalog_lock = threading.Lock()
+
+
+def get_catalog() -> StationCatalog:
+    """Return the station catalog, loading it on first use."""
+    catalog = _catalog
+    if catalog is None:
+        with _catalog_lock:
+            catalog = _catalog if _catalog is not None else _load()
+    return catalog
+
+
+def refresh_catalog() -> StationCatalog:
+    """Reload the catalog from the database, e.g. after new stations are ingested."""
+    with _catalog_lock:
+        return _load()
+
+
+def _load() -> StationCatalog:
+    global _catalog
+    with get_db_session() as session:
+        rows = StationRepository(session).list_station_rows()
+    _catalog = StationCatalog(StationRecord(*row) for row in rows)
+    logger.info("Loaded station catalog with %s stations", len(_catalog))
+    return _catalog
@@ -1,50 +1,107 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+import math
+from typing import Dict, List, Optional, Sequence
 
-from app.repositories import StationRepository
-from app.services.database_service import get_db_session
+from app.services.station_catalog import StationRecord, get_catalog
+from app.utils.geo import BoundingBox
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Most stations returned for a map viewport at or below each zoom level.
+ZOOM_STATION_LIMITS = ((4, 150), (6, 400), (8, 1000))
 
-def get_all_stations(state: Optional[str] = None) -> List[Dict[str, object]]:
-    with get_db_session() as session:
-        repository = StationRepository(session)
-        stations = repository.list_stations(state)
-        logger.debug("Fetched %s stations", len(stations))
-        return [
-            {
-                "id": station.id,
-                "state": station.state,
-                "station_name": station.station_name,
-                "latitude": station.latitude,
-                "longitude": station.longitude,
-            }
-            for station in stations
-        ]
+
+def get_all_stations(
+    state: Optional[str] = None,
+    *,
+    bbox: Optional[BoundingBox] = None,
+    zoom: Optional[int] = None,
+) -> List[Dict[str, object]]:
+    stations = visible_stations(state=state, bbox=bbox, zoom=zoom)
+    logger.debug("Fetched %s stations", len(stations))
+    return [station.to_dict() for station in stations]
+
+
+def visible_stations(
+    *,
+    state: Optional[str] = None,
+    bbox: Optional[BoundingBox] = None,
+    zoom: Optional[int] = None,
+) -> Sequence[StationRecord]:
+    """Stations to draw for a map viewport.
+
+    ``bbox`` uses the catalog's grid index. ``zoom`` caps the count via
+    :data:`ZOOM_STATION_LIMITS`, keeping an evenly spread subset so a zoomed-out
+    map still covers the whole viewport.
+    """
+    catalog = get_catalog()
+    if bbox is None:
+        stations = catalog.stations(state)
+    else:
+        stations = catalog.within(bbox)
+        if state:
+            stations = tuple(station for station in stations if station.state == state)
+    return _spread_sample(stations, station_limit_for_zoom(zoom))
+
+
+def station_limit_for_zoom(zoom: Optional[int]) -> Optional[int]:
+    if zoom is None:
+        return None
+    for max_zoom, limit in ZOOM_STATION_LIMITS:
+        if zoom <= max_zoom:
+            return limit
+    return None
+
+
+def get_nearest_stations(latitude: float, longitude: float, k: int) -> List[Dict[str, object]]:
+    neighbours = get_catalog().nearest(latitude, longitude, k)
+    logger.debug("Found %s nearest stations", len(neighbours))
+    return [
+        {**station.to_dict(), "distance_km": round(distance, 3)}
+        for station, distance in neighbours
+    ]
 
 
 def get_station_by_id(station_id: int) -> Optional[Dict[str, object]]:
-    with get_db_session() as session:
-        repository = StationRepository(session)
-        station = repository.get_by_id(station_id)
-        if station is None:
-            logger.info("Station not found", extra={"station_id": station_id})
-            return None
-        return {
-            "id": station.id,
-            "state": station.state,
-            "station_name": station.station_name,
-            "latitude": station.latitude,
-            "longitude": station.longitude,
-        }
+    station = get_catalog().get(station_id)
+    if station is None:
+        logger.info("Station not found", extra={"station_id": station_id})
+        return None
+    return station.to_dict()
 
 
 def get_states() -> List[str]:
-    with get_db_session() as session:
-        repository = StationRepository(session)
-        states = repository.list_states()
-        logger.debug("Fetched %s states", len(states))
-        return states
+    states = get_catalog().states()
+    logger.debug("Fetched %s states", len(states))
+    return states
+
+
+def _spread_sample(
+    stations: Sequence[StationRecord], limit: Optional[int]
+) -> Sequence[StationRecord]:
+    """Keep at most ``limit`` stations, one per cell of a grid over their extent."""
+    if limit is None or len(stations) <= limit:
+        return stations
+
+    side = math.ceil(math.sqrt(limit))
+    min_lat = min(station.latitude for station in stations)
+    min_lon = min(station.longitude for station in stations)
+    cell_height = (max(station.latitude for station in stations) - min_lat) / side or 1.0
+    cell_width = (max(station.longitude for station in stations) - min_lon) / side or 1.0
+
+    occupied = set()
+    kept = []
+    for station in stations:
+        cell = (
+            min(int((station.latitude - min_lat) / cell_height), side - 1),
+            min(int((station.longitude - min_lon) / cell_width), side - 1),
+        )
+        if cell in occupied:
+            continue
+        occupied.add(cell)
+        kept.append(station)
+        if len(kept) == limit:
+            break
+    return kept
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 from scipy import stats as scipy_stats
 
+from app.models import WeatherData
 from app.repositories import WeatherRepository
 from app.services.database_service import get_db_session
 from app.utils.date_utils import parse_iso_date
@@ -13,108 +14,315 @@ from app.utils.logging import get_logger
 logger = get_logger(__name__)
 
 
+_STATISTICS_COLUMNS = {
+    "temp_max": WeatherData.temp_max_c,
+    "temp_min": WeatherData.temp_min_c,
+    "rainfall": WeatherData.rainfall_mm,
+    "humidity_max": WeatherData.humidity_max_percent,
+    "humidity_min": WeatherData.humidity_min_percent,
+    "wind_speed": WeatherData.wind_speed_ms,
+    "evapotranspiration": WeatherData.evapotranspiration_mm,
+}
+
+
+# Histogram bucket width used for pushed-down medians. Observations are recorded
+# to one decimal place, so medians are exact up to averaging the middle pair.
+MEDIAN_BIN_WIDTH = 0.1
+
+
 def calculate_statistics(
     *,
     station_ids: Optional[Iterable[int]] = None,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
     state: Optional[str] = None,
+    correlation_method: str = "pearson",
+    exact: bool = False,
 ) -> Dict[str, object]:
+    """Summarise each metric and correlate the metrics for the filtered rows.
+
+    By default moments and Pearson correlations are aggregated inside the
+    database and medians come from a binned histogram, so memory use does not
+    depend on the number of rows. ``exact=True`` (or Spearman, which needs
+    ranks) loads the columns into NumPy arrays instead.
+    """
     start = parse_iso_date(start_date)
     end = parse_iso_date(end_date)
 
+    if not exact and correlation_method == "pearson":
+        return _calculate_pushdown_statistics(
+            station_ids=station_ids, state=state, start_date=start, end_date=end
+        )
+
     with get_db_session() as session:
         repository = WeatherRepository(session)
-        dataset = repository.fetch_statistics_dataset(
+        arrays = repository.fetch_statistics_arrays(
+            columns=list(_STATISTICS_COLUMNS.values()),
             station_ids=station_ids,
             state=state,
             start_date=start,
             end_date=end,
         )
 
+    metrics: Dict[str, np.ndarray] = dict(zip(_STATISTICS_COLUMNS, arrays))
+    sample_size = int(arrays[0].size) if arrays else 0
+
     logger.debug(
         "Fetched statistics dataset",
-        extra={"records": len(dataset), "state": state},
+        extra={"records": sample_size, "state": state},
     )
 
-    if not dataset or len(dataset) < 2:
-        return {"error": "Insufficient data for analysis", "sample_size": len(dataset)}
-
-    columns = (
-        "temp_max",
-        "temp_min",
-        "rainfall",
-        "humidity_max",
-        "humidity_min",
-        "wind_speed",
-        "evapotranspiration",
-    )
-    metrics: Dict[str, List[float]] = {name: [] for name in columns}
-
-    for row in dataset:
-        for index, key in enumerate(columns):
-            value = row[index]
-            if value is not None:
-                metrics[key].append(value)
+    if sample_size < 2:
+        return {"error": "Insufficient data for analysis", "sample_size": sample_size}
 
     statistics: Dict[str, Dict[str, float | int]] = {}
     variances: Dict[str, float] = {}
 
     for key, values in metrics.items():
-        if values:
-            array = np.array(values)
+        count = int(np.count_nonzero(~np.isnan(values)))
+        if count:
             statistics[key] = {
-                "mean": round(float(np.mean(array)), 2),
-                "std": round(float(np.std(array)), 2),
-                "min": round(float(np.min(array)), 2),
-                "max": round(float(np.max(array)), 2),
-                "median": round(float(np.median(array)), 2),
-                "count": len(values),
+                "mean": round(float(np.nanmean(values)), 2),
+                "std": round(float(np.nanstd(values)), 2),
+                "min": round(float(np.nanmin(values)), 2),
+                "max": round(float(np.nanmax(values)), 2),
+                "median": round(float(np.nanmedian(values)), 2),
+                "count": count,
             }
             variances[key] = float(statistics[key]["std"])
 
     dominant_factor = max(variances, key=variances.get) if variances else None
 
-    correlations = _calculate_correlations(metrics)
+    correlations, correlation_matrix = _calculate_correlations(
+        metrics, correlation_method
+    )
 
     return {
         "statistics": statistics,
         "dominant_factor": _format_metric_name(dominant_factor) if dominant_factor else "N/A",
         "correlations": correlations,
-        "sample_size": len(dataset),
+        "correlation_matrix": correlation_matrix,
+        "sample_size": sample_size,
+        "exact": True,
     }
 
 
-def _calculate_correlations(metrics: Dict[str, List[float]]) -> List[Dict[str, object]]:
-    correlations: List[Dict[str, object]] = []
-    metric_pairs = (
-        ("temp_max", "rainfall", "Temperature vs Rainfall"),
-        ("temp_max", "humidity_max", "Temperature vs Humidity"),
-        ("rainfall", "humidity_max", "Rainfall vs Humidity"),
-        ("wind_speed", "temp_max", "Wind Speed vs Temperature"),
+def _calculate_pushdown_statistics(
+    *,
+    station_ids: Optional[Iterable[int]],
+    state: Optional[str],
+    start_date,
+    end_date,
+) -> Dict[str, object]:
+    columns = list(_STATISTICS_COLUMNS.values())
+    filters = dict(
+        station_ids=station_ids, state=state, start_date=start_date, end_date=end_date
     )
 
-    for metric1, metric2, label in metric_pairs:
-        values1 = metrics.get(metric1, [])
-        values2 = metrics.get(metric2, [])
-        min_length = min(len(values1), len(values2))
-        if min_length < 2:
+    with get_db_session() as session:
+        repository = WeatherRepository(session)
+        moments = repository.fetch_statistics_moments(columns=columns, **filters)
+        sample_size = moments["rows"]
+        histograms = (
+            repository.fetch_value_histograms(
+                columns=columns, bin_width=MEDIAN_BIN_WIDTH, **filters
+            )
+            if sample_size >= 2
+            else []
+        )
+
+    logger.debug(
+        "Aggregated statistics in database",
+        extra={"records": sample_size, "state": state},
+    )
+
+    if sample_size < 2:
+        return {"error": "Insufficient data for analysis", "sample_size": sample_size}
+
+    statistics: Dict[str, Dict[str, float | int]] = {}
+    variances: Dict[str, float] = {}
+    for index, key in enumerate(_STATISTICS_COLUMNS):
+        count = int(moments["counts"][index, index])
+        if not count:
             continue
-        arr1 = np.array(values1[:min_length])
-        arr2 = np.array(values2[:min_length])
-        if arr1.size < 2 or arr2.size < 2:
+        mean = moments["sums"][index, index] / count
+        variance = max(moments["squares"][index, index] / count - mean * mean, 0.0)
+        statistics[key] = {
+            "mean": round(float(mean), 2),
+            "std": round(float(np.sqrt(variance)), 2),
+            "min": round(float(moments["minimum"][index]), 2),
+            "max": round(float(moments["maximum"][index]), 2),
+            "median": round(_histogram_median(histograms[index], MEDIAN_BIN_WIDTH), 2),
+            "count": count,
+        }
+        variances[key] = float(statistics[key]["std"])
+
+    dominant_factor = max(variances, key=variances.get) if variances else None
+
+    coefficients, p_values, counts = _correlation_from_moments(
+        moments["counts"], moments["sums"], moments["squares"], moments["products"]
+    )
+    correlations, correlation_matrix = _correlation_payload(
+        list(_STATISTICS_COLUMNS), coefficients, p_values, counts, "pearson"
+    )
+
+    return {
+        "statistics": statistics,
+        "dominant_factor": _format_metric_name(dominant_factor) if dominant_factor else "N/A",
+        "correlations": correlations,
+        "correlation_matrix": correlation_matrix,
+        "sample_size": sample_size,
+        "exact": False,
+    }
+
+
+def _histogram_median(histogram: List[Tuple[int, int]], bin_width: float) -> float:
+    """Median of the values represented by sorted ``(bin, count)`` pairs."""
+    total = sum(count for _, count in histogram)
+    lower_rank, upper_rank = (total - 1) // 2, total // 2
+    lower = upper = None
+    seen = 0
+    for bin_index, count in histogram:
+        if lower is None and seen + count > lower_rank:
+            lower = bin_index
+        if seen + count > upper_rank:
+            upper = bin_index
+            break
+        seen += count
+    return (lower + upper) / 2 * bin_width
+
+_HIGHLIGHTED_PAIRS = (
+    ("temp_max", "rainfall", "Temperature vs Rainfall"),
+    ("temp_max", "humidity_max", "Temperature vs Humidity"),
+    ("rainfall", "humidity_max", "Rainfall vs Humidity"),
+    ("wind_speed", "temp_max", "Wind Speed vs Temperature"),
+)
+
+
+def _correlation_matrix(
+    columns: List[np.ndarray], method: str = "pearson"
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return pairwise-complete correlation, p-value and sample-size matrices.
+
+    Each pair only uses rows where both values are present. Pearson pairs are
+    evaluated together from masked cross-products of the row-aligned columns;
+    Spearman ranks depend on which rows a pair shares, so each pair is re-ranked
+    over its joint rows. p-values come from the t distribution in one
+    vectorised call.
+    """
+    data = np.column_stack(columns) if columns else np.empty((0, 0))
+    if method == "spearman":
+        return _correlation_from_moments(*_rank_moments(data))
+
+    present = ~np.isnan(data)
+    mask = present.astype(np.float64)
+    observed = np.maximum(present.sum(axis=0), 1)
+    centred = np.where(present, data - np.nansum(data, axis=0) / observed, 0.0)
+
+    return _correlation_from_moments(
+        mask.T @ mask,
+        centred.T @ mask,
+        (centred * centred).T @ mask,
+        centred.T @ centred,
+    )
+
+
+def _rank_moments(data: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Moment matrices of centred ranks, ranked over each pair's jointly present rows."""
+    size = data.shape[1]
+    present = ~np.isnan(data)
+    counts = np.zeros((size, size))
+    squares = np.zeros((size, size))
+    products = np.zeros((size, size))
+    for first in range(size):
+        for second in range(first, size):
+            rows = present[:, first] & present[:, second]
+            count = int(rows.sum())
+            counts[first, second] = counts[second, first] = count
+            if not count:
+                continue
+            ranks = scipy_stats.rankdata(data[rows][:, [first, second]], axis=0)
+            ranks -= ranks.mean(axis=0)
+            squares[first, second], squares[second, first] = (ranks * ranks).sum(axis=0)
+            products[first, second] = products[second, first] = ranks[:, 0] @ ranks[:, 1]
+    # Ranks are centred per pair, so every masked sum is zero.
+    return counts, np.zeros((size, size)), squares, products
+
+
+def _correlation_from_moments(
+    counts: np.ndarray, sums: np.ndarray, squares: np.ndarray, products: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Turn pairwise-complete moment matrices into correlations and p-values.
+
+    ``sums[i, j]`` and ``squares[i, j]`` cover column ``i`` over the rows where
+    ``j`` is also present; ``products`` holds the cross-products.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        covariance = products - sums * sums.T / counts
+        variance = squares - sums * sums / counts
+        coefficients = covariance / np.sqrt(variance * variance.T)
+        coefficients = np.clip(coefficients, -1.0, 1.0)
+        # Treat variances lost in floating-point noise as zero (constant columns).
+        degenerate = variance <= 1e-9 * np.maximum(np.abs(squares), 1.0)
+        coefficients[(counts < 3) | degenerate | degenerate.T] = np.nan
+
+        dof = counts - 2
+        t_stat = np.abs(coefficients) * np.sqrt(dof / (1.0 - coefficients**2))
+        p_values = 2.0 * scipy_stats.t.sf(t_stat, np.maximum(dof, 1))
+    p_values[np.isnan(coefficients)] = np.nan
+
+    return coefficients, p_values, counts.astype(np.int64)
+
+
+def _calculate_correlations(
+    metrics: Dict[str, np.ndarray], method: str = "pearson"
+) -> Tuple[List[Dict[str, object]], Dict[str, object]]:
+    coefficients, p_values, counts = _correlation_matrix(list(metrics.values()), method)
+    return _correlation_payload(list(metrics), coefficients, p_values, counts, method)
+
+
+def _correlation_payload(
+    keys: List[str],
+    coefficients: np.ndarray,
+    p_values: np.ndarray,
+    counts: np.ndarray,
+    method: str,
+) -> Tuple[List[Dict[str, object]], Dict[str, object]]:
+    index = {key: position for position, key in enumerate(keys)}
+
+    correlations: List[Dict[str, object]] = []
+    for metric1, metric2, label in _HIGHLIGHTED_PAIRS:
+        if metric1 not in index or metric2 not in index:
+            continue
+        row, column = index[metric1], index[metric2]
+        correlation = coefficients[row, column]
+        if np.isnan(correlation):
             continue
-        correlation, p_value = scipy_stats.pearsonr(arr1, arr2)
         correlations.append(
             {
                 "pair": label,
                 "correlation": round(float(correlation), 3),
-                "p_value": round(float(p_value), 4),
+                "p_value": round(float(p_values[row, column]), 4),
                 "strength": _correlation_strength(correlation),
+                "sample_size": int(counts[row, column]),
             }
         )
 
-    return correlations
+    matrix = {
+        "method": method,
+        "metrics": keys,
+        "coefficients": _matrix_payload(coefficients, 3),
+        "p_values": _matrix_payload(p_values, 4),
+        "sample_sizes": counts.tolist(),
+    }
+    return correlations, matrix
+
+
+def _matrix_payload(matrix: np.ndarray, digits: int) -> List[List[Optional[float]]]:
+    return [
+        [None if np.isnan(value) else round(float(value), digits) for value in row]
+        for row in matrix
+    ]
 
 
 def _correlation_strength(corr: float) -> str:
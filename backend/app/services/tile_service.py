@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable, NamedTuple, Optional, Tuple
+
+import numpy as np
+from flask import current_app
+from scipy.spatial import cKDTree
+
+from app.services.dataset_service import get_dataset_version
+from app.services.weather_service import get_station_latest_values
+from app.utils.geo import EARTH_RADIUS_KM, unit_vectors
+from app.utils.logging import get_logger
+from app.utils.png import encode_rgba
+
+logger = get_logger(__name__)
+
+TILE_SIZE = 256
+# Stations blended into each pixel, and the distance beyond which a pixel stays empty.
+TILE_NEIGHBOURS = 8
+TILE_RADIUS_KM = 250.0
+IDW_POWER = 2.0
+GAUSSIAN_SIGMA_KM = 60.0
+
+# Same colour-blind safe ramp the map used for its client-side heat layer.
+_GRADIENT_STOPS = np.array([0.0, 0.25, 0.5, 0.75, 1.0])
+_GRADIENT_RGB = np.array(
+    [
+        (0x00, 0x72, 0xB2),
+        (0x00, 0x9E, 0x73),
+        (0xF0, 0xE4, 0x42),
+        (0xE6, 0x9F, 0x00),
+        (0xD5, 0x5E, 0x00),
+    ],
+    dtype=np.float64,
+)
+
+
+class Tile(NamedTuple):
+    body: bytes
+    mimetype: str
+    value_range: Tuple[Optional[float], Optional[float]]
+
+
+class ValueField(NamedTuple):
+    """Station values for one metric and date range, indexed for pixel lookups."""
+
+    tree: Optional[cKDTree]
+    values: np.ndarray
+    low: Optional[float]
+    high: Optional[float]
+
+
+class TileCache:
+    """Thread-safe LRU of rendered tiles whose entries also expire after ``ttl`` seconds."""
+
+    def __init__(self, max_entries: int, ttl: float) -> None:
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, object]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_caches_lock = threading.Lock()
+_tile_cache: Optional[TileCache] = None
+_field_cache: Optional[TileCache] = None
+
+
+def render_tile(
+    z: int,
+    x: int,
+    y: int,
+    *,
+    metric: str = "temperature",
+    start_date=None,
+    end_date=None,
+    method: str = "idw",
+    fmt: str = "png",
+) -> Tile:
+    """Return tile ``z/x/y`` of the interpolated ``metric`` surface, rendering it at most once.
+
+    Entries are keyed on the dataset version, so a reload makes every worker
+    render fresh tiles without having to clear anything.
+    """
+    key = (get_dataset_version(), metric, start_date, end_date, method, fmt, z, x, y)
+    tiles = _caches()[0]
+    tile = tiles.get(key)
+    if tile is not None:
+        return tile
+
+    field = _value_field(metric, start_date, end_date)
+    grid = interpolate_grid(field, *tile_pixel_coordinates(z, x, y), method=method)
+    if fmt == "f16":
+        body, mimetype = grid.astype("<f2").tobytes(), "application/octet-stream"
+    else:
+        body, mimetype = encode_rgba(colourise(grid, field.low, field.high)), "image/png"
+    tile = Tile(body, mimetype, (field.low, field.high))
+    tiles.set(key, tile)
+    logger.debug("Rendered heatmap tile", extra={"tile": f"{z}/{x}/{y}", "format": fmt})
+    return tile
+
+
+def clear_tile_cache() -> None:
+    for cache in _caches():
+        cache.clear()
+
+
+def tile_pixel_coordinates(
+    z: int, x: int, y: int, size: int = TILE_SIZE
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Latitude and longitude of each pixel centre of a Web Mercator tile, rows north to south."""
+    scale = 2 ** z
+    offsets = (np.arange(size) + 0.5) / size
+    longitudes = (x + offsets) / scale * 360.0 - 180.0
+    latitudes = np.degrees(np.arctan(np.sinh(np.pi * (1 - 2 * (y + offsets) / scale))))
+    return np.meshgrid(latitudes, longitudes, indexing="ij")
+
+
+def interpolate_grid(
+    field: ValueField, latitudes: np.ndarray, longitudes: np.ndarray, *, method: str = "idw"
+) -> np.ndarray:
+    """Blend the nearest stations into every grid point; points out of range are NaN."""
+    shape = latitudes.shape
+    if field.tree is None:
+        return np.full(shape, np.nan, dtype=np.float32)
+
+    neighbours = min(TILE_NEIGHBOURS, len(field.values))
+    max_chord = 2 * math.sin(TILE_RADIUS_KM / (2 * EARTH_RADIUS_KM))
+    chords, positions = field.tree.query(
+        unit_vectors(latitudes.ravel(), longitudes.ravel()),
+        k=neighbours,
+        distance_upper_bound=max_chord,
+    )
+    chords = chords.reshape(-1, neighbours)
+    positions = positions.reshape(-1, neighbours)
+    found = np.isfinite(chords)
+    distances = 2 * EARTH_RADIUS_KM * np.arcsin(np.where(found, chords, 0.0) / 2)
+
+    if method == "gaussian":
+        weights = np.exp(-0.5 * (distances / GAUSSIAN_SIGMA_KM) ** 2)
+    else:
+        weights = 1.0 / np.maximum(distances, 1e-3) ** IDW_POWER
+    weights = np.where(found, weights, 0.0)
+    # Missing neighbours are reported with position == len(values).
+    padded = np.append(field.values, 0.0)
+    totals = weights.sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        grid = (weights * padded[positions]).sum(axis=1) / totals
+    grid[totals == 0] = np.nan
+    return grid.reshape(shape).astype(np.float32)
+
+
+def colourise(grid: np.ndarray, low: Optional[float], high: Optional[float]) -> np.ndarray:
+    """Map values onto the gradient between ``low`` and ``high``; NaN becomes transparent."""
+    pixels = np.zeros(grid.shape + (4,), dtype=np.uint8)
+    present = ~np.isnan(grid)
+    if low is None or high is None or not present.any():
+        return pixels
+    span = high - low
+    scaled = np.full(grid.shape, 0.5) if span == 0 else np.clip((grid - low) / span, 0.0, 1.0)
+    scaled[~present] = 0.0
+    for channel in range(3):
+        pixels[..., channel] = np.interp(scaled, _GRADIENT_STOPS, _GRADIENT_RGB[:, channel])
+    pixels[..., 3] = np.where(present, 255, 0)
+    return pixels
+
+
+def build_value_field(latitudes, longitudes, values) -> ValueField:
+    values = np.asarray(values, dtype=np.float64)
+    if not values.size:
+        return ValueField(None, values, None, None)
+    # Colour between the 10th and 90th percentiles so a few outliers don't flatten the map.
+    low, high = np.percentile(values, [10, 90])
+    return ValueField(cKDTree(unit_vectors(latitudes, longitudes)), values, float(low), float(high))
+
+
+def _value_field(metric: str, start_date, end_date) -> ValueField:
+    key = (get_dataset_version(), metric, start_date, end_date)
+    fields = _caches()[1]
+    field = fields.get(key)
+    if field is None:
+        rows = [
+            row
+            for row in get_station_latest_values(
+                metric=metric, start_date=start_date, end_date=end_date
+            )
+            if row["value"] is not None
+        ]
+        field = build_value_field(
+            [row["latitude"] for row in rows],
+            [row["longitude"] for row in rows],
+            [row["value"] for row in rows],
+        )
+        fields.set(key, field)
+    return field
+
+
+def _caches() -> Tuple[TileCache, TileCache]:
+    global _tile_cache, _field_cache
+    if _tile_cache is None:
+        with _caches_lock:
+            if _tile_cache is None:
+                ttl = current_app.config.get("TILE_CACHE_TTL", 3600)
+                _field_cache = TileCache(32, ttl)
+                _tile_cache = TileCache(current_app.config.get("TILE_CACHE_MAX_ENTRIES", 512), ttl)
+    return _tile_cache, _field_cache
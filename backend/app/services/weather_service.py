@@ -2,18 +2,26 @@ from __future__ import annotations
 
 from typing import Dict, Iterable, List, Optional, Sequence
 
+import numpy as np
 from sqlalchemy import Column
 
 from app.models import WeatherData
-from app.repositories import WeatherRepository
+from app.repositories import StationLatestRepository, WeatherRepository
 from app.services.database_service import get_db_session
+from app.services.station_catalog import get_catalog
+from app.services.station_service import visible_stations
 from app.utils.date_utils import parse_iso_date
+from app.utils.geo import BoundingBox
 from app.utils.logging import get_logger
+from app.utils.pagination import Cursor, encode_cursor
 
 logger = get_logger(__name__)
 
 DEFAULT_PAGE_SIZE = 500
 MAX_PAGE_SIZE = 2000
+IDW_POWER = 2.0
+# Points closer than this to a station take that station's values unweighted.
+IDW_SNAP_KM = 0.001
 
 _metric_map: Dict[str, Column] = {
     "temperature": WeatherData.temp_max_c,
@@ -23,6 +31,14 @@ _metric_map: Dict[str, Column] = {
     "evapotranspiration": WeatherData.evapotranspiration_mm,
 }
 
+_metric_columns: Dict[str, Sequence[str]] = {
+    "temperature": ("temp_max_c", "temp_min_c"),
+    "rainfall": ("rainfall_mm",),
+    "humidity": ("humidity_max_percent", "humidity_min_percent"),
+    "wind": ("wind_speed_ms",),
+    "evapotranspiration": ("evapotranspiration_mm",),
+}
+
 
 def get_weather_data(
     *,
@@ -32,7 +48,16 @@ def get_weather_data(
     metrics: Optional[Iterable[str]] = None,
     page: int = 1,
     page_size: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[Cursor] = None,
+    include_total: bool = False,
 ) -> Dict[str, object]:
+    """Return a page of observations.
+
+    Without ``cursor`` the page is located by ``page``/``page_size`` and the
+    total is always counted. With ``cursor`` the page starts after that keyset
+    position and the count is only run when ``include_total`` is set. Both modes
+    return a ``next_cursor`` for the following page.
+    """
     start = parse_iso_date(start_date) if start_date else None
     end = parse_iso_date(end_date) if end_date else None
     bounded_page = max(page, 1)
@@ -40,13 +65,32 @@ def get_weather_data(
 
     with get_db_session() as session:
         repository = WeatherRepository(session)
-        records, total = repository.fetch_weather(
-            station_ids=station_ids,
-            start_date=start,
-            end_date=end,
-            page=bounded_page,
-            page_size=bounded_page_size,
-        )
+        if cursor is None:
+            records, total = repository.fetch_weather(
+                station_ids=station_ids,
+                start_date=start,
+                end_date=end,
+                page=bounded_page,
+                page_size=bounded_page_size,
+            )
+            has_more = bounded_page * bounded_page_size < total
+        else:
+            records = repository.fetch_weather_after(
+                after=cursor,
+                station_ids=station_ids,
+                start_date=start,
+                end_date=end,
+                limit=bounded_page_size + 1,
+            )
+            has_more = len(records) > bounded_page_size
+            records = records[:bounded_page_size]
+            total = (
+                repository.count_weather(
+                    station_ids=station_ids, start_date=start, end_date=end
+                )
+                if include_total
+                else None
+            )
 
         logger.debug(
             "Fetched weather page",
@@ -54,16 +98,19 @@ def get_weather_data(
                 "total": total,
                 "page": bounded_page,
                 "page_size": bounded_page_size,
+                "keyset": cursor is not None,
             },
         )
 
+        catalog = get_catalog()
         items: List[Dict[str, object]] = []
         selected_metrics = set(metrics) if metrics else set()
         for row in records:
+            station = catalog.get(row.station_id)
             record = {
                 "station_id": row.station_id,
-                "station_name": row.station.station_name,
-                "state": row.station.state,
+                "station_name": station.station_name if station else None,
+                "state": station.state if station else None,
                 "date": row.date.isoformat(),
             }
             if not selected_metrics or "evapotranspiration" in selected_metrics:
@@ -80,6 +127,21 @@ def get_weather_data(
                 record["wind_speed_ms"] = row.wind_speed_ms
             items.append(record)
 
+        next_cursor = None
+        if has_more and records:
+            last = records[-1]
+            next_cursor = encode_cursor(last.date, last.station_id, last.id)
+
+        if cursor is not None:
+            pagination: Dict[str, object] = {
+                "page_size": bounded_page_size,
+                "has_more": has_more,
+                "next_cursor": next_cursor,
+            }
+            if total is not None:
+                pagination["total_items"] = total
+            return {"items": items, "pagination": pagination}
+
         total_pages = (total + bounded_page_size - 1) // bounded_page_size if bounded_page_size else 1
         return {
             "items": items,
@@ -88,6 +150,8 @@ def get_weather_data(
                 "page_size": bounded_page_size,
                 "total_items": total,
                 "total_pages": total_pages,
+                "has_more": has_more,
+                "next_cursor": next_cursor,
             },
         }
 
@@ -97,18 +161,32 @@ def get_station_latest_values(
     metric: str = "temperature",
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
+    bbox: Optional[BoundingBox] = None,
+    zoom: Optional[int] = None,
 ) -> List[Dict[str, object]]:
     metric_column = _metric_map.get(metric, WeatherData.temp_max_c)
     start = parse_iso_date(start_date)
     end = parse_iso_date(end_date)
 
+    station_ids = None
+    if bbox is not None or zoom is not None:
+        station_ids = [station.id for station in visible_stations(bbox=bbox, zoom=zoom)]
+        if not station_ids:
+            return []
+
     with get_db_session() as session:
-        repository = WeatherRepository(session)
-        rows = repository.fetch_latest_metric_values(
-            column=metric_column,
-            start_date=start,
-            end_date=end,
-        )
+        latest = StationLatestRepository(session)
+        if start is None and end is None and latest.is_ready():
+            rows = latest.fetch_latest_metric_values(
+                column=metric_column.key, station_ids=station_ids
+            )
+        else:
+            rows = WeatherRepository(session).fetch_latest_metric_values(
+                column=metric_column,
+                start_date=start,
+                end_date=end,
+                station_ids=station_ids,
+            )
 
     logger.debug("Fetched heatmap dataset", extra={"metric": metric, "count": len(rows)})
 
@@ -123,3 +201,83 @@ def get_station_latest_values(
         }
         for station_id, station_name, latitude, longitude, state, value in rows
     ]
+
+
+def interpolate_point(
+    *,
+    latitude: float,
+    longitude: float,
+    k: int,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    metrics: Optional[Iterable[str]] = None,
+) -> Dict[str, object]:
+    """Inverse-distance-weighted estimate at a point from its ``k`` nearest stations.
+
+    Each station contributes its mean over the date range (the whole record
+    when no range is given). Stations with no value for a column are left out
+    of that column's weights rather than counted as zero.
+    """
+    start = parse_iso_date(start_date)
+    end = parse_iso_date(end_date)
+    columns = list(dict.fromkeys(
+        column
+        for metric in (metrics or _metric_columns)
+        for column in _metric_columns[metric]
+    ))
+    neighbours = get_catalog().nearest(latitude, longitude, k)
+
+    means: Dict[int, Sequence[Optional[float]]] = {}
+    if neighbours:
+        with get_db_session() as session:
+            rows = WeatherRepository(session).fetch_station_means(
+                columns=columns,
+                station_ids=[station.id for station, _ in neighbours],
+                start_date=start,
+                end_date=end,
+            )
+        means = {row[0]: row[1:] for row in rows}
+
+    distances = np.array([distance for _, distance in neighbours], dtype=np.float64)
+    values = np.array(
+        [means.get(station.id, (None,) * len(columns)) for station, _ in neighbours],
+        dtype=np.float64,
+    ).reshape(len(neighbours), len(columns))
+
+    if distances.size and distances.min() < IDW_SNAP_KM:
+        weights = (distances < IDW_SNAP_KM).astype(np.float64)
+    else:
+        weights = 1.0 / np.power(distances, IDW_POWER)
+    present = ~np.isnan(values)
+    column_weights = weights[:, None] * present
+    totals = column_weights.sum(axis=0)
+    weighted = np.where(present, values, 0.0) * column_weights
+    with np.errstate(invalid="ignore", divide="ignore"):
+        estimates = weighted.sum(axis=0) / totals
+    share = weights / weights.sum() if weights.size else weights
+
+    logger.debug(
+        "Interpolated point",
+        extra={"neighbours": len(neighbours), "columns": len(columns)},
+    )
+
+    return {
+        "latitude": latitude,
+        "longitude": longitude,
+        "start_date": start.isoformat() if start else None,
+        "end_date": end.isoformat() if end else None,
+        "values": {
+            column: round(float(estimate), 2) if total > 0 else None
+            for column, estimate, total in zip(columns, estimates, totals)
+        },
+        "stations": [
+            {
+                "station_id": station.id,
+                "station_name": station.station_name,
+                "state": station.state,
+                "distance_km": round(distance, 3),
+                "weight": round(float(weight), 4),
+            }
+            for (station, distance), weight in zip(neighbours, share)
+        ],
+    }
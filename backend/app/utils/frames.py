@@ -0,0 +1,56 @@
+"""Binary container for heatmap animation frames.
+
+Layout: ``FRAMES_MAGIC``, a little-endian uint32 header length, the UTF-8 JSON
+header, then the ``periods x stations`` float32 matrix (little-endian, frame
+major, NaN where a station has no value). With ``encoding == "xor"`` every
+frame after the first holds the bitwise XOR of its float bits with the previous
+frame, which is lossless and shrinks runs of unchanged values (e.g. dry days,
+stations without data) but not noisy means, so it is opt-in; with
+``compression == "zlib"`` the matrix bytes are deflated.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import zlib
+from typing import Dict, Tuple
+
+import numpy as np
+
+FRAMES_MAGIC = b"WXF1"
+
+
+def encode_frames(
+    matrix: np.ndarray, header: Dict[str, object], *, delta: bool = False, compress: bool = True
+) -> bytes:
+    bits = np.ascontiguousarray(matrix, dtype="<f4").view("<u4")
+    if delta and len(bits) > 1:
+        bits = np.concatenate((bits[:1], bits[1:] ^ bits[:-1]))
+    payload = bits.tobytes()
+    if compress:
+        payload = zlib.compress(payload, 6)
+
+    header = {
+        **header,
+        "dtype": "float32",
+        "shape": list(matrix.shape),
+        "encoding": "xor" if delta else "raw",
+        "compression": "zlib" if compress else "none",
+    }
+    encoded = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    return FRAMES_MAGIC + struct.pack("<I", len(encoded)) + encoded + payload
+
+
+def decode_frames(data: bytes) -> Tuple[Dict[str, object], np.ndarray]:
+    if data[:4] != FRAMES_MAGIC:
+        raise ValueError("Not a heatmap frames payload")
+    (length,) = struct.unpack("<I", data[4:8])
+    header = json.loads(data[8 : 8 + length].decode("utf-8"))
+    payload = data[8 + length :]
+    if header["compression"] == "zlib":
+        payload = zlib.decompress(payload)
+    bits = np.frombuffer(payload, dtype="<u4").reshape(header["shape"])
+    if header["encoding"] == "xor":
+        bits = np.bitwise_xor.accumulate(bits, axis=0)
+    return header, bits.view("<f4")
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from typing import NamedTuple
+
+import numpy as np
+
+# Mean Earth radius (IUGG), used for great-circle distances.
+EARTH_RADIUS_KM = 6371.0088
+
+
+class BoundingBox(NamedTuple):
+    """Map viewport in degrees, ordered like the ``bbox`` query parameter."""
+
+    min_lon: float
+    min_lat: float
+    max_lon: float
+    max_lat: float
+
+    def contains(self, latitude: float, longitude: float) -> bool:
+        return (
+            self.min_lat <= latitude <= self.max_lat
+            and self.min_lon <= longitude <= self.max_lon
+        )
+
+
+def unit_vectors(latitudes, longitudes) -> np.ndarray:
+    """Points on the unit sphere; chord length there orders pairs like haversine distance."""
+    lat = np.radians(np.asarray(latitudes, dtype=np.float64))
+    lon = np.radians(np.asarray(longitudes, dtype=np.float64))
+    cos_lat = np.cos(lat)
+    return np.column_stack((cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)))
+
+
+def haversine_km(latitude: float, longitude: float, latitudes, longitudes) -> np.ndarray:
+    """Great-circle distances from one point to each of ``latitudes``/``longitudes``."""
+    lat1 = np.radians(latitude)
+    lat2 = np.radians(np.asarray(latitudes, dtype=np.float64))
+    dlat = lat2 - lat1
+    dlon = np.radians(np.asarray(longitudes, dtype=np.float64) - longitude)
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
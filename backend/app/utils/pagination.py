@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import base64
+import json
+from datetime import date
+from typing import Tuple
+
+Cursor = Tuple[date, int, int]
+
+
+def encode_cursor(observed_on: date, station_id: int, record_id: int) -> str:
+    """Encode a ``(date, station_id, id)`` keyset position as an opaque token."""
+    payload = json.dumps([observed_on.isoformat(), station_id, record_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str) -> Cursor:
+    """Decode a token produced by :func:`encode_cursor`."""
+    padded = token + "=" * (-len(token) % 4)
+    raw = base64.urlsafe_b64decode(padded.encode("ascii"))
+    observed_on, station_id, record_id = json.loads(raw)
+    if not isinstance(station_id, int) or not isinstance(record_id, int):
+        raise ValueError("Cursor identifiers must be integers")
+    return date.fromisoformat(observed_on), station_id, record_id
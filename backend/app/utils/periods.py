@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Tuple
+
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.types import String
+
+ROLLUP_GRANULARITIES = ("weekly", "monthly", "yearly")
+
+_strftime_formats = {
+    "daily": "%Y-%m-%d",
+    "weekly": "%Y-W%W",
+    "monthly": "%Y-%m",
+    "yearly": "%Y",
+}
+
+_to_char_formats = {
+    "daily": "YYYY-MM-DD",
+    "monthly": "YYYY-MM",
+    "yearly": "YYYY",
+}
+
+
+class _PeriodKey(FunctionElement):
+    """Dialect-specific SQL for :func:`period_key`; one subclass per granularity."""
+
+    type = String()
+    inherit_cache = True
+    granularity = "monthly"
+
+
+class _DailyKey(_PeriodKey):
+    inherit_cache = True
+    granularity = "daily"
+
+
+class _WeeklyKey(_PeriodKey):
+    inherit_cache = True
+    granularity = "weekly"
+
+
+class _MonthlyKey(_PeriodKey):
+    inherit_cache = True
+    granularity = "monthly"
+
+
+class _YearlyKey(_PeriodKey):
+    inherit_cache = True
+    granularity = "yearly"
+
+
+_period_key_types = {
+    key_type.granularity: key_type
+    for key_type in (_DailyKey, _WeeklyKey, _MonthlyKey, _YearlyKey)
+}
+
+
+@compiles(_PeriodKey)
+def _compile_strftime(element, compiler, **kw):
+    column = compiler.process(element.clauses, **kw)
+    return f"strftime('{_strftime_formats[element.granularity]}', {column})"
+
+
+@compiles(_PeriodKey, "postgresql")
+def _compile_to_char(element, compiler, **kw):
+    column = compiler.process(element.clauses, **kw)
+    if element.granularity == "weekly":
+        # %W: weeks start on Monday and days before the first Monday are week 00.
+        week = f"(CAST(EXTRACT(DOY FROM {column}) AS INTEGER) + 7 - CAST(EXTRACT(ISODOW FROM {column}) AS INTEGER)) / 7"
+        return f"to_char({column}, 'YYYY') || '-W' || lpad(CAST({week} AS TEXT), 2, '0')"
+    return f"to_char({column}, '{_to_char_formats[element.granularity]}')"
+
+
+def period_expression(granularity: str, column):
+    """SQL expression bucketing ``column`` into the period key for ``granularity``."""
+    return _period_key_types.get(granularity, _MonthlyKey)(column)
+
+
+def period_key(granularity: str, value: date) -> str:
+    """Python equivalent of :func:`period_expression` for a single date."""
+    return value.strftime(_strftime_formats.get(granularity, _strftime_formats["monthly"]))
+
+
+def period_bounds(granularity: str, value: date) -> Tuple[date, date]:
+    """Return the first and last day of the period containing ``value``.
+
+    Weeks follow ``%W`` (Monday-first, days before the first Monday are week 00)
+    and are clipped to the calendar year, matching the SQL bucketing.
+    """
+    if granularity == "daily":
+        return value, value
+    if granularity == "yearly":
+        return date(value.year, 1, 1), date(value.year, 12, 31)
+    if granularity == "weekly":
+        monday = value - timedelta(days=value.weekday())
+        start = max(monday, date(value.year, 1, 1))
+        end = min(monday + timedelta(days=6), date(value.year, 12, 31))
+        return start, end
+    start = value.replace(day=1)
+    next_month = date(start.year + (start.month == 12), start.month % 12 + 1, 1)
+    return start, next_month - timedelta(days=1)
+
+
+def period_count(granularity: str, start: date, end: date) -> int:
+    """Number of ``granularity`` periods overlapping ``start``..``end`` inclusive."""
+    count = 0
+    current = start
+    while current <= end:
+        count += 1
+        current = period_bounds(granularity, current)[1] + timedelta(days=1)
+    return count
+
+
+def bounds_from_key(granularity: str, key: str) -> Tuple[date, date]:
+    """Return the period bounds for a key produced by :func:`period_key`."""
+    if granularity == "yearly":
+        return period_bounds(granularity, date(int(key), 1, 1))
+    if granularity == "weekly":
+        year, week = key.split("-W")
+        jan_first = date(int(year), 1, 1)
+        if int(week) == 0:
+            return period_bounds(granularity, jan_first)
+        first_monday = jan_first + timedelta(days=(7 - jan_first.weekday()) % 7)
+        return period_bounds(granularity, first_monday + timedelta(weeks=int(week) - 1))
+    if granularity == "monthly":
+        year, month = key.split("-")
+        return period_bounds(granularity, date(int(year), int(month), 1))
+    value = date.fromisoformat(key)
+    return value, value
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import struct
+import zlib
+
+import numpy as np
+
+_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def encode_rgba(pixels: np.ndarray, *, level: int = 6) -> bytes:
+    """Encode an ``(height, width, 4)`` uint8 array as an 8-bit RGBA PNG."""
+    height, width, channels = pixels.shape
+    if channels != 4:
+        raise ValueError("encode_rgba expects four channels")
+    # Every scanline starts with filter type 0 (none).
+    scanlines = np.zeros((height, width * 4 + 1), dtype=np.uint8)
+    scanlines[:, 1:] = pixels.reshape(height, width * 4)
+    header = struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)
+    return b"".join((
+        _SIGNATURE,
+        _chunk(b"IHDR", header),
+        _chunk(b"IDAT", zlib.compress(scanlines.tobytes(), level)),
+        _chunk(b"IEND", b""),
+    ))
+
+
+def _chunk(kind: bytes, data: bytes) -> bytes:
+    crc = zlib.crc32(data, zlib.crc32(kind))
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", crc)
@@ -0,0 +1,37 @@
+"""Owner-only directories and files for state other local users must not touch.
+
+Cache entries are unpickled and lock files gate computations, so a file an
+attacker can create or rewrite would let them run code in (or stall) the API.
+"""
+
+from __future__ import annotations
+
+import os
+import stat
+
+
+def ensure_private_directory(path: str) -> str:
+    """Create ``path`` as ``0700`` if missing; refuse one another user could write into."""
+    path = os.path.abspath(path)
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    info = os.stat(path)
+    if info.st_uid != os.getuid():
+        raise PermissionError(f"{path} is owned by uid {info.st_uid}, not this process")
+    if info.st_mode & (stat.S_IWGRP | stat.S_IWOTH) and not info.st_mode & stat.S_ISVTX:
+        raise PermissionError(f"{path} is writable by other users")
+    return path
+
+
+def ensure_private_file(path: str) -> str:
+    """Create ``path`` as ``0600`` inside a private directory; refuse a file we do not own."""
+    path = os.path.abspath(path)
+    ensure_private_directory(os.path.dirname(path))
+    descriptor = os.open(path, os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+    try:
+        info = os.fstat(descriptor)
+        if info.st_uid != os.getuid():
+            raise PermissionError(f"{path} is owned by uid {info.st_uid}, not this process")
+        os.fchmod(descriptor, 0o600)
+    finally:
+        os.close(descriptor)
+    return path
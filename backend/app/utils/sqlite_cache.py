@@ -0,0 +1,278 @@
+"""Flask-Caching backend shared by every worker on a host through one SQLite file.
+
+Select it with ``CACHE_TYPE=app.utils.sqlite_cache.SQLiteCache``. Entries are
+pickled into a WAL-mode database at ``CACHE_SQLITE_PATH``; each write is a
+single transaction, so readers never see a partial value. Triggers keep a
+running byte total, and writes evict expired then least recently used entries
+until it is back under ``CACHE_SQLITE_MAX_BYTES``.
+
+Because entries are unpickled, the file must be private to the API's user:
+it is created ``0600`` in a ``0700`` directory and refused if anyone else
+owns it. SQLite errors (a busy lock, a full disk, a corrupt file) are logged
+and treated as misses or failed writes, never raised into a request.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from flask import Flask
+from flask_caching.backends.base import BaseCache
+
+from app.utils.logging import get_logger
+from app.utils.private_files import ensure_private_file
+
+logger = get_logger(__name__)
+
+# Reads refresh an entry's LRU position at most this often, so hits rarely write.
+ACCESS_RESOLUTION_SECONDS = 60.0
+_EVICTION_BATCH = 64
+
+_SCHEMA = """
+BEGIN IMMEDIATE;
+CREATE TABLE IF NOT EXISTS cache_entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_cache_entries_accessed_at ON cache_entries (accessed_at);
+CREATE TABLE IF NOT EXISTS cache_usage (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    bytes INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO cache_usage (id, bytes) VALUES (0, 0);
+CREATE TRIGGER IF NOT EXISTS cache_entries_added AFTER INSERT ON cache_entries
+BEGIN
+    UPDATE cache_usage SET bytes = bytes + NEW.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS cache_entries_removed AFTER DELETE ON cache_entries
+BEGIN
+    UPDATE cache_usage SET bytes = bytes - OLD.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS cache_entries_resized AFTER UPDATE OF size ON cache_entries
+BEGIN
+    UPDATE cache_usage SET bytes = bytes + NEW.size - OLD.size WHERE id = 0;
+END;
+COMMIT;
+"""
+
+
+class SQLiteCache(BaseCache):
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 256 * 1024 * 1024,
+        default_timeout: int = 300,
+        busy_timeout: float = 5.0,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(default_timeout=default_timeout, **kwargs)
+        self._path = path
+        self._max_bytes = max_bytes
+        self._busy_timeout = busy_timeout
+        self._local = threading.local()
+        ensure_private_file(path)
+        self._connection().executescript(_SCHEMA)
+
+    @classmethod
+    def factory(
+        cls, app: Flask, config: Dict[str, Any], args: List[Any], kwargs: Dict[str, Any]
+    ) -> "SQLiteCache":
+        kwargs.pop("ignore_delete_many_errors", None)
+        return cls(
+            config["CACHE_SQLITE_PATH"],
+            max_bytes=config.get("CACHE_SQLITE_MAX_BYTES", 256 * 1024 * 1024),
+            **kwargs,
+        )
+
+    def get(self, key: str) -> Any:
+        now = time.time()
+        try:
+            row = self._connection().execute(
+                "SELECT value, expires_at, accessed_at FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error:
+            logger.warning("Cache read failed; treating as a miss", exc_info=True)
+            return None
+        if row is None:
+            return None
+        value, expires_at, accessed_at = row
+        if expires_at is not None and expires_at <= now:
+            return None
+        if now - accessed_at >= ACCESS_RESOLUTION_SECONDS:
+            self._touch(key, now)
+        try:
+            return pickle.loads(value)
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        return self._store(key, value, timeout, overwrite=True)
+
+    def add(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        return self._store(key, value, timeout, overwrite=False)
+
+    def delete(self, key: str) -> bool:
+        try:
+            with self._transaction() as connection:
+                deleted = connection.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+        except sqlite3.Error:
+            logger.warning("Cache delete failed", exc_info=True)
+            return False
+        return deleted.rowcount > 0
+
+    def has(self, key: str) -> bool:
+        try:
+            row = self._connection().execute(
+                "SELECT 1 FROM cache_entries "
+                "WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (key, time.time()),
+            ).fetchone()
+        except sqlite3.Error:
+            logger.warning("Cache lookup failed; treating as a miss", exc_info=True)
+            return False
+        return row is not None
+
+    def clear(self) -> bool:
+        try:
+            with self._transaction() as connection:
+                connection.execute("DELETE FROM cache_entries")
+        except sqlite3.Error:
+            logger.warning("Cache clear failed", exc_info=True)
+            return False
+        return True
+
+    def usage(self) -> Optional[Dict[str, int]]:
+        """Entry count and stored bytes, shared by every worker using the file."""
+        try:
+            connection = self._connection()
+            used = self._used(connection)
+            (entries,) = connection.execute("SELECT COUNT(*) FROM cache_entries").fetchone()
+        except sqlite3.Error:
+            logger.warning("Cache usage query failed", exc_info=True)
+            return None
+        return {"entries": entries, "bytes": used, "max_bytes": self._max_bytes}
+
+    def _store(self, key: str, value: Any, timeout: Optional[int], *, overwrite: bool) -> bool:
+        payload = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        if len(payload) > self._max_bytes:
+            return False
+        now = time.time()
+        timeout = self._normalize_timeout(timeout)
+        expires_at = now + timeout if timeout else None
+        try:
+            return self._write(key, payload, expires_at, now, overwrite=overwrite)
+        except sqlite3.Error:
+            logger.warning("Cache write failed; value not stored", exc_info=True)
+            return False
+
+    def _write(
+        self, key: str, payload: bytes, expires_at: Optional[float], now: float, *, overwrite: bool
+    ) -> bool:
+        with self._transaction() as connection:
+            if not overwrite:
+                # An expired entry does not block add().
+                connection.execute(
+                    "DELETE FROM cache_entries WHERE key = ? AND expires_at <= ?", (key, now)
+                )
+            conflict = (
+                "DO UPDATE SET value = excluded.value, size = excluded.size, "
+                "expires_at = excluded.expires_at, accessed_at = excluded.accessed_at"
+                if overwrite
+                else "DO NOTHING"
+            )
+            stored = connection.execute(
+                "INSERT INTO cache_entries (key, value, size, expires_at, accessed_at) "
+                f"VALUES (?, ?, ?, ?, ?) ON CONFLICT (key) {conflict}",
+                (key, payload, len(payload), expires_at, now),
+            )
+            if stored.rowcount:
+                self._evict(connection, now, keep=key)
+        return stored.rowcount > 0
+
+    def _touch(self, key: str, now: float) -> None:
+        """Best-effort LRU refresh on a no-wait connection; skipped while a writer holds the lock."""
+        try:
+            self._connection("touch").execute(
+                "UPDATE cache_entries SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+        except sqlite3.Error:
+            pass
+
+    def _evict(self, connection: sqlite3.Connection, now: float, *, keep: str) -> None:
+        """Drop expired, then least recently used entries until usage fits ``max_bytes``."""
+        if self._used(connection) <= self._max_bytes:
+            return
+        connection.execute(
+            "DELETE FROM cache_entries WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,)
+        )
+        excess = self._used(connection) - self._max_bytes
+        while excess > 0:
+            victims = connection.execute(
+                "SELECT key, size FROM cache_entries WHERE key != ? "
+                "ORDER BY accessed_at LIMIT ?",
+                (keep, _EVICTION_BATCH),
+            ).fetchall()
+            if not victims:
+                break
+            for victim, size in victims:
+                connection.execute("DELETE FROM cache_entries WHERE key = ?", (victim,))
+                excess -= size
+                if excess <= 0:
+                    break
+
+    @staticmethod
+    def _used(connection: sqlite3.Connection) -> int:
+        return connection.execute("SELECT bytes FROM cache_usage WHERE id = 0").fetchone()[0]
+
+    def _connection(self, role: str = "main") -> sqlite3.Connection:
+        # One connection per role, thread and process; gunicorn forks after import.
+        # The "touch" role never waits for the write lock.
+        if getattr(self._local, "pid", None) != os.getpid():
+            self._local.__dict__.clear()
+            self._local.pid = os.getpid()
+        connection = getattr(self._local, role, None)
+        if connection is None:
+            connection = sqlite3.connect(
+                self._path,
+                timeout=self._busy_timeout if role == "main" else 0,
+                isolation_level=None,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            setattr(self._local, role, connection)
+        return connection
+
+    def _transaction(self) -> "_Transaction":
+        return _Transaction(self._connection())
+
+
+class _Transaction:
+    """``BEGIN IMMEDIATE`` ... ``COMMIT``, rolled back if the block raises."""
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self._connection = connection
+
+    def __enter__(self) -> sqlite3.Connection:
+        self._connection.execute("BEGIN IMMEDIATE")
+        return self._connection
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is None:
+            try:
+                self._connection.execute("COMMIT")
+                return
+            except sqlite3.Error:
+                # A failed COMMIT (e.g. a full disk) can leave the transaction open.
+                if self._connection.in_transaction:
+                    self._connection.execute("ROLLBACK")
+                raise
+        if self._connection.in_transaction:
+            self._connection.execute("ROLLBACK")
@@ -5,14 +5,24 @@ from typing import Optional, Sequence, Tuple
 
 from flask import jsonify
 
+from app.utils.geo import BoundingBox
+from app.utils.pagination import Cursor, decode_cursor
+
 VALID_STATES = ["ACT", "NSW", "NT", "QLD", "SA", "TAS", "VIC", "WA"]
 VALID_METRICS = ["temperature", "rainfall", "humidity", "wind", "evapotranspiration"]
 VALID_AGGREGATIONS = ["daily", "weekly", "monthly", "yearly"]
+VALID_CORRELATION_METHODS = ["pearson", "spearman"]
+VALID_DASHBOARD_SECTIONS = ["heatmap", "aggregate", "summary", "statistics"]
+VALID_TILE_METHODS = ["idw", "gaussian"]
+VALID_TILE_FORMATS = ["png", "f16"]
 
 MIN_DATE = datetime(2019, 1, 1).date()
 MAX_DATE = datetime(2025, 8, 31).date()
 DEFAULT_PAGE_SIZE = 500
 MAX_PAGE_SIZE = 2000
+MAX_ZOOM = 22
+DEFAULT_NEIGHBOURS = 4
+MAX_NEIGHBOURS = 32
 
 
 def validate_date(date_str: Optional[str], param_name: str = "date"):
@@ -64,6 +74,13 @@ def validate_metrics(metrics_str: Optional[str]) -> Optional[Sequence[str]]:
     return metrics
 
 
+def validate_metric(metric: Optional[str], default: str = "temperature") -> str:
+    metric = (metric or default).lower()
+    if metric not in VALID_METRICS:
+        raise ValueError(f"Invalid metric: {metric}")
+    return metric
+
+
 def validate_aggregation(agg: Optional[str]) -> str:
     if not agg:
         return "monthly"
@@ -75,6 +92,17 @@ def validate_aggregation(agg: Optional[str]) -> str:
     return aggregation
 
 
+def validate_correlation_method(method: Optional[str]) -> str:
+    if not method:
+        return "pearson"
+    correlation_method = method.lower()
+    if correlation_method not in VALID_CORRELATION_METHODS:
+        raise ValueError(
+            f"Invalid correlation_method. Must be one of: {', '.join(VALID_CORRELATION_METHODS)}"
+        )
+    return correlation_method
+
+
 def validate_pagination(page_str: Optional[str], page_size_str: Optional[str]) -> Tuple[int, int]:
     try:
         page = int(page_str) if page_str else 1
@@ -94,6 +122,120 @@ def validate_pagination(page_str: Optional[str], page_size_str: Optional[str]) -
     return page, page_size
 
 
+def validate_cursor(cursor_str: Optional[str]) -> Optional[Cursor]:
+    if not cursor_str:
+        return None
+    try:
+        return decode_cursor(cursor_str)
+    except (ValueError, TypeError) as exc:
+        raise ValueError("Invalid cursor. Use the next_cursor value from a previous page.") from exc
+
+
+def validate_flag(value: Optional[str], param_name: str, default: bool = False) -> bool:
+    if value is None or value == "":
+        return default
+    lowered = value.lower()
+    if lowered in ("1", "true", "yes"):
+        return True
+    if lowered in ("0", "false", "no"):
+        return False
+    raise ValueError(f"{param_name} must be true or false")
+
+
+def validate_bbox(bbox_str: Optional[str]) -> Optional[BoundingBox]:
+    if not bbox_str:
+        return None
+    try:
+        values = [float(part) for part in bbox_str.split(",")]
+    except ValueError as exc:
+        raise ValueError("Invalid bbox format. Use min_lon,min_lat,max_lon,max_lat.") from exc
+    if len(values) != 4:
+        raise ValueError("Invalid bbox format. Use min_lon,min_lat,max_lon,max_lat.")
+
+    bbox = BoundingBox(*values)
+    if not (-180 <= bbox.min_lon <= 180 and -180 <= bbox.max_lon <= 180):
+        raise ValueError("bbox longitudes must be between -180 and 180")
+    if not (-90 <= bbox.min_lat <= 90 and -90 <= bbox.max_lat <= 90):
+        raise ValueError("bbox latitudes must be between -90 and 90")
+    if bbox.min_lon > bbox.max_lon or bbox.min_lat > bbox.max_lat:
+        raise ValueError("bbox minimums must not exceed maximums")
+    return bbox
+
+
+def validate_zoom(zoom_str: Optional[str]) -> Optional[int]:
+    if zoom_str is None or zoom_str == "":
+        return None
+    try:
+        zoom = int(zoom_str)
+    except ValueError as exc:
+        raise ValueError("zoom must be an integer") from exc
+    if zoom < 0 or zoom > MAX_ZOOM:
+        raise ValueError(f"zoom must be between 0 and {MAX_ZOOM}")
+    return zoom
+
+
+def validate_coordinate(value: Optional[str], param_name: str, limit: float) -> float:
+    if value is None or value == "":
+        raise ValueError(f"{param_name} is required")
+    try:
+        coordinate = float(value)
+    except ValueError as exc:
+        raise ValueError(f"{param_name} must be a number") from exc
+    if not -limit <= coordinate <= limit:
+        raise ValueError(f"{param_name} must be between -{limit:g} and {limit:g}")
+    return coordinate
+
+
+def validate_neighbours(k_str: Optional[str]) -> int:
+    if k_str is None or k_str == "":
+        return DEFAULT_NEIGHBOURS
+    try:
+        k = int(k_str)
+    except ValueError as exc:
+        raise ValueError("k must be an integer") from exc
+    if k < 1 or k > MAX_NEIGHBOURS:
+        raise ValueError(f"k must be between 1 and {MAX_NEIGHBOURS}")
+    return k
+
+
+def validate_sections(sections_str: Optional[str]) -> Sequence[str]:
+    if not sections_str:
+        return list(VALID_DASHBOARD_SECTIONS)
+    sections = list(dict.fromkeys(
+        section.strip().lower() for section in sections_str.split(",") if section.strip()
+    ))
+    invalid = [section for section in sections if section not in VALID_DASHBOARD_SECTIONS]
+    if invalid or not sections:
+        raise ValueError(
+            f"Invalid sections: {', '.join(invalid)}. "
+            f"Valid options: {', '.join(VALID_DASHBOARD_SECTIONS)}"
+        )
+    return sections
+
+
+def validate_tile(z: int, x: int, y: int) -> None:
+    if z > MAX_ZOOM:
+        raise ValueError(f"Tile zoom must be between 0 and {MAX_ZOOM}")
+    if x >= 2 ** z or y >= 2 ** z:
+        raise ValueError(f"Tile x and y must be below {2 ** z} at zoom {z}")
+
+
+def validate_tile_method(method: Optional[str]) -> str:
+    method = (method or "idw").lower()
+    if method not in VALID_TILE_METHODS:
+        raise ValueError(
+            f"Invalid method: {method}. Valid options: {', '.join(VALID_TILE_METHODS)}"
+        )
+    return method
+
+
+def validate_tile_format(fmt: Optional[str]) -> str:
+    fmt = (fmt or "png").lower()
+    if fmt not in VALID_TILE_FORMATS:
+        raise ValueError(f"Invalid format: {fmt}. Valid options: {', '.join(VALID_TILE_FORMATS)}")
+    return fmt
+
+
 def handle_validation_error(error):
     return jsonify({
         "error": "Validation Error",
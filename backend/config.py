@@ -10,9 +10,60 @@ class Config:
     )
     CACHE_TYPE = os.getenv("CACHE_TYPE", "SimpleCache")
     CACHE_DEFAULT_TIMEOUT = int(os.getenv("CACHE_DEFAULT_TIMEOUT", 300))
+    # Per-route response cache lifetimes (seconds); routes not listed use the default.
+    CACHE_ROUTE_TIMEOUTS = {
+        "states": 3600,
+        "stations": 3600,
+        "station": 3600,
+        "clusters": 600,
+        "weather": 300,
+        "heatmap": 600,
+        "point": 600,
+        "summary": 600,
+        "aggregate": 600,
+        "frames": 600,
+        "statistics": 600,
+    }
+    # Expensive routes whose concurrent misses share one computation (see cache_service).
+    # With a cache shared between workers, leaders coordinate through flock files here.
+    CACHE_COALESCE_ROUTES = ("summary", "statistics")
+    # Cache state stays out of world-writable /tmp: the directories are created 0700 and
+    # refused when another user owns them (cached entries are unpickled).
+    INSTANCE_DIR = os.getenv("INSTANCE_DIR", os.path.join(BASE_DIR, "instance"))
+    CACHE_LOCK_DIR = os.getenv("CACHE_LOCK_DIR", os.path.join(INSTANCE_DIR, "cache-locks"))
+    CACHE_COALESCE_TIMEOUT = int(os.getenv("CACHE_COALESCE_TIMEOUT", 60))
+    # Host-wide store for CACHE_TYPE=app.utils.sqlite_cache.SQLiteCache, shared by all workers.
+    CACHE_SQLITE_PATH = os.getenv(
+        "CACHE_SQLITE_PATH", os.path.join(INSTANCE_DIR, "cache.sqlite3")
+    )
+    CACHE_SQLITE_MAX_BYTES = int(os.getenv("CACHE_SQLITE_MAX_BYTES", 256 * 1024 * 1024))
+    # Server database pools are per gunicorn worker: keep
+    # GUNICORN_WORKERS * (DB_POOL_SIZE + DB_MAX_OVERFLOW) below the server's max_connections.
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 5))
+    DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", 30))
+    # SQLite serving profile, applied to every pooled connection by database_service.
+    # SQLITE_IMMUTABLE opens the file read-only without locking and is only safe when
+    # nothing writes to it while the API runs (no incremental ingest).
+    SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+    SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", 256 * 1024 * 1024))
+    SQLITE_CACHE_SIZE_KIB = int(os.getenv("SQLITE_CACHE_SIZE_KIB", 64 * 1024))
+    SQLITE_TEMP_STORE = os.getenv("SQLITE_TEMP_STORE", "MEMORY")
+    SQLITE_QUERY_ONLY = os.getenv("SQLITE_QUERY_ONLY", "0") == "1"
+    SQLITE_IMMUTABLE = os.getenv("SQLITE_IMMUTABLE", "0") == "1"
+    # How often each worker re-reads the dataset version written by init_db.py.
+    DATASET_VERSION_CHECK_SECONDS = int(os.getenv("DATASET_VERSION_CHECK_SECONDS", 30))
+    # Browser/CDN lifetime for reads pinned to the current dataset with ?version=.
+    PINNED_CACHE_MAX_AGE = int(os.getenv("PINNED_CACHE_MAX_AGE", 365 * 24 * 3600))
+    # Threads per worker running /dashboard sections; each holds a pooled connection.
+    DASHBOARD_MAX_WORKERS = int(os.getenv("DASHBOARD_MAX_WORKERS", 4))
+    # Rendered heatmap tiles are kept per worker, keyed by dataset version.
+    TILE_CACHE_MAX_ENTRIES = int(os.getenv("TILE_CACHE_MAX_ENTRIES", 512))
+    TILE_CACHE_TTL = int(os.getenv("TILE_CACHE_TTL", 3600))
     MAX_CONTENT_LENGTH = int(os.getenv("REQUEST_MAX_BYTES", 2 * 1024 * 1024))
     COMPRESS_MIMETYPES = [
         "application/json",
+        "application/octet-stream",
         "text/css",
         "text/html",
         "text/javascript",
@@ -34,6 +85,10 @@ class TestingConfig(Config):
 
 class ProductionConfig(Config):
     DEBUG = False
+    # API workers never write; init_db.py uses its own connection.
+    SQLITE_QUERY_ONLY = os.getenv("SQLITE_QUERY_ONLY", "1") == "1"
+    # Gunicorn workers share cached responses instead of each warming its own.
+    CACHE_TYPE = os.getenv("CACHE_TYPE", "app.utils.sqlite_cache.SQLiteCache")
     CACHE_DEFAULT_TIMEOUT = int(os.getenv("CACHE_DEFAULT_TIMEOUT", 600))
     CORS_ORIGINS = [origin.strip() for origin in os.getenv("CORS_ORIGINS", "").split(",") if origin]
 
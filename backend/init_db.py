@@ -1,16 +1,28 @@
 from __future__ import annotations
 
 import argparse
+import io
 import logging
 import os
-from typing import Tuple
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from typing import Callable, Dict, Iterable, Iterator, NamedTuple, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
 import pyarrow.parquet as pq
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import create_engine, insert, inspect, select
 from sqlalchemy.orm import sessionmaker
 
 from app.models import Base, Station, WeatherData
+from app.repositories import RollupRepository, StationLatestRepository, WatermarkRepository
+from app.services.dataset_service import bump_dataset_version, ensure_dataset_version
+from config import Config, config_by_name
 
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -20,12 +32,54 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.path.join(BASE_DIR, "data")
 DEFAULT_DB_URL = f"sqlite:///{os.path.join(BASE_DIR, 'bom_data.db')}"
 
+STATION_KEY_COLUMNS = ["State", "Station Name"]
+STATION_COLUMNS = [*STATION_KEY_COLUMNS, "Latitude", "Longitude"]
+
+# Parquet column -> weather_data column, in insert order after station_id/date.
+WEATHER_METRIC_MAPPING = {
+    "Evapo-Transpiration (mm)": "evapotranspiration_mm",
+    "Rain (mm)": "rainfall_mm",
+    "Maximum Temperature (C)": "temp_max_c",
+    "Minimum Temperature (C)": "temp_min_c",
+    "Maximum Relative Humidity (%)": "humidity_max_percent",
+    "Minimum Relative Humidity (%)": "humidity_min_percent",
+    "Average 10m Wind Speed (m/s)": "wind_speed_ms",
+}
+WEATHER_METRIC_SOURCES = list(WEATHER_METRIC_MAPPING)
+WEATHER_SOURCE_COLUMNS = [*STATION_KEY_COLUMNS, "Date", *WEATHER_METRIC_SOURCES]
+WEATHER_INSERT_COLUMNS = ("station_id", "date", *WEATHER_METRIC_MAPPING.values())
+
+# station_id -> (first, last) ISO date touched by an ingest.
+AffectedSpans = Dict[int, Tuple[str, str]]
+
+# Transformed batches waiting for the writer, per worker process.
+_IN_FLIGHT_PER_WORKER = 2
+
+_worker_station_lookup: Optional[pd.DataFrame] = None
+
+
+class WeatherColumns(NamedTuple):
+    """A transformed batch as arrays in ``WEATHER_INSERT_COLUMNS`` order.
+
+    Workers hand these back instead of row tuples: a few contiguous buffers
+    pickle in a fraction of the time, and the writer builds rows only once.
+    """
+
+    station_ids: np.ndarray  # int64
+    dates: np.ndarray  # ISO "YYYY-MM-DD" strings
+    metrics: np.ndarray  # float64, one row per metric column, NaN where missing
+
+    @property
+    def size(self) -> int:
+        return len(self.station_ids)
+
+    def rows(self) -> Iterator[Tuple]:
+        """Positional DB-API parameters; SQLite binds the NaN placeholders as NULL."""
+        return zip(self.station_ids.tolist(), self.dates.tolist(), *self.metrics.tolist())
+
 
 def _resolve_database_url() -> str:
-    database_url = os.getenv("DATABASE_URL", DEFAULT_DB_URL)
-    if not database_url.startswith("sqlite"):
-        raise RuntimeError("init_db.py currently supports only SQLite DATABASE_URL values")
-    return database_url
+    return os.getenv("DATABASE_URL", DEFAULT_DB_URL)
 
 
 def _database_has_data(session_factory) -> bool:
@@ -38,12 +92,27 @@ def _database_has_data(session_factory) -> bool:
 def _prepare_engine(database_url: str):
     engine = create_engine(database_url, echo=False, future=True)
     url = engine.url
-    if url.database:
+    if engine.dialect.name != "sqlite":
+        return engine
+    if url.database and os.path.dirname(url.database):
         os.makedirs(os.path.dirname(url.database), exist_ok=True)
+    if Config.SQLITE_JOURNAL_MODE:
+        # journal_mode is stored in the file, so API workers opened with
+        # query_only or immutable=1 inherit it without needing write access.
+        with engine.connect() as connection:
+            connection.exec_driver_sql(f"PRAGMA journal_mode={Config.SQLITE_JOURNAL_MODE}")
     return engine
 
 
-def init_database(force: bool = False) -> Tuple[int, int]:
+def _checkpoint(engine) -> None:
+    """Fold the WAL back into the main file; immutable readers never look at the WAL."""
+    if engine.dialect.name != "sqlite":
+        return
+    with engine.connect() as connection:
+        connection.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+
+
+def init_database(force: bool = False, workers: int = 1) -> Tuple[int, int]:
     database_url = _resolve_database_url()
     engine = _prepare_engine(database_url)
     Session = sessionmaker(bind=engine, autoflush=False, future=True)
@@ -54,94 +123,496 @@ def init_database(force: bool = False) -> Tuple[int, int]:
 
     if not force and has_tables and _database_has_data(Session):
         logger.info("Existing weather data detected - skipping reinitialisation")
+        Base.metadata.create_all(engine)
+        _ensure_derived_tables(Session)
         return 0, 0
 
     logger.info("Creating BOM database at %s", database_url)
     Base.metadata.drop_all(engine)
     Base.metadata.create_all(engine)
 
+    with engine.begin() as connection:
+        station_lookup = _load_stations(
+            connection, os.path.join(DATA_DIR, "bomstationsdb.parquet")
+        )
+        station_count = len(station_lookup)
+        logger.info("Inserted %s stations", station_count)
+
+        logger.info("Loading weather data from Parquet in batches...")
+        weather_count = _load_weather(
+            connection,
+            os.path.join(DATA_DIR, "bomweatherdata.parquet"),
+            station_lookup,
+            batch_size=int(os.getenv("INIT_DB_BATCH_SIZE", "50000")),
+            workers=workers,
+        )
+
+    logger.info("Inserted %s weather records in total", weather_count)
+
     session = Session()
+    _build_rollups(session)
+    _build_station_latest(session)
+    WatermarkRepository(session).rebuild()
+    bump_dataset_version(session)
+    session.commit()
 
-    logger.info("Loading stations from Parquet...")
-    stations_df = pd.read_parquet(os.path.join(DATA_DIR, "bomstationsdb.parquet"))
+    session.close()
+    _checkpoint(engine)
+    _invalidate_response_cache()
+    logger.info("Database initialization complete!")
+    return station_count, weather_count
+
+
+def ingest_incremental(
+    parquet_paths: Sequence[str], *, stations_path: Optional[str] = None, workers: int = 1
+) -> Tuple[int, int]:
+    """Upsert new observation files into an existing database.
+
+    Rows are matched on ``uq_weather_station_date`` so re-running a file is a
+    no-op, and only the rollups, snapshots and watermarks of the stations and
+    dates present in the files are recomputed.
+    """
+    database_url = _resolve_database_url()
+    engine = _prepare_engine(database_url)
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine, autoflush=False, future=True)
 
-    station_map = {}
-    for _, row in stations_df.iterrows():
-        station = Station(
-            state=row["State"],
-            station_name=row["Station Name"],
-            latitude=row["Latitude"],
-            longitude=row["Longitude"],
+    with Session() as session:
+        connection = session.connection()
+        station_count = _add_missing_stations(
+            connection, stations_path or os.path.join(DATA_DIR, "bomstationsdb.parquet")
         )
-        session.add(station)
-        session.flush()
-        station_map[(row["State"], row["Station Name"])] = station.id
+        station_lookup = _station_lookup(connection)
+
+        affected: AffectedSpans = {}
+        weather_count = 0
+        for parquet_path in parquet_paths:
+            logger.info("Upserting weather data from %s", parquet_path)
+            weather_count += _load_weather(
+                connection,
+                parquet_path,
+                station_lookup,
+                batch_size=int(os.getenv("INIT_DB_BATCH_SIZE", "50000")),
+                upsert=True,
+                affected=affected,
+                workers=workers,
+            )
+
+        if not affected and not station_count:
+            logger.info("No new stations or observations found - nothing to refresh")
+            return 0, 0
+
+        _refresh_derived_tables(session, affected)
+        bump_dataset_version(session)
+        session.commit()
+
+    _checkpoint(engine)
+    _invalidate_response_cache()
+    logger.info(
+        "Incremental ingest complete: %s new stations, %s observations upserted",
+        station_count,
+        weather_count,
+    )
+    return station_count, weather_count
+
+
+def _refresh_derived_tables(session, affected: AffectedSpans) -> None:
+    if not affected:
+        return
+    station_ids = sorted(affected)
+    start_date = date.fromisoformat(min(first for first, _ in affected.values()))
+    end_date = date.fromisoformat(max(last for _, last in affected.values()))
+    logger.info(
+        "Refreshing derived tables for %s stations between %s and %s",
+        len(station_ids),
+        start_date,
+        end_date,
+    )
+
+    rollups = RollupRepository(session)
+    if rollups.is_ready():
+        rollups.refresh(station_ids=station_ids, start_date=start_date, end_date=end_date)
+    else:
+        rollups.rebuild()
+
+    latest = StationLatestRepository(session)
+    if latest.is_ready():
+        latest.refresh(station_ids=station_ids)
+    else:
+        latest.rebuild()
+
+    WatermarkRepository(session).refresh(station_ids=station_ids)
+
+
+def _load_stations(connection, parquet_path: str) -> pd.DataFrame:
+    """Insert every station and return the ``(State, Station Name) -> station_id`` lookup."""
+    stations_df = pd.read_parquet(parquet_path, columns=STATION_COLUMNS)
+    stations_df["station_id"] = np.arange(1, len(stations_df) + 1, dtype=np.int64)
+    _insert_stations(connection, stations_df)
+    if connection.dialect.name == "postgresql":
+        # Explicit ids bypass the serial sequence; move it past them for later inserts.
+        connection.exec_driver_sql(
+            "SELECT setval(pg_get_serial_sequence('stations', 'id'), (SELECT MAX(id) FROM stations))"
+        )
+
+    # Duplicate names resolve to the last station, as the row-by-row loader did.
+    return stations_df[[*STATION_KEY_COLUMNS, "station_id"]].drop_duplicates(
+        STATION_KEY_COLUMNS, keep="last"
+    )
+
+
+def _add_missing_stations(connection, parquet_path: str) -> int:
+    """Insert stations from ``parquet_path`` that are not in the database yet."""
+    if not os.path.exists(parquet_path):
+        logger.warning("Station file %s not found - only known stations will be loaded", parquet_path)
+        return 0
+
+    stations_df = pd.read_parquet(parquet_path, columns=STATION_COLUMNS)
+    merged = stations_df.merge(
+        _station_lookup(connection), on=STATION_KEY_COLUMNS, how="left", sort=False
+    )
+    missing = merged[merged["station_id"].isna()].drop_duplicates(
+        STATION_KEY_COLUMNS, keep="last"
+    )
+    if not missing.empty:
+        _insert_stations(connection, missing.drop(columns="station_id"))
+        logger.info("Inserted %s new stations", len(missing))
+    return len(missing)
+
+
+def _insert_stations(connection, stations_df: pd.DataFrame) -> None:
+    records = {
+        "state": stations_df["State"].tolist(),
+        "station_name": stations_df["Station Name"].tolist(),
+        "latitude": stations_df["Latitude"].tolist(),
+        "longitude": stations_df["Longitude"].tolist(),
+    }
+    if "station_id" in stations_df:
+        records["id"] = stations_df["station_id"].tolist()
+    connection.execute(
+        insert(Station.__table__),
+        [dict(zip(records, values)) for values in zip(*records.values())],
+    )
 
-    session.commit()
-    station_count = len(station_map)
-    logger.info("Inserted %s stations", station_count)
 
-    logger.info("Loading weather data from Parquet in batches...")
-    parquet_path = os.path.join(DATA_DIR, "bomweatherdata.parquet")
+def _station_lookup(connection) -> pd.DataFrame:
+    rows = connection.execute(
+        select(Station.state, Station.station_name, Station.id).order_by(Station.id)
+    ).all()
+    lookup = pd.DataFrame(rows, columns=[*STATION_KEY_COLUMNS, "station_id"])
+    return lookup.drop_duplicates(STATION_KEY_COLUMNS, keep="last")
+
+
+def _load_weather(
+    connection,
+    parquet_path: str,
+    station_lookup: pd.DataFrame,
+    *,
+    batch_size: int,
+    upsert: bool = False,
+    affected: Optional[AffectedSpans] = None,
+    workers: int = 1,
+) -> int:
+    """Stream the weather Parquet file into ``weather_data`` one Arrow batch at a time.
+
+    With ``workers > 1`` the Arrow-to-column conversion runs in a process pool
+    and this connection stays the only writer.
+    """
     parquet_file = pq.ParquetFile(parquet_path)
+    available = set(parquet_file.schema_arrow.names)
+    columns = [column for column in WEATHER_SOURCE_COLUMNS if column in available]
+    # Upserts only overwrite the metrics the file actually carries.
+    updates = [
+        WEATHER_METRIC_MAPPING[source] for source in columns if source in WEATHER_METRIC_MAPPING
+    ]
+    write_rows = _weather_writer(connection, updates=updates if upsert else None)
+    batches = parquet_file.iter_batches(batch_size=batch_size, columns=columns)
+
+    if workers > 1:
+        transformed = _transform_in_pool(batches, station_lookup, workers)
+    else:
+        transformed = (_transform_batch(batch, station_lookup) for batch in batches)
 
-    batch_size = int(os.getenv("INIT_DB_BATCH_SIZE", "10000"))
     weather_count = 0
+    started = time.perf_counter()
+    for batch_index, (batch, spans, unmatched) in enumerate(transformed, start=1):
+        write_started = time.perf_counter()
+        if batch.size:
+            write_rows(batch)
+        write_elapsed = time.perf_counter() - write_started
+
+        if affected is not None:
+            _merge_spans(affected, spans)
+        weather_count += batch.size
+        elapsed = time.perf_counter() - started
+        logger.info(
+            "Inserted batch %s (%s records, %s unmatched, %.0f rows/s written, %.0f rows/s overall) "
+            "- total %s",
+            batch_index,
+            batch.size,
+            unmatched,
+            batch.size / write_elapsed if write_elapsed else 0.0,
+            weather_count / elapsed if elapsed else 0.0,
+            weather_count,
+        )
+    return weather_count
+
+
+def _transform_in_pool(
+    batches: Iterable[pa.RecordBatch], station_lookup: pd.DataFrame, workers: int
+) -> Iterator[Tuple[WeatherColumns, AffectedSpans, int]]:
+    """Transform batches in ``workers`` processes, yielding results in file order.
+
+    At most ``workers * _IN_FLIGHT_PER_WORKER`` batches are queued so a slow
+    writer applies back-pressure instead of buffering the whole file in memory.
+    """
+    in_flight = deque()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_transform_worker,
+        initargs=(station_lookup,),
+    ) as pool:
+        for record_batch in batches:
+            if len(in_flight) >= workers * _IN_FLIGHT_PER_WORKER:
+                yield in_flight.popleft().result()
+            in_flight.append(pool.submit(_transform_batch, record_batch))
+        while in_flight:
+            yield in_flight.popleft().result()
+
+
+def _init_transform_worker(station_lookup: pd.DataFrame) -> None:
+    global _worker_station_lookup
+    _worker_station_lookup = station_lookup
+
+
+def _transform_batch(
+    record_batch: pa.RecordBatch, station_lookup: Optional[pd.DataFrame] = None
+) -> Tuple[WeatherColumns, AffectedSpans, int]:
+    lookup = station_lookup if station_lookup is not None else _worker_station_lookup
+    batch, spans = _weather_columns(record_batch.to_pandas(), lookup)
+    return batch, spans, record_batch.num_rows - batch.size
+
+
+def _weather_columns(
+    batch_df: pd.DataFrame, station_lookup: pd.DataFrame
+) -> Tuple[WeatherColumns, AffectedSpans]:
+    """Turn a raw Parquet batch into columns matching ``WEATHER_INSERT_COLUMNS``.
+
+    Also returns the first and last date seen for each station in the batch.
+    """
+    frame = batch_df.merge(station_lookup, on=STATION_KEY_COLUMNS, how="inner", sort=False)
+    metrics = np.full((len(WEATHER_METRIC_SOURCES), len(frame)), np.nan)
+    if frame.empty:
+        return WeatherColumns(np.empty(0, dtype=np.int64), np.empty(0, dtype="U10"), metrics), {}
+
+    # Arrow's strptime is an order of magnitude faster than pd.to_datetime + strftime.
+    parsed = pc.strptime(pa.array(frame["Date"], type=pa.string()), format="%d/%m/%Y", unit="s")
+    dates = pd.Series(
+        parsed.cast(pa.date32()).cast(pa.string()).to_numpy(zero_copy_only=False),
+        index=frame.index,
+    )
+    spans = {
+        int(station_id): (first, last)
+        for station_id, first, last in dates.groupby(frame["station_id"])
+        .agg(["min", "max"])
+        .itertuples(name=None)
+    }
+
+    for index, source in enumerate(WEATHER_METRIC_SOURCES):
+        if source in frame:
+            metrics[index] = frame[source].to_numpy(dtype=np.float64, na_value=np.nan)
+    batch = WeatherColumns(
+        frame["station_id"].to_numpy(dtype=np.int64),
+        dates.to_numpy(dtype="U10"),
+        metrics,
+    )
+    return batch, spans
 
-    for batch_index, record_batch in enumerate(parquet_file.iter_batches(batch_size=batch_size), start=1):
-        batch_df = record_batch.to_pandas()
-        batch_df["Date"] = pd.to_datetime(batch_df["Date"], format="%d/%m/%Y")
-        columns = batch_df.columns.tolist()
-
-        weather_records = []
-        for values in batch_df.itertuples(index=False, name=None):
-            row = dict(zip(columns, values))
-            station_id = station_map.get((row["State"], row["Station Name"]))
-            if not station_id:
-                continue
-            date_value = row["Date"].date() if hasattr(row["Date"], "date") else row["Date"]
-            weather_records.append(
-                {
-                    "station_id": station_id,
-                    "date": date_value,
-                    "evapotranspiration_mm": row.get("Evapo-Transpiration (mm)"),
-                    "rainfall_mm": row.get("Rain (mm)"),
-                    "temp_max_c": row.get("Maximum Temperature (C)"),
-                    "temp_min_c": row.get("Minimum Temperature (C)"),
-                    "humidity_max_percent": row.get("Maximum Relative Humidity (%)"),
-                    "humidity_min_percent": row.get("Minimum Relative Humidity (%)"),
-                    "wind_speed_ms": row.get("Average 10m Wind Speed (m/s)"),
-                }
-            )
 
-        if weather_records:
-            session.bulk_insert_mappings(WeatherData, weather_records)
-            session.commit()
-            weather_count += len(weather_records)
-            logger.info(
-                "Inserted batch %s (%s records) – total %s",
-                batch_index,
-                len(weather_records),
-                weather_count,
-            )
+def _merge_spans(affected: AffectedSpans, spans: AffectedSpans) -> None:
+    for station_id, (first, last) in spans.items():
+        current = affected.get(station_id)
+        affected[station_id] = (
+            (first, last) if current is None else (min(current[0], first), max(current[1], last))
+        )
 
-    logger.info("Inserted %s weather records in total", weather_count)
 
-    session.close()
-    logger.info("Database initialization complete!")
-    return station_count, weather_count
+def _weather_writer(
+    connection, *, updates: Optional[Sequence[str]] = None
+) -> Callable[[WeatherColumns], None]:
+    """Return the fastest bulk write path the connection's driver offers.
+
+    ``updates`` switches to upsert mode, overwriting those columns on conflict.
+    """
+    if connection.dialect.name == "postgresql":
+        return lambda batch: _copy_weather_rows(connection, batch, updates=updates)
+    statement = _weather_insert_sql(connection.dialect.paramstyle, updates=updates)
+    return lambda batch: connection.exec_driver_sql(statement, list(batch.rows()))
+
+
+def _copy_weather_rows(
+    connection, batch: WeatherColumns, *, updates: Optional[Sequence[str]] = None
+) -> None:
+    """Stream a batch through PostgreSQL ``COPY``; upserts go via a staging table."""
+    table = pa.table(
+        {
+            "station_id": batch.station_ids,
+            "date": batch.dates,
+            **{
+                column: pa.array(values, from_pandas=True)
+                for column, values in zip(WEATHER_INSERT_COLUMNS[2:], batch.metrics)
+            },
+        }
+    )
+    # NaN metrics become nulls, written as unquoted empty fields that COPY reads as NULL.
+    sink = pa.BufferOutputStream()
+    pa_csv.write_csv(table, sink, write_options=pa_csv.WriteOptions(include_header=False))
+    buffer = io.BytesIO(sink.getvalue().to_pybytes())
+
+    columns = ", ".join(WEATHER_INSERT_COLUMNS)
+    cursor = connection.connection.cursor()
+    try:
+        if updates is None:
+            _copy_from(cursor, f"{WeatherData.__tablename__} ({columns})", buffer)
+            return
+
+        cursor.execute(
+            f"CREATE TEMP TABLE IF NOT EXISTS weather_staging AS "
+            f"SELECT {columns} FROM {WeatherData.__tablename__} WITH NO DATA"
+        )
+        cursor.execute("TRUNCATE weather_staging")
+        _copy_from(cursor, f"weather_staging ({columns})", buffer)
+        # ON CONFLICT may touch each key once per statement, so keep one row per key.
+        cursor.execute(
+            f"INSERT INTO {WeatherData.__tablename__} ({columns}) "
+            f"SELECT DISTINCT ON (station_id, date) {columns} FROM weather_staging "
+            f"ORDER BY station_id, date{_upsert_clause(updates)}"
+        )
+    finally:
+        cursor.close()
+
+
+def _copy_from(cursor, target: str, buffer: io.BytesIO) -> None:
+    statement = f"COPY {target} FROM STDIN WITH (FORMAT csv)"
+    if hasattr(cursor, "copy_expert"):  # psycopg2
+        cursor.copy_expert(statement, buffer)
+        return
+    with cursor.copy(statement) as copy:  # psycopg 3
+        copy.write(buffer.getvalue())
+
+
+def _upsert_clause(updates: Sequence[str]) -> str:
+    # Conflict target matches uq_weather_station_date; SQLite and PostgreSQL share this syntax.
+    if not updates:
+        return " ON CONFLICT (station_id, date) DO NOTHING"
+    assignments = ", ".join(f"{column} = excluded.{column}" for column in updates)
+    return f" ON CONFLICT (station_id, date) DO UPDATE SET {assignments}"
+
+
+def _weather_insert_sql(paramstyle: str, *, updates: Optional[Sequence[str]] = None) -> str:
+    if paramstyle == "qmark":
+        placeholders = ["?"] * len(WEATHER_INSERT_COLUMNS)
+    elif paramstyle == "numeric":
+        placeholders = [f":{index}" for index in range(1, len(WEATHER_INSERT_COLUMNS) + 1)]
+    else:
+        placeholders = ["%s"] * len(WEATHER_INSERT_COLUMNS)
+    statement = (
+        f"INSERT INTO {WeatherData.__tablename__} ({', '.join(WEATHER_INSERT_COLUMNS)}) "
+        f"VALUES ({', '.join(placeholders)})"
+    )
+    if updates is not None:
+        statement += _upsert_clause(updates)
+    return statement
+
+
+def _build_rollups(session) -> None:
+    logger.info("Building weekly/monthly/yearly rollups...")
+    rollup_count = RollupRepository(session).rebuild()
+    session.commit()
+    logger.info("Inserted %s rollup rows", rollup_count)
+
+
+def _build_station_latest(session) -> None:
+    logger.info("Building latest observation snapshot...")
+    latest_count = StationLatestRepository(session).rebuild()
+    session.commit()
+    logger.info("Stored latest observations for %s stations", latest_count)
+
+
+def _ensure_derived_tables(session_factory) -> None:
+    """Backfill derived tables and the dataset version for databases created before they existed."""
+    with session_factory() as session:
+        rebuilt = False
+        if not RollupRepository(session).is_ready():
+            _build_rollups(session)
+            rebuilt = True
+        if not StationLatestRepository(session).is_ready():
+            _build_station_latest(session)
+            rebuilt = True
+        if not WatermarkRepository(session).fetch_watermarks():
+            WatermarkRepository(session).rebuild()
+        if rebuilt:
+            # Backfilled tables change what the API serves, so workers must re-key.
+            bump_dataset_version(session)
+        else:
+            ensure_dataset_version(session)
+        session.commit()
+    if rebuilt:
+        _invalidate_response_cache()
+
+
+def _invalidate_response_cache() -> None:
+    """Clear a shared response cache so no worker serves data from before the load.
+
+    Process-local backends cannot be reached from here; workers using them drop
+    their entries when they see the new dataset version.
+    """
+    from app import create_app
+    from app.services import cache_service
+
+    config_name = os.getenv("FLASK_CONFIG", "development")
+    if not cache_service.is_shared_backend(config_by_name[config_name].CACHE_TYPE):
+        return
+    try:
+        app = create_app(config_name)
+    except RuntimeError as exc:
+        logger.warning("Skipping response cache invalidation: %s", exc)
+        return
+    with app.app_context():
+        cache_service.invalidate_all()
 
 
 def _parse_args() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description="Initialise the BOM weather SQLite database")
+    parser = argparse.ArgumentParser(description="Initialise the BOM weather database")
     parser.add_argument(
         "--force",
         action="store_true",
         help="Rebuild the database even if existing data is detected",
     )
+    parser.add_argument(
+        "--incremental",
+        nargs="+",
+        metavar="PARQUET",
+        help="Upsert observations from these Parquet files instead of rebuilding",
+    )
+    parser.add_argument(
+        "--stations",
+        metavar="PARQUET",
+        help="Station file used to add new stations during --incremental "
+        "(defaults to data/bomstationsdb.parquet)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("INIT_DB_WORKERS", "1")),
+        help="Processes used to convert Parquet batches (the database writer stays single)",
+    )
     return parser.parse_args()
 
 
 if __name__ == "__main__":
     args = _parse_args()
-    init_database(force=args.force)
+    if args.incremental:
+        ingest_incremental(args.incremental, stations_path=args.stations, workers=args.workers)
+    else:
+        init_database(force=args.force, workers=args.workers)
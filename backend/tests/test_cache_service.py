@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import pytest
+from flask import Flask
+
+from app.services import cache_service
+
+
+def test_build_cache_key_normalises_parameters():
+    first = cache_service.build_cache_key(
+        "summary", station_ids=[3, 1, 2], metrics=["Temperature"], state=None
+    )
+    second = cache_service.build_cache_key(
+        "summary", station_ids=[1, 2, 3, 3], metrics=["temperature"]
+    )
+    assert first == second
+    assert first != cache_service.build_cache_key("statistics", station_ids=[1, 2, 3])
+
+
+def test_build_cache_key_keeps_positional_and_opaque_values():
+    cursor = (date(2024, 1, 1), 7, 7)
+    assert cache_service.build_cache_key("weather", cursor=cursor) != cache_service.build_cache_key(
+        "weather", cursor=(date(2024, 1, 1), 7)
+    )
+    assert cache_service.build_cache_key("x", token="AbC") != cache_service.build_cache_key(
+        "x", token="abc"
+    )
+
+
+def test_build_cache_key_distinguishes_dates():
+    january = cache_service.build_cache_key("heatmap", start_date=date(2024, 1, 1))
+    february = cache_service.build_cache_key("heatmap", start_date=date(2024, 2, 1))
+    assert january != february
+
+
+def test_route_responses_are_cached(test_app: Flask, sample_data):
+    cache_service.reset_stats()
+    client = test_app.test_client()
+
+    first = client.get("/api/v1/weather/heatmap?metric=Temperature")
+    second = client.get("/api/v1/weather/heatmap?metric=temperature")
+    assert first.get_json() == second.get_json()
+
+    stats = client.get("/api/v1/cache/stats").get_json()
+    assert stats["routes"]["heatmap"] == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+
+def test_invalidate_all_clears_entries(test_app: Flask, sample_data):
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"value": len(calls)}
+
+    assert cache_service.get_or_compute("states", compute) == {"value": 1}
+    assert cache_service.get_or_compute("states", compute) == {"value": 1}
+    cache_service.invalidate_all()
+    assert cache_service.get_or_compute("states", compute) == {"value": 2}
+
+
+def test_concurrent_misses_share_one_computation(test_app: Flask):
+    cache_service.invalidate_all()
+    cache_service.reset_stats()
+    calls = []
+    started = threading.Event()
+
+    def compute():
+        calls.append(1)
+        started.set()
+        time.sleep(0.2)
+        return {"value": len(calls)}
+
+    def request():
+        with test_app.app_context():
+            return cache_service.get_or_compute("summary", compute, state="vic")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        leader = pool.submit(request)
+        started.wait()
+        followers = [pool.submit(request) for _ in range(7)]
+        results = [leader.result()] + [future.result() for future in followers]
+
+    assert calls == [1]
+    assert results == [{"value": 1}] * 8
+    assert cache_service.get_stats()["routes"]["summary"]["misses"] == 1
+    cache_service.invalidate_all()
+
+
+def test_coalesced_failures_reach_every_waiter(test_app: Flask):
+    started = threading.Event()
+
+    def compute():
+        started.set()
+        time.sleep(0.1)
+        raise RuntimeError("scan failed")
+
+    def request():
+        with test_app.app_context():
+            return cache_service.get_or_compute("statistics", compute, state="nsw")
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        leader = pool.submit(request)
+        started.wait()
+        follower = pool.submit(request)
+        for future in (leader, follower):
+            with pytest.raises(RuntimeError):
+                future.result()
+
+
+def test_worker_lease_waits_for_other_holders(test_app: Flask, tmp_path, monkeypatch):
+    monkeypatch.setitem(test_app.config, "CACHE_TYPE", "FileSystemCache")
+    monkeypatch.setitem(test_app.config, "CACHE_LOCK_DIR", str(tmp_path))
+    key = cache_service.build_cache_key("summary", state="vic")
+    acquired = threading.Event()
+
+    with cache_service._worker_lease(key):
+        assert len(list(tmp_path.iterdir())) == 1
+
+        # The thread opens its own file description, so flock treats it like another worker.
+        def take_lease():
+            with test_app.app_context(), cache_service._worker_lease(key):
+                acquired.set()
+
+        thread = threading.Thread(target=take_lease)
+        thread.start()
+        assert not acquired.wait(0.2)
+    thread.join(timeout=2)
+    assert acquired.is_set()
+
+
+def test_worker_leases_only_serialise_identical_keys(test_app: Flask, tmp_path, monkeypatch):
+    monkeypatch.setitem(test_app.config, "CACHE_TYPE", "FileSystemCache")
+    monkeypatch.setitem(test_app.config, "CACHE_LOCK_DIR", str(tmp_path))
+    monkeypatch.setitem(test_app.config, "CACHE_COALESCE_TIMEOUT", 5)
+    summary_key = cache_service.build_cache_key("summary", state="vic")
+    statistics_key = cache_service.build_cache_key("statistics", state="vic")
+    acquired = threading.Event()
+
+    with cache_service._worker_lease(summary_key):
+
+        def take_other_lease():
+            with test_app.app_context(), cache_service._worker_lease(statistics_key):
+                acquired.set()
+
+        thread = threading.Thread(target=take_other_lease)
+        thread.start()
+        assert acquired.wait(1)
+        thread.join(timeout=2)
+
+    assert list(tmp_path.iterdir()) == []
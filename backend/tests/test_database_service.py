@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.services.database_service import create_database_engine
+from config import Config
+
+
+class ServingConfig(Config):
+    SQLITE_JOURNAL_MODE = "WAL"
+    SQLITE_MMAP_SIZE = 1024 * 1024
+    SQLITE_CACHE_SIZE_KIB = 2048
+    SQLITE_TEMP_STORE = "MEMORY"
+    SQLITE_QUERY_ONLY = False
+    SQLITE_IMMUTABLE = False
+
+
+def _pragma(connection, name):
+    return connection.execute(text(f"PRAGMA {name}")).scalar()
+
+
+def test_sqlite_profile_applies_pragmas_on_connect(tmp_path):
+    engine = create_database_engine(f"sqlite:///{tmp_path / 'serving.db'}", ServingConfig)
+    with engine.connect() as connection:
+        assert _pragma(connection, "journal_mode") == "wal"
+        assert _pragma(connection, "mmap_size") == 1024 * 1024
+        assert _pragma(connection, "cache_size") == -2048
+        assert _pragma(connection, "temp_store") == 2
+        assert _pragma(connection, "query_only") == 0
+    engine.dispose()
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [{"SQLITE_QUERY_ONLY": True}, {"SQLITE_IMMUTABLE": True}],
+)
+def test_read_only_profiles_reject_writes(tmp_path, overrides):
+    database_url = f"sqlite:///{tmp_path / 'serving.db'}"
+    writer = create_database_engine(database_url, ServingConfig)
+    with writer.begin() as connection:
+        connection.execute(text("CREATE TABLE readings (value REAL)"))
+        connection.execute(text("INSERT INTO readings VALUES (1.5)"))
+    with writer.connect() as connection:
+        connection.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+    writer.dispose()
+
+    reader = create_database_engine(database_url, type("ReadOnly", (ServingConfig,), overrides))
+    with reader.connect() as connection:
+        assert connection.execute(text("SELECT value FROM readings")).scalar() == 1.5
+        with pytest.raises(OperationalError):
+            connection.execute(text("INSERT INTO readings VALUES (2.0)"))
+    reader.dispose()
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from app.models import Station
+from app.repositories import DatasetMetaRepository
+from app.services import cache_service, dataset_service, station_catalog
+
+
+def test_sync_dataset_version_refreshes_catalog_and_cache(test_app, session, sample_data):
+    dataset_service.sync_dataset_version(force=True)
+    cache_service.get_or_compute("states", lambda: ["VIC"])
+
+    session.add(Station(id=2, state="NSW", station_name="Sydney", latitude=-33.86, longitude=151.21))
+    dataset_service.bump_dataset_version(session)
+    session.commit()
+
+    # Within the check interval the previous version is still served.
+    assert station_catalog.get_catalog().get(2) is None
+
+    version = dataset_service.sync_dataset_version(force=True)
+
+    assert version is not None
+    assert dataset_service.get_dataset_version() == version
+    assert DatasetMetaRepository(session).get(dataset_service.DATASET_VERSION_META_KEY) == version
+    assert station_catalog.get_catalog().get(2).station_name == "Sydney"
+    assert cache_service.get_or_compute("states", lambda: ["VIC", "NSW"]) == ["VIC", "NSW"]
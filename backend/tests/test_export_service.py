@@ -17,3 +17,19 @@ def test_export_weather_csv_respects_limit(sample_data, monkeypatch):
     monkeypatch.setattr(export_service, "MAX_EXPORT_ROWS", 2)
     with pytest.raises(ValueError):
         export_service.export_weather_csv()
+
+
+def test_stream_weather_csv_chunks(sample_data):
+    chunks = list(export_service.stream_weather_csv(chunk_rows=2))
+    assert len(chunks) == 3
+    lines = "".join(chunks).splitlines()
+    assert lines[0].startswith("State,Station Name,Date")
+    assert len(lines) == 6
+    assert lines[1].startswith("VIC,Melbourne,2024-01-01")
+
+
+def test_stream_weather_csv_no_rows(sample_data):
+    chunks = export_service.stream_weather_csv(
+        start_date="2023-01-01", end_date="2023-01-31"
+    )
+    assert list(chunks) == []
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, text
+
+import init_db
+
+
+@pytest.fixture()
+def parquet_dir(tmp_path):
+    pd.DataFrame(
+        {
+            "State": ["VIC", "NSW"],
+            "Station Name": ["MELBOURNE", "SYDNEY"],
+            "Latitude": [-37.81, -33.86],
+            "Longitude": [144.96, 151.21],
+        }
+    ).to_parquet(tmp_path / "bomstationsdb.parquet")
+    pd.DataFrame(
+        {
+            "State": ["VIC", "VIC", "NSW", "QLD"],
+            "Station Name": ["MELBOURNE", "MELBOURNE", "SYDNEY", "BRISBANE"],
+            "Date": ["01/01/2024", "02/01/2024", "31/12/2023", "01/01/2024"],
+            "Evapo-Transpiration (mm)": [2.0, 3.0, 4.0, 5.0],
+            "Rain (mm)": [0.0, None, 1.5, 2.0],
+            "Maximum Temperature (C)": [25.0, 26.0, 30.0, 31.0],
+            "Minimum Temperature (C)": [15.0, 16.0, 20.0, 21.0],
+            "Maximum Relative Humidity (%)": [70.0, 71.0, 80.0, 81.0],
+            "Minimum Relative Humidity (%)": [40.0, 41.0, 50.0, 51.0],
+            "Average 10m Wind Speed (m/s)": [5.0, 6.0, 7.0, 8.0],
+            "Unused Column": ["a", "b", "c", "d"],
+        }
+    ).to_parquet(tmp_path / "bomweatherdata.parquet")
+    return tmp_path
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_init_database_loads_parquet_in_bulk(parquet_dir, monkeypatch, workers):
+    database_url = f"sqlite:///{parquet_dir / 'bom_data.db'}"
+    monkeypatch.setenv("DATABASE_URL", database_url)
+    monkeypatch.setenv("INIT_DB_BATCH_SIZE", "2")
+    monkeypatch.setattr(init_db, "DATA_DIR", str(parquet_dir))
+    monkeypatch.setattr(init_db, "_invalidate_response_cache", lambda: None)
+
+    assert init_db.init_database(force=True, workers=workers) == (2, 3)
+
+    engine = create_engine(database_url)
+    with engine.connect() as connection:
+        stations = connection.execute(
+            text("SELECT id, state, station_name FROM stations ORDER BY id")
+        ).all()
+        weather = connection.execute(
+            text(
+                "SELECT station_id, date, rainfall_mm, temp_max_c, wind_speed_ms "
+                "FROM weather_data ORDER BY station_id, date"
+            )
+        ).all()
+        rollups = connection.execute(text("SELECT COUNT(*) FROM weather_rollups")).scalar()
+    engine.dispose()
+
+    assert [tuple(row) for row in stations] == [(1, "VIC", "MELBOURNE"), (2, "NSW", "SYDNEY")]
+    assert [tuple(row) for row in weather] == [
+        (1, "2024-01-01", 0.0, 25.0, 5.0),
+        (1, "2024-01-02", None, 26.0, 6.0),
+        (2, "2023-12-31", 1.5, 30.0, 7.0),
+    ]
+    assert rollups > 0
+
+
+def test_incremental_ingest_upserts_and_refreshes_derived_tables(parquet_dir, monkeypatch):
+    database_url = f"sqlite:///{parquet_dir / 'bom_data.db'}"
+    monkeypatch.setenv("DATABASE_URL", database_url)
+    monkeypatch.setattr(init_db, "DATA_DIR", str(parquet_dir))
+    monkeypatch.setattr(init_db, "_invalidate_response_cache", lambda: None)
+    init_db.init_database(force=True)
+
+    engine = create_engine(database_url)
+
+    def dataset_version():
+        with engine.connect() as connection:
+            return connection.execute(
+                text("SELECT value FROM dataset_meta WHERE key = 'dataset_version'")
+            ).scalar()
+
+    initial_version = dataset_version()
+
+    stations_path = parquet_dir / "stations_update.parquet"
+    pd.DataFrame(
+        {
+            "State": ["VIC", "QLD"],
+            "Station Name": ["MELBOURNE", "BRISBANE"],
+            "Latitude": [-37.81, -27.47],
+            "Longitude": [144.96, 153.03],
+        }
+    ).to_parquet(stations_path)
+    update_path = parquet_dir / "update.parquet"
+    pd.DataFrame(
+        {
+            "State": ["VIC", "VIC", "QLD"],
+            "Station Name": ["MELBOURNE", "MELBOURNE", "BRISBANE"],
+            "Date": ["02/01/2024", "03/01/2024", "03/01/2024"],
+            "Rain (mm)": [4.0, 1.0, 9.0],
+            "Maximum Temperature (C)": [27.0, 28.0, 33.0],
+        }
+    ).to_parquet(update_path)
+
+    assert init_db.ingest_incremental(
+        [str(update_path)], stations_path=str(stations_path)
+    ) == (1, 3)
+    # Re-running the same file only rewrites the same rows.
+    assert init_db.ingest_incremental(
+        [str(update_path)], stations_path=str(stations_path)
+    ) == (0, 3)
+
+    with engine.connect() as connection:
+        weather = connection.execute(
+            text(
+                "SELECT station_id, date, rainfall_mm, temp_max_c, evapotranspiration_mm "
+                "FROM weather_data WHERE station_id IN (1, 3) ORDER BY station_id, date"
+            )
+        ).all()
+        watermarks = dict(
+            connection.execute(text("SELECT station_id, max_date FROM station_watermarks")).all()
+        )
+        latest = dict(
+            connection.execute(text("SELECT station_id, temp_max_c FROM station_latest")).all()
+        )
+        january = connection.execute(
+            text(
+                "SELECT row_count, rainfall_mm_sum, temp_max_c_max FROM weather_rollups "
+                "WHERE station_id = 1 AND granularity = 'monthly' AND period = '2024-01'"
+            )
+        ).one()
+    engine.dispose()
+
+    # Metrics missing from the update file keep their stored values.
+    assert [tuple(row) for row in weather] == [
+        (1, "2024-01-01", 0.0, 25.0, 2.0),
+        (1, "2024-01-02", 4.0, 27.0, 3.0),
+        (1, "2024-01-03", 1.0, 28.0, None),
+        (3, "2024-01-03", 9.0, 33.0, None),
+    ]
+    assert watermarks == {1: "2024-01-03", 2: "2023-12-31", 3: "2024-01-03"}
+    assert latest == {1: 28.0, 2: 30.0, 3: 33.0}
+    assert tuple(january) == (3, 5.0, 28.0)
+    assert dataset_version() != initial_version
+
+
+def test_existing_database_gets_a_dataset_version(parquet_dir, monkeypatch):
+    database_url = f"sqlite:///{parquet_dir / 'bom_data.db'}"
+    monkeypatch.setenv("DATABASE_URL", database_url)
+    monkeypatch.setattr(init_db, "DATA_DIR", str(parquet_dir))
+    monkeypatch.setattr(init_db, "_invalidate_response_cache", lambda: None)
+    init_db.init_database(force=True)
+    engine = create_engine(database_url)
+
+    def dataset_version():
+        with engine.connect() as connection:
+            return connection.execute(
+                text("SELECT value FROM dataset_meta WHERE key = 'dataset_version'")
+            ).scalar()
+
+    # A database loaded before dataset versions were recorded.
+    with engine.begin() as connection:
+        connection.execute(text("DELETE FROM dataset_meta WHERE key = 'dataset_version'"))
+    assert init_db.init_database() == (0, 0)
+    initial_version = dataset_version()
+    assert initial_version is not None
+    assert init_db.init_database() == (0, 0)
+    assert dataset_version() == initial_version
+
+    # Backfilling a derived table changes what the API serves.
+    with engine.begin() as connection:
+        connection.execute(text("DELETE FROM dataset_meta WHERE key = 'rollups_built_at'"))
+    init_db.init_database()
+    assert dataset_version() not in (None, initial_version)
+    engine.dispose()
+
+
+def test_response_cache_invalidation_skips_process_local_backends(monkeypatch):
+    import app as app_package
+
+    def fail(*args, **kwargs):
+        raise AssertionError("a process-local cache is not reachable from the ingest process")
+
+    monkeypatch.setenv("FLASK_CONFIG", "testing")
+    monkeypatch.setattr(app_package, "create_app", fail)
+    init_db._invalidate_response_cache()
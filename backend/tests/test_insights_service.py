@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from datetime import date
+
+from app.services import insights_service
+
+
+def test_weather_summary_extremes(sample_data):
+    summary = insights_service.get_weather_summary(metrics=["temperature", "rainfall"])
+
+    assert summary["records_analyzed"] == 5
+    assert summary["stations_covered"] == 1
+    assert summary["coverage"] == {"start": "2024-01-01", "end": "2024-01-05"}
+
+    temperature = summary["metrics"]["temperature_max"]
+    assert temperature["count"] == 5
+    assert temperature["average"] == 27.0
+    assert temperature["max_record"]["date"] == "2024-01-05"
+    assert temperature["max_record"]["value"] == 29.0
+    assert temperature["min_record"]["date"] == "2024-01-01"
+    assert temperature["min_record"]["station_name"] == "Melbourne"
+    assert summary["metrics"]["rainfall"]["min_record"]["value"] == 0.0
+
+
+def test_weather_summary_empty_range(sample_data):
+    summary = insights_service.get_weather_summary(
+        start_date=date(2023, 1, 1), end_date=date(2023, 1, 31)
+    )
+
+    assert summary["records_analyzed"] == 0
+    assert summary["stations_covered"] == 0
+    assert summary["coverage"] == {"start": None, "end": None}
+    assert summary["metrics"]["wind"]["max_record"] is None
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.models import WeatherData
+from app.utils.periods import (
+    bounds_from_key,
+    period_bounds,
+    period_count,
+    period_expression,
+    period_key,
+)
+
+
+@pytest.mark.parametrize(
+    "granularity,sqlite_sql,postgres_sql",
+    [
+        ("daily", "strftime('%Y-%m-%d', weather_data.date)", "to_char(weather_data.date, 'YYYY-MM-DD')"),
+        ("monthly", "strftime('%Y-%m', weather_data.date)", "to_char(weather_data.date, 'YYYY-MM')"),
+        ("yearly", "strftime('%Y', weather_data.date)", "to_char(weather_data.date, 'YYYY')"),
+        ("weekly", "strftime('%Y-W%W', weather_data.date)", "EXTRACT(ISODOW FROM weather_data.date)"),
+    ],
+)
+def test_period_expression_compiles_per_dialect(granularity, sqlite_sql, postgres_sql):
+    stmt = select(period_expression(granularity, WeatherData.date))
+    assert sqlite_sql in str(stmt.compile(dialect=sqlite.dialect()))
+    assert postgres_sql in str(stmt.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.parametrize("granularity", ["weekly", "monthly", "yearly"])
+def test_period_keys_round_trip_to_bounds(granularity):
+    day = date(2019, 12, 25)
+    for _ in range(30):
+        assert bounds_from_key(granularity, period_key(granularity, day)) == period_bounds(granularity, day)
+        day += timedelta(days=3)
+
+
+def test_period_count_matches_distinct_keys():
+    start, end = date(2019, 12, 25), date(2021, 2, 3)
+    days = [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+    for granularity in ("daily", "weekly", "monthly", "yearly"):
+        keys = {period_key(granularity, day) for day in days}
+        assert period_count(granularity, start, end) == len(keys)
+    assert period_count("monthly", end, start) == 0
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from app.models import DatasetMeta, Station, WeatherData, WeatherRollup
+from app.repositories import RollupRepository, WeatherRepository
+from app.services import aggregation_service, station_catalog
+from app.utils.frames import decode_frames, encode_frames
+from app.utils.periods import period_count
+from app.utils.validators import MAX_DATE, MIN_DATE
+
+
+@pytest.fixture()
+def seasonal_data(session):
+    stations = [
+        Station(id=11, state="NSW", station_name="Sydney", latitude=-33.86, longitude=151.2),
+        Station(id=12, state="NSW", station_name="Newcastle", latitude=-32.92, longitude=151.78),
+    ]
+    session.add_all(stations)
+    session.flush()
+
+    first_day = date(2022, 11, 20)
+    records = []
+    for offset in range(500):
+        day = first_day + timedelta(days=offset)
+        for station in stations:
+            records.append(
+                WeatherData(
+                    station_id=station.id,
+                    date=day,
+                    temp_max_c=20.0 + (offset * 7 + station.id) % 13,
+                    rainfall_mm=None if offset % 5 == 0 else float(offset % 9),
+                )
+            )
+    session.add_all(records)
+    session.commit()
+
+    yield stations
+
+    session.query(WeatherRollup).delete()
+    session.query(DatasetMeta).delete()
+    session.query(WeatherData).delete()
+    session.query(Station).delete()
+    session.commit()
+
+
+def _rounded(rows):
+    return sorted(
+        (
+            station_id,
+            name,
+            period,
+            None if avg is None else round(avg, 6),
+            low,
+            high,
+        )
+        for station_id, name, period, avg, low, high in rows
+    )
+
+
+@pytest.mark.parametrize("aggregation", ["weekly", "monthly", "yearly"])
+@pytest.mark.parametrize(
+    "start_date,end_date",
+    [
+        (None, None),
+        (date(2023, 1, 1), date(2023, 12, 31)),
+        (date(2022, 12, 14), date(2024, 2, 3)),
+        (date(2023, 3, 8), date(2023, 3, 21)),
+    ],
+)
+def test_rollups_match_raw_aggregation(session, seasonal_data, aggregation, start_date, end_date):
+    rollups = RollupRepository(session)
+    rollups.rebuild()
+    session.commit()
+    assert rollups.is_ready()
+
+    for metric in (WeatherData.temp_max_c, WeatherData.rainfall_mm):
+        kwargs = dict(
+            metric=metric,
+            aggregation=aggregation,
+            station_ids=[11],
+            start_date=start_date,
+            end_date=end_date,
+        )
+        expected = WeatherRepository(session).fetch_aggregations(**kwargs)
+        assert _rounded(rollups.fetch_aggregations(**kwargs)) == _rounded(expected)
+
+
+def test_refresh_updates_touched_periods(session, seasonal_data):
+    rollups = RollupRepository(session)
+    rollups.rebuild()
+    session.commit()
+
+    row = (
+        session.query(WeatherData)
+        .filter(WeatherData.station_id == 12, WeatherData.date == date(2023, 6, 14))
+        .one()
+    )
+    row.temp_max_c = 99.0
+    session.flush()
+    rollups.refresh(station_ids=[12], start_date=row.date, end_date=row.date)
+    session.commit()
+
+    for aggregation, period in (("weekly", "2023-W24"), ("monthly", "2023-06"), ("yearly", "2023")):
+        result = rollups.fetch_aggregations(
+            metric=WeatherData.temp_max_c, aggregation=aggregation, station_ids=[12]
+        )
+        maxima = {entry[2]: entry[5] for entry in result}
+        assert maxima[period] == 99.0
+    assert session.query(WeatherRollup).filter_by(granularity="monthly").count() == 2 * 18
+
+
+@pytest.mark.parametrize("delta,compress", [(True, True), (False, False)])
+def test_heatmap_frames_match_aggregations(session, seasonal_data, delta, compress):
+    RollupRepository(session).rebuild()
+    session.commit()
+    station_catalog.refresh_catalog()
+
+    payload = aggregation_service.get_heatmap_frames(
+        metric="rainfall",
+        start_date="2023-01-01",
+        end_date="2023-12-31",
+        step="monthly",
+        delta=delta,
+        compress=compress,
+    )
+    header, matrix = decode_frames(payload)
+
+    assert header["periods"] == [f"2023-{month:02d}" for month in range(1, 13)]
+    assert header["stations"] == [[11, -33.86, 151.2], [12, -32.92, 151.78]]
+    assert matrix.shape == (12, 2)
+    expected = aggregation_service.get_aggregated_data(
+        metric="rainfall", aggregation="monthly", start_date="2023-01-01", end_date="2023-12-31"
+    )
+    for item in expected:
+        row = header["periods"].index(item["period"])
+        column = [entry[0] for entry in header["stations"]].index(item["station_id"])
+        assert round(float(matrix[row, column]), 2) == item["avg_value"]
+    station_catalog.refresh_catalog()
+
+
+def test_frames_encoding_is_lossless():
+    matrix = np.array([[1.5, np.nan, -3.25], [1.5, 2.0, -3.5], [np.nan, 2.0, 7.0]], dtype=np.float32)
+    for delta in (True, False):
+        header, decoded = decode_frames(encode_frames(matrix, {"metric": "wind"}, delta=delta))
+        assert header["metric"] == "wind"
+        assert header["encoding"] == ("xor" if delta else "raw")
+        np.testing.assert_array_equal(decoded, matrix)
+
+
+def test_heatmap_frames_endpoint(test_app, sample_data):
+    client = test_app.test_client()
+    response = client.get(
+        "/api/v1/weather/heatmap/frames?metric=temperature&step=daily"
+        "&start_date=2024-01-01&end_date=2024-01-31"
+    )
+    assert response.mimetype == "application/octet-stream"
+    header, matrix = decode_frames(response.data)
+    assert header["periods"][0] == "2024-01-01"
+    assert matrix[:, 0].tolist() == [25.0, 26.0, 27.0, 28.0, 29.0]
+    assert client.get("/api/v1/weather/heatmap/frames?step=hourly").status_code == 400
+
+
+def test_heatmap_frames_reject_oversized_ranges_before_querying(test_app, monkeypatch):
+    def fail(**kwargs):
+        raise AssertionError("oversized ranges must be rejected before querying")
+
+    monkeypatch.setattr(aggregation_service, "_fetch_aggregations", fail)
+    client = test_app.test_client()
+    for query in (
+        "step=daily",
+        "step=daily&start_date=2024-01-01",
+        "step=daily&start_date=2023-01-01&end_date=2024-12-31",
+    ):
+        response = client.get(f"/api/v1/weather/heatmap/frames?{query}")
+        assert response.status_code == 400, query
+
+
+def test_heatmap_frames_open_ranges_use_dataset_bounds(test_app, sample_data):
+    client = test_app.test_client()
+    # The whole validated range in weeks fits under the frame limit.
+    assert period_count("weekly", MIN_DATE, MAX_DATE) <= aggregation_service.MAX_HEATMAP_FRAMES
+
+    response = client.get("/api/v1/weather/heatmap/frames?metric=temperature&step=weekly")
+    assert response.status_code == 200
+    header, _ = decode_frames(response.data)
+    assert header["periods"] == ["2024-W01"]
+
+
+@pytest.mark.parametrize("aggregation", ["daily", "monthly"])
+def test_aggregated_metrics_match_single_metric(session, seasonal_data, aggregation):
+    RollupRepository(session).rebuild()
+    session.commit()
+    filters = dict(
+        station_ids=[11, 12],
+        start_date="2023-01-10",
+        end_date="2023-03-20",
+        aggregation=aggregation,
+    )
+
+    payload = aggregation_service.get_aggregated_metrics(
+        metrics=["temperature", "rainfall"], **filters
+    )
+    assert set(payload["metrics"]) == {"temperature", "rainfall"}
+    for metric in ("temperature", "rainfall"):
+        single = aggregation_service.get_aggregated_data(metric=metric, **filters)
+        columns = payload["metrics"][metric]
+        rows = zip(
+            payload["station_id"], payload["period"], columns["avg"], columns["min"], columns["max"]
+        )
+        assert sorted(rows) == sorted(
+            (item["station_id"], item["period"], *[item[f"{k}_value"] for k in ("avg", "min", "max")])
+            for item in single
+        )
+
+    rainfall = payload["metrics"]["rainfall"]
+    temperature = payload["metrics"]["temperature"]
+    assert sum(rainfall["null_count"]) == sum(
+        1 for offset in range(51, 121) if offset % 5 == 0
+    ) * 2
+    assert sum(temperature["null_count"]) == 0
+    assert [a + b for a, b in zip(rainfall["count"], rainfall["null_count"])] == temperature["count"]
+
+
+def test_aggregate_endpoint_columnar(test_app, sample_data):
+    client = test_app.test_client()
+    payload = client.get(
+        "/api/v1/weather/aggregate?metrics=wind,humidity&aggregation=monthly"
+    ).get_json()
+    assert payload["period"] == ["2024-01"]
+    assert payload["metrics"]["wind"]["avg"] == [7.0]
+    assert payload["metrics"]["humidity"]["max"] == [70.0]
+    assert payload["metrics"]["wind"]["count"] == [5]
+    assert client.get("/api/v1/weather/aggregate?metrics=snow").status_code == 400
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import threading
+from datetime import date
+
 from flask import Flask
 
+from app.services import cache_service, weather_service
+
 
 def test_weather_endpoint_paginated(test_app: Flask, sample_data):
     client = test_app.test_client()
@@ -27,3 +32,226 @@ def test_weather_summary_endpoint(test_app: Flask, sample_data):
     assert payload["records_analyzed"] == 5
     assert "metrics" in payload
     assert "temperature_max" in payload["metrics"]
+
+
+def test_export_endpoint_streams_csv(test_app: Flask, sample_data):
+    client = test_app.test_client()
+    response = client.get("/api/v1/weather/export?metrics=rainfall")
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert response.mimetype == "text/csv"
+    lines = response.get_data(as_text=True).splitlines()
+    assert lines[0] == "State,Station Name,Date,Rainfall (mm)"
+    assert len(lines) == 6
+
+
+def test_export_endpoint_no_data(test_app: Flask, sample_data):
+    client = test_app.test_client()
+    response = client.get("/api/v1/weather/export?start_date=2023-01-01&end_date=2023-01-31")
+    assert response.status_code == 404
+
+
+def test_weather_endpoint_cursor_pagination(test_app: Flask, sample_data):
+    client = test_app.test_client()
+    first = client.get("/api/v1/weather?page_size=3").get_json()
+    cursor = first["pagination"]["next_cursor"]
+
+    response = client.get(f"/api/v1/weather?page_size=3&cursor={cursor}&include_total=true")
+    assert response.status_code == 200
+    payload = response.get_json()
+    assert payload["pagination"]["total_items"] == 5
+    assert payload["pagination"]["has_more"] is False
+    assert [item["date"] for item in payload["items"]] == ["2024-01-04", "2024-01-05"]
+
+    assert client.get("/api/v1/weather?cursor=bogus").status_code == 400
+
+
+def test_dashboard_matches_individual_endpoints(test_app: Flask, sample_data, monkeypatch):
+    threads = set()
+    original = weather_service.get_station_latest_values
+
+    def record_thread(**kwargs):
+        threads.add(threading.current_thread().name)
+        return original(**kwargs)
+
+    monkeypatch.setattr(weather_service, "get_station_latest_values", record_thread)
+    client = test_app.test_client()
+    filters = "station_ids=1&start_date=2024-01-01&end_date=2024-01-05&metric=rainfall"
+
+    dashboard = client.get(
+        f"/api/v1/dashboard?{filters}&aggregation=daily&metrics=wind,rainfall"
+    ).get_json()
+    assert set(dashboard) == {"heatmap", "aggregate", "summary", "statistics"}
+    assert all(name.startswith("dashboard") for name in threads)
+
+    cache_service.reset_stats()
+    assert dashboard["heatmap"] == client.get(f"/api/v1/weather/heatmap?{filters}").get_json()
+    assert dashboard["aggregate"] == client.get(
+        f"/api/v1/weather/aggregate?{filters}&aggregation=daily"
+    ).get_json()["items"]
+    assert dashboard["summary"] == client.get(
+        f"/api/v1/weather/summary?{filters}&metrics=wind,rainfall"
+    ).get_json()
+    assert dashboard["statistics"] == client.get(f"/api/v1/statistics?{filters}").get_json()
+    # The standalone endpoints are served from entries the dashboard cached.
+    assert cache_service.get_stats()["misses"] == 0
+
+
+def test_dashboard_sections(test_app: Flask, sample_data):
+    client = test_app.test_client()
+    payload = client.get("/api/v1/dashboard?sections=summary,aggregate").get_json()
+    assert payload["aggregate"] is None
+    assert payload["summary"]["records_analyzed"] == 5
+    assert client.get("/api/v1/dashboard?sections=map").status_code == 400
+
+
+def test_read_endpoints_revalidate_with_dataset_etags(test_app: Flask, session, sample_data, monkeypatch):
+    from app.services import aggregation_service, dataset_service
+
+    dataset_service.bump_dataset_version(session)
+    session.commit()
+    version = dataset_service.sync_dataset_version(force=True)
+    client = test_app.test_client()
+
+    response = client.get("/api/v1/weather/aggregate?metric=rainfall&aggregation=monthly")
+    etag = response.headers["ETag"]
+    assert response.status_code == 200
+    assert response.headers["X-Dataset-Version"] == version
+    assert response.headers["Cache-Control"] == "public, no-cache"
+
+    # Parameter order and case do not change the validator.
+    reordered = client.get("/api/v1/weather/aggregate?aggregation=MONTHLY&metric=rainfall")
+    assert reordered.headers["ETag"] == etag
+    other = client.get("/api/v1/weather/aggregate?metric=temperature")
+    assert other.headers["ETag"] != etag
+
+    def fail(**kwargs):
+        raise AssertionError("revalidation must not reach the service")
+
+    monkeypatch.setattr(aggregation_service, "get_aggregated_data", fail)
+    monkeypatch.setattr(cache_service, "get_or_compute", fail)
+    revalidated = client.get(
+        "/api/v1/weather/aggregate?metric=rainfall&aggregation=monthly",
+        headers={"If-None-Match": etag},
+    )
+    assert revalidated.status_code == 304
+    assert revalidated.headers["ETag"] == etag
+    assert revalidated.data == b""
+
+    pinned = client.get(
+        f"/api/v1/weather/aggregate?metric=rainfall&aggregation=monthly&version={version}",
+        headers={"If-None-Match": etag},
+    )
+    assert pinned.status_code == 304
+    assert "immutable" in pinned.headers["Cache-Control"]
+
+
+def test_etags_follow_validated_parameters(test_app: Flask, session, sample_data):
+    from app.services import dataset_service
+    from app.utils.pagination import encode_cursor
+
+    dataset_service.bump_dataset_version(session)
+    session.commit()
+    dataset_service.sync_dataset_version(force=True)
+    client = test_app.test_client()
+
+    def etag(url):
+        return client.get(url).headers.get("ETag")
+
+    assert etag("/api/v1/weather/summary?station_ids=1,2") == etag(
+        "/api/v1/weather/summary?station_ids=2,1,2"
+    )
+    assert etag("/api/v1/weather/aggregate?station_ids=1") == etag(
+        "/api/v1/weather/aggregate?station_ids=1&aggregation=monthly&metric=temperature&_=1"
+    )
+    assert etag("/api/v1/weather?cursor=" + encode_cursor(date(2024, 1, 1), 7, 7)) != etag(
+        "/api/v1/weather?cursor=" + encode_cursor(date(2024, 1, 1), 7, 8)
+    )
+    invalid = client.get("/api/v1/weather/summary?state=XX")
+    assert invalid.status_code == 400
+    assert "ETag" not in invalid.headers
+
+
+def test_compressed_responses_revalidate(test_app: Flask, session, sample_data, monkeypatch):
+    from app.services import dataset_service, insights_service
+
+    dataset_service.bump_dataset_version(session)
+    session.commit()
+    dataset_service.sync_dataset_version(force=True)
+    client = test_app.test_client()
+
+    response = client.get("/api/v1/weather/summary", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    etag = response.headers["ETag"]
+    assert etag.endswith(':gzip"')
+
+    def fail(**kwargs):
+        raise AssertionError("revalidation must not reach the service")
+
+    monkeypatch.setattr(insights_service, "get_weather_summary", fail)
+    monkeypatch.setattr(cache_service, "get_or_compute", fail)
+    revalidated = client.get(
+        "/api/v1/weather/summary",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": etag},
+    )
+    assert revalidated.status_code == 304
+    assert revalidated.headers["ETag"] == etag
+
+
+def test_views_keep_their_cache_control(test_app: Flask, session, sample_data):
+    from app.services import dataset_service, tile_service
+
+    dataset_service.bump_dataset_version(session)
+    session.commit()
+    dataset_service.sync_dataset_version(force=True)
+    tile_service.clear_tile_cache()
+    client = test_app.test_client()
+    expected = f"public, max-age={cache_service.get_route_timeout('heatmap')}"
+
+    response = client.get("/api/v1/weather/heatmap/tiles/6/0/0?format=f16")
+    assert response.headers["Cache-Control"] == expected
+    revalidated = client.get(
+        "/api/v1/weather/heatmap/tiles/6/0/0?format=f16",
+        headers={"If-None-Match": response.headers["ETag"]},
+    )
+    assert revalidated.status_code == 304
+    assert revalidated.headers["Cache-Control"] == expected
+    tile_service.clear_tile_cache()
+
+
+def test_dataset_reload_changes_etags(test_app: Flask, session, sample_data):
+    from app.services import dataset_service
+
+    dataset_service.bump_dataset_version(session)
+    session.commit()
+    dataset_service.sync_dataset_version(force=True)
+    client = test_app.test_client()
+    etag = client.get("/api/v1/states").headers["ETag"]
+
+    dataset_service.bump_dataset_version(session)
+    session.commit()
+    dataset_service.sync_dataset_version(force=True)
+
+    response = client.get("/api/v1/states", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert client.get("/api/v1/stations/999999").headers.get("ETag") is None
+
+
+def test_summary_metric_order_shares_a_cache_entry(test_app: Flask, sample_data, monkeypatch):
+    from app.services import insights_service
+
+    cache_service.invalidate_all()
+    calls = []
+    real_summary = insights_service.get_weather_summary
+
+    def counting_summary(**kwargs):
+        calls.append(kwargs["metrics"])
+        return real_summary(**kwargs)
+
+    monkeypatch.setattr(insights_service, "get_weather_summary", counting_summary)
+    client = test_app.test_client()
+    client.get("/api/v1/weather/summary?metrics=rainfall,wind")
+    client.get("/api/v1/weather/summary?metrics=wind,rainfall")
+
+    assert calls == [["rainfall", "wind"]]
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import os
+import pickle
+import sqlite3
+import stat
+import time
+
+import pytest
+from flask import Flask
+
+from app.utils import sqlite_cache
+from app.utils.sqlite_cache import SQLiteCache
+
+
+def _payload_size(value) -> int:
+    return len(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+
+
+def test_values_round_trip_and_are_shared_between_instances(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    first = SQLiteCache(path)
+    second = SQLiteCache(path)
+
+    assert first.set("summary", {"stations": [1, 2]})
+    assert second.get("summary") == {"stations": [1, 2]}
+    assert second.has("summary")
+
+    assert second.delete("summary")
+    assert first.get("summary") is None
+    assert not first.delete("summary")
+
+
+def test_byte_usage_tracks_inserts_updates_and_deletes(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite3"))
+    cache.set("a", "x" * 100)
+    cache.set("b", "y" * 50)
+    assert cache.usage()["bytes"] == _payload_size("x" * 100) + _payload_size("y" * 50)
+
+    cache.set("a", "x" * 10)
+    cache.delete("b")
+    assert cache.usage() == {
+        "entries": 1,
+        "bytes": _payload_size("x" * 10),
+        "max_bytes": 256 * 1024 * 1024,
+    }
+
+    cache.clear()
+    assert cache.usage()["bytes"] == 0
+
+
+def test_writes_evict_least_recently_read_entries(tmp_path, monkeypatch):
+    monkeypatch.setattr(sqlite_cache, "ACCESS_RESOLUTION_SECONDS", 0)
+    value = "v" * 1000
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite3"), max_bytes=_payload_size(value) * 3)
+    for key in ("a", "b", "c"):
+        cache.set(key, value)
+        time.sleep(0.01)
+    assert cache.get("a") == value
+
+    cache.set("d", value)
+
+    assert cache.get("b") is None
+    assert [cache.has(key) for key in ("a", "c", "d")] == [True, True, True]
+    assert cache.usage()["bytes"] <= cache.usage()["max_bytes"]
+
+
+def test_values_larger_than_the_budget_are_rejected(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite3"), max_bytes=64)
+    assert not cache.set("big", "z" * 1000)
+    assert cache.usage()["entries"] == 0
+
+
+def test_expired_entries_are_misses_and_do_not_block_add(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite3"))
+    cache.set("stale", 1, timeout=1)
+    assert not cache.add("stale", 2)
+
+    cache._connection().execute("UPDATE cache_entries SET expires_at = ?", (time.time() - 1,))
+    assert cache.get("stale") is None
+    assert not cache.has("stale")
+    assert cache.add("stale", 3)
+    assert cache.get("stale") == 3
+
+
+def test_flask_caching_builds_the_backend_from_config(tmp_path):
+    from flask_caching import Cache
+
+    app = Flask(__name__)
+    cache = Cache()
+    cache.init_app(
+        app,
+        config={
+            "CACHE_TYPE": "app.utils.sqlite_cache.SQLiteCache",
+            "CACHE_DEFAULT_TIMEOUT": 60,
+            "CACHE_SQLITE_PATH": str(tmp_path / "cache.sqlite3"),
+            "CACHE_SQLITE_MAX_BYTES": 4096,
+        },
+    )
+    with app.app_context():
+        cache.set("key", [1, 2, 3])
+        assert cache.get("key") == [1, 2, 3]
+        assert cache.cache.usage()["max_bytes"] == 4096
+
+
+def test_cache_file_is_private_to_the_process_user(tmp_path):
+    path = tmp_path / "instance" / "cache.sqlite3"
+    SQLiteCache(str(path))
+
+    assert stat.S_IMODE(path.parent.stat().st_mode) == 0o700
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+
+def test_cache_refuses_shared_or_foreign_locations(tmp_path):
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    shared.chmod(0o777)
+    with pytest.raises(PermissionError):
+        SQLiteCache(str(shared / "cache.sqlite3"))
+
+    if os.getuid() != 0:
+        pytest.skip("changing file ownership needs root")
+    planted = tmp_path / "private" / "cache.sqlite3"
+    planted.parent.mkdir(mode=0o700)
+    planted.touch()
+    os.chown(planted, 1, 1)
+    with pytest.raises(PermissionError):
+        SQLiteCache(str(planted))
+
+
+def test_sqlite_errors_degrade_to_misses(tmp_path, monkeypatch):
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite3"))
+    cache.set("key", "value")
+
+    def broken(*args, **kwargs):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(cache, "_connection", broken)
+    assert cache.get("key") is None
+    assert not cache.has("key")
+    assert not cache.set("key", "other")
+    assert not cache.delete("key")
+    assert not cache.clear()
+    assert cache.usage() is None
+
+
+def test_lru_touch_skips_while_another_writer_holds_the_lock(tmp_path, monkeypatch):
+    monkeypatch.setattr(sqlite_cache, "ACCESS_RESOLUTION_SECONDS", 0)
+    path = str(tmp_path / "cache.sqlite3")
+    cache = SQLiteCache(path, busy_timeout=5.0)
+    cache.set("key", "value")
+
+    writer = sqlite3.connect(path, isolation_level=None)
+    writer.execute("BEGIN IMMEDIATE")
+    try:
+        started = time.monotonic()
+        assert cache.get("key") == "value"
+        assert time.monotonic() - started < 1.0
+    finally:
+        writer.execute("ROLLBACK")
+        writer.close()
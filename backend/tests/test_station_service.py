@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from datetime import date
+
+import numpy as np
+from flask import Flask
+
+from app.models import Station, WeatherData
+from app.services import station_catalog, station_service
+from app.utils.geo import BoundingBox, haversine_km
+
+
+def test_station_catalog_lookups(sample_data):
+    station, _ = sample_data
+    catalog = station_catalog.get_catalog()
+
+    assert len(catalog) == 1
+    assert catalog.get(station.id).station_name == "Melbourne"
+    assert catalog.get(999) is None
+    assert catalog.stations("vic") == (catalog.get(station.id),)
+    assert catalog.stations("NSW") == ()
+
+
+def test_station_service_uses_catalog(sample_data):
+    station, _ = sample_data
+    assert station_service.get_states() == ["VIC"]
+    assert station_service.get_station_by_id(station.id) == {
+        "id": station.id,
+        "state": "VIC",
+        "station_name": "Melbourne",
+        "latitude": station.latitude,
+        "longitude": station.longitude,
+    }
+    assert station_service.get_station_by_id(999) is None
+
+
+def test_stations_endpoint(test_app: Flask, sample_data):
+    client = test_app.test_client()
+    payload = client.get("/api/v1/stations?state=vic").get_json()
+    assert payload["count"] == 1
+    assert payload["items"][0]["station_name"] == "Melbourne"
+    assert client.get("/api/v1/stations/999").status_code == 404
+
+
+def _grid_catalog():
+    return station_catalog.StationCatalog(
+        station_catalog.StationRecord(
+            id=row * 10 + col + 1,
+            state="NSW",
+            station_name=f"Station {row}-{col}",
+            latitude=-40.0 + row * 0.5,
+            longitude=140.0 + col * 0.5,
+        )
+        for row in range(10)
+        for col in range(10)
+    )
+
+
+def test_catalog_within_matches_linear_scan():
+    catalog = _grid_catalog()
+    bbox = BoundingBox(min_lon=141.2, min_lat=-38.6, max_lon=143.0, max_lat=-37.0)
+
+    expected = tuple(
+        record for record in catalog.stations() if bbox.contains(record.latitude, record.longitude)
+    )
+    assert catalog.within(bbox) == expected
+    assert len(expected) == 4 * 4
+    assert catalog.within(BoundingBox(0.0, 0.0, 10.0, 10.0)) == ()
+    assert len(catalog.within(BoundingBox(-180.0, -90.0, 180.0, 90.0))) == 100
+
+
+def test_visible_stations_thins_low_zoom_evenly(monkeypatch):
+    monkeypatch.setattr(station_service, "get_catalog", _grid_catalog)
+    monkeypatch.setattr(station_service, "ZOOM_STATION_LIMITS", ((4, 25),))
+
+    thinned = station_service.visible_stations(zoom=3)
+    assert len(thinned) == 25
+    # One station per cell of a 5x5 grid over the 10x10 layout.
+    assert {(round(s.latitude, 1), round(s.longitude, 1)) for s in thinned} == {
+        (-40.0 + row, 140.0 + col) for row in range(5) for col in range(5)
+    }
+    assert len(station_service.visible_stations(zoom=10)) == 100
+
+
+def test_viewport_filters_stations_and_heatmap(test_app: Flask, sample_data):
+    client = test_app.test_client()
+    melbourne = "144.0,-38.5,145.5,-37.0"
+    elsewhere = "150.0,-34.0,151.0,-33.0"
+
+    assert client.get(f"/api/v1/stations?bbox={melbourne}").get_json()["count"] == 1
+    assert client.get(f"/api/v1/stations?bbox={elsewhere}&zoom=5").get_json()["count"] == 0
+
+    heatmap = client.get(f"/api/v1/weather/heatmap?bbox={melbourne}&zoom=5").get_json()
+    assert [row["station_id"] for row in heatmap] == [1]
+    dated = client.get(
+        f"/api/v1/weather/heatmap?bbox={elsewhere}&start_date=2024-01-01&end_date=2024-01-05"
+    ).get_json()
+    assert dated == []
+    assert client.get("/api/v1/weather/heatmap?bbox=1,2,3").status_code == 400
+
+
+def test_catalog_nearest_matches_haversine_scan():
+    catalog = _grid_catalog()
+    records = catalog.stations()
+    distances = haversine_km(
+        -37.3, 142.1, [r.latitude for r in records], [r.longitude for r in records]
+    )
+    expected = [records[i].id for i in np.argsort(distances, kind="stable")[:5]]
+
+    nearest = catalog.nearest(-37.3, 142.1, 5)
+    assert [record.id for record, _ in nearest] == expected
+    assert [distance for _, distance in nearest] == sorted(distance for _, distance in nearest)
+    assert len(catalog.nearest(-37.3, 142.1, 500)) == 100
+    assert station_catalog.StationCatalog([]).nearest(0.0, 0.0, 3) == []
+
+
+def test_nearest_endpoint(test_app: Flask, sample_data):
+    client = test_app.test_client()
+    payload = client.get("/api/v1/stations/nearest?lat=-37.9&lon=145.0&k=3").get_json()
+    assert payload["count"] == 1
+    assert payload["items"][0]["station_name"] == "Melbourne"
+    assert 9 < payload["items"][0]["distance_km"] < 11
+    assert client.get("/api/v1/stations/nearest?lat=-37.9").status_code == 400
+    assert client.get("/api/v1/stations/nearest?lat=-37.9&lon=145&k=0").status_code == 400
+
+
+def test_cluster_levels_nest_across_zooms():
+    catalog = _grid_catalog()
+    previous = None
+    for zoom in range(station_catalog.MAX_CLUSTER_ZOOM + 1):
+        level = catalog.cluster_level(zoom)
+        assert level.counts.sum() == 100
+        if previous is not None:
+            # Every cluster at this zoom belongs to exactly one cluster one zoom out.
+            parents = np.unique(np.column_stack((level.labels, previous.labels)), axis=0)
+            assert len(parents) == len(level.counts)
+            split = np.bincount(parents[:, 1]) > 1
+            assert (previous.expansion_zooms[split] == zoom).all()
+        previous = level
+
+    assert len(catalog.cluster_level(2).counts) < 10
+    assert len(catalog.cluster_level(30).counts) == 100
+    assert (catalog.cluster_level(30).expansion_zooms == -1).all()
+
+
+def test_clusters_endpoint_aggregates_metric(test_app: Flask, session, sample_data):
+    session.add(Station(id=2, state="VIC", station_name="Geelong", latitude=-38.15, longitude=144.36))
+    session.add(WeatherData(station_id=2, date=date(2024, 1, 3), temp_max_c=20.0))
+    session.commit()
+    station_catalog.refresh_catalog()
+    client = test_app.test_client()
+    dates = "start_date=2024-01-01&end_date=2024-01-05"
+
+    payload = client.get(f"/api/v1/stations/clusters?zoom=4&{dates}").get_json()
+    assert payload["count"] == 1
+    cluster = payload["items"][0]
+    assert cluster["count"] == 2
+    assert cluster["station_id"] is None
+    assert cluster["expansion_zoom"] > 4
+    assert cluster["value"] == {"mean": 23.5, "min": 20.0, "max": 27.0}
+
+    zoomed = client.get(f"/api/v1/stations/clusters?zoom=12&bbox=144.5,-38,145.5,-37.5&{dates}")
+    assert [item["station_id"] for item in zoomed.get_json()["items"]] == [1]
+    assert client.get("/api/v1/stations/clusters").status_code == 400
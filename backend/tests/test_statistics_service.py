@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from datetime import date
+
+import numpy as np
+from scipy import stats
+
+from app.models import WeatherData
+from app.repositories import WeatherRepository
+from app.services import statistics_service
+
+
+def test_calculate_statistics(sample_data):
+    result = statistics_service.calculate_statistics()
+
+    assert result["sample_size"] == 5
+    temp_max = result["statistics"]["temp_max"]
+    assert temp_max == {
+        "mean": 27.0,
+        "std": 1.41,
+        "min": 25.0,
+        "max": 29.0,
+        "median": 27.0,
+        "count": 5,
+    }
+
+
+def test_calculate_statistics_insufficient_data(sample_data):
+    result = statistics_service.calculate_statistics(state="NSW")
+    assert result == {"error": "Insufficient data for analysis", "sample_size": 0}
+
+
+def test_fetch_statistics_arrays_marks_missing_values(session, sample_data):
+    station, _ = sample_data
+    session.add(WeatherData(station_id=station.id, date=date(2024, 1, 6), rainfall_mm=3.5))
+    session.commit()
+
+    temp_max, rainfall = WeatherRepository(session).fetch_statistics_arrays(
+        columns=[WeatherData.temp_max_c, WeatherData.rainfall_mm],
+        state="vic",
+        chunk_size=4,
+    )
+
+    assert temp_max.dtype == np.float64
+    assert temp_max.flags["C_CONTIGUOUS"]
+    assert temp_max.size == rainfall.size == 6
+    assert int(np.isnan(temp_max).sum()) == 1
+    assert float(np.nansum(rainfall)) == 13.5
+
+
+def test_correlation_matrix_is_pairwise_complete():
+    rng = np.random.default_rng(7)
+    first = rng.normal(size=200)
+    second = first * 0.6 + rng.normal(size=200)
+    third = rng.normal(size=200)
+    first[::7] = np.nan
+    second[::5] = np.nan
+    third[:150] = np.nan
+
+    for method, reference in (("pearson", stats.pearsonr), ("spearman", stats.spearmanr)):
+        coefficients, p_values, counts = statistics_service._correlation_matrix(
+            [first, second, third], method
+        )
+        assert np.allclose(np.diag(coefficients), 1.0)
+
+        both = ~np.isnan(first) & ~np.isnan(second)
+        assert counts[0, 1] == both.sum()
+        expected = reference(first[both], second[both])
+        assert np.isclose(coefficients[0, 1], expected[0])
+        assert np.isclose(p_values[1, 0], expected[1])
+
+        both = ~np.isnan(first) & ~np.isnan(third)
+        assert counts[0, 2] == both.sum()
+        assert np.isclose(coefficients[2, 0], reference(first[both], third[both])[0])
+
+
+def test_calculate_statistics_correlation_payload(sample_data):
+    result = statistics_service.calculate_statistics(correlation_method="spearman")
+
+    matrix = result["correlation_matrix"]
+    assert matrix["method"] == "spearman"
+    assert matrix["metrics"][0] == "temp_max"
+    assert len(matrix["coefficients"]) == len(matrix["metrics"]) == 7
+    assert matrix["sample_sizes"][0][0] == 5
+    temperature_rainfall = result["correlations"][0]
+    assert temperature_rainfall["pair"] == "Temperature vs Rainfall"
+    assert temperature_rainfall["correlation"] == 1.0
+
+
+def test_pushdown_statistics_match_exact(session, sample_data):
+    station, _ = sample_data
+    for day in range(6, 20):
+        session.add(
+            WeatherData(
+                station_id=station.id,
+                date=date(2024, 1, day),
+                temp_max_c=20.0 + (day * 3.7) % 11,
+                temp_min_c=None if day % 3 == 0 else 10.0 + day % 4,
+                rainfall_mm=None if day % 4 == 0 else round((day * 1.3) % 6, 1),
+                humidity_max_percent=60.0 + day % 9,
+                wind_speed_ms=None if day % 2 else 3.0 + day / 10,
+            )
+        )
+    session.commit()
+
+    pushdown = statistics_service.calculate_statistics()
+    exact = statistics_service.calculate_statistics(exact=True)
+
+    assert pushdown["exact"] is False and exact["exact"] is True
+    assert pushdown["sample_size"] == exact["sample_size"] == 19
+    assert pushdown["statistics"] == exact["statistics"]
+    assert pushdown["dominant_factor"] == exact["dominant_factor"]
+    assert pushdown["correlation_matrix"]["sample_sizes"] == exact["correlation_matrix"]["sample_sizes"]
+    assert np.allclose(
+        np.array(pushdown["correlation_matrix"]["coefficients"], dtype=float),
+        np.array(exact["correlation_matrix"]["coefficients"], dtype=float),
+        atol=1e-3,
+        equal_nan=True,
+    )
+
+
+def test_histogram_median():
+    assert statistics_service._histogram_median([(10, 1), (12, 1), (30, 1)], 0.5) == 6.0
+    assert statistics_service._histogram_median([(10, 2), (20, 2)], 0.1) == 1.5
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import math
+import struct
+import zlib
+
+import numpy as np
+import pytest
+
+from app.services import tile_service
+from app.utils.png import encode_rgba
+
+
+def _tile_for(latitude: float, longitude: float, z: int):
+    scale = 2 ** z
+    x = int((longitude + 180.0) / 360.0 * scale)
+    lat = math.radians(latitude)
+    y = int((1 - math.log(math.tan(lat) + 1 / math.cos(lat)) / math.pi) / 2 * scale)
+    return x, y
+
+
+def test_encode_rgba_round_trip():
+    pixels = np.arange(2 * 3 * 4, dtype=np.uint8).reshape(2, 3, 4)
+    png = encode_rgba(pixels)
+
+    assert png.startswith(b"\x89PNG\r\n\x1a\n")
+    width, height = struct.unpack(">II", png[16:24])
+    assert (width, height) == (3, 2)
+    idat_length = struct.unpack(">I", png[33:37])[0]
+    raw = zlib.decompress(png[41 : 41 + idat_length])
+    rows = np.frombuffer(raw, dtype=np.uint8).reshape(2, 13)
+    assert (rows[:, 0] == 0).all()
+    assert (rows[:, 1:].reshape(2, 3, 4) == pixels).all()
+
+
+@pytest.mark.parametrize("method", ["idw", "gaussian"])
+def test_interpolate_grid_blends_neighbours(method):
+    field = tile_service.build_value_field([-37.0, -37.0], [144.0, 145.0], [10.0, 20.0])
+    latitudes = np.array([[-37.0, -37.0, -37.0, 10.0]])
+    longitudes = np.array([[144.0, 144.5, 145.0, 144.5]])
+
+    grid = tile_service.interpolate_grid(field, latitudes, longitudes, method=method)
+
+    assert grid[0, 1] == pytest.approx(15.0)
+    assert 10.0 <= grid[0, 0] < grid[0, 1] < grid[0, 2] <= 20.0
+    assert np.isnan(grid[0, 3])
+    if method == "idw":
+        # IDW is exact at the stations; the Gaussian kernel smooths them.
+        assert grid[0, 0] == pytest.approx(10.0, abs=0.01)
+        assert grid[0, 2] == pytest.approx(20.0, abs=0.01)
+
+
+def test_colourise_marks_empty_pixels_transparent():
+    pixels = tile_service.colourise(np.array([[0.0, 10.0, np.nan]]), 0.0, 10.0)
+    assert pixels[0, 0].tolist() == [0x00, 0x72, 0xB2, 255]
+    assert pixels[0, 1].tolist() == [0xD5, 0x5E, 0x00, 255]
+    assert pixels[0, 2, 3] == 0
+
+
+def test_tile_endpoint_renders_and_caches(test_app, sample_data):
+    station, _ = sample_data
+    tile_service.clear_tile_cache()
+    client = test_app.test_client()
+    x, y = _tile_for(station.latitude, station.longitude, 6)
+
+    response = client.get(f"/api/v1/weather/heatmap/tiles/6/{x}/{y}?format=f16")
+    assert response.status_code == 200
+    assert response.mimetype == "application/octet-stream"
+    values = np.frombuffer(response.data, dtype="<f2")
+    assert values.size == tile_service.TILE_SIZE ** 2
+    # A single station colours its whole neighbourhood with its latest value.
+    assert set(values[~np.isnan(values)].tolist()) == {29.0}
+
+    png = client.get(f"/api/v1/weather/heatmap/tiles/6/{x}/{y}")
+    assert png.mimetype == "image/png"
+    assert png.headers["X-Value-Min"] == "29.00"
+    assert len(tile_service._caches()[0]) == 2
+    client.get(f"/api/v1/weather/heatmap/tiles/6/{x}/{y}")
+    assert len(tile_service._caches()[0]) == 2
+
+    empty = client.get("/api/v1/weather/heatmap/tiles/6/0/0?format=f16")
+    assert np.isnan(np.frombuffer(empty.data, dtype="<f2")).all()
+    assert client.get("/api/v1/weather/heatmap/tiles/2/4/0").status_code == 400
+    assert client.get(f"/api/v1/weather/heatmap/tiles/6/{x}/{y}?format=jpg").status_code == 400
+    tile_service.clear_tile_cache()
+
+
+def test_tile_cache_evicts_and_expires(monkeypatch):
+    cache = tile_service.TileCache(max_entries=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    now = tile_service.time.monotonic()
+    monkeypatch.setattr(tile_service.time, "monotonic", lambda: now + 61)
+    assert cache.get("a") is None
+    assert len(cache) == 1
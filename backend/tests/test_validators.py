@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from datetime import date
+
 import pytest
 
 from app.utils import validators
+from app.utils.pagination import encode_cursor
 
 
 def test_validate_date_valid():
@@ -38,3 +41,42 @@ def test_validate_pagination_bounds():
         validators.validate_pagination("0", "10")
     with pytest.raises(ValueError):
         validators.validate_pagination("1", str(validators.MAX_PAGE_SIZE + 1))
+
+
+def test_validate_cursor_round_trip():
+    token = encode_cursor(date(2024, 1, 3), 7, 42)
+    assert validators.validate_cursor(token) == (date(2024, 1, 3), 7, 42)
+    assert validators.validate_cursor(None) is None
+
+
+def test_validate_cursor_invalid():
+    with pytest.raises(ValueError):
+        validators.validate_cursor("not-a-cursor")
+
+
+def test_validate_bbox():
+    assert validators.validate_bbox("144.5,-38.2,145.5,-37.5") == (144.5, -38.2, 145.5, -37.5)
+    assert validators.validate_bbox(None) is None
+    for invalid in ("144.5,-38.2,145.5", "a,b,c,d", "145.5,-38.2,144.5,-37.5", "144,-95,145,-37"):
+        with pytest.raises(ValueError):
+            validators.validate_bbox(invalid)
+
+
+def test_validate_zoom():
+    assert validators.validate_zoom("6") == 6
+    assert validators.validate_zoom(None) is None
+    for invalid in ("-1", "23", "six"):
+        with pytest.raises(ValueError):
+            validators.validate_zoom(invalid)
+
+
+def test_validate_coordinate_and_neighbours():
+    assert validators.validate_coordinate("-37.8", "lat", 90) == -37.8
+    assert validators.validate_neighbours(None) == validators.DEFAULT_NEIGHBOURS
+    assert validators.validate_neighbours("8") == 8
+    for invalid in (None, "north", "-91"):
+        with pytest.raises(ValueError):
+            validators.validate_coordinate(invalid, "lat", 90)
+    for invalid in ("0", "33", "many"):
+        with pytest.raises(ValueError):
+            validators.validate_neighbours(invalid)
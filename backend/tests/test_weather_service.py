@@ -1,6 +1,12 @@
 from __future__ import annotations
 
-from app.services import weather_service
+from datetime import date
+
+from app.models import Station, WeatherData
+from app.repositories import StationLatestRepository
+from app.services import station_catalog, weather_service
+from app.utils.geo import haversine_km
+from app.utils.pagination import decode_cursor
 
 
 def test_get_weather_data_pagination(sample_data):
@@ -20,3 +26,102 @@ def test_get_latest_values(sample_data):
     station, _ = sample_data
     data = weather_service.get_station_latest_values(metric="temperature")
     assert any(item["station_id"] == station.id for item in data)
+
+
+def test_get_weather_data_keyset_walk(sample_data):
+    station, _ = sample_data
+    first = weather_service.get_weather_data(station_ids=[station.id], page_size=2)
+    assert first["pagination"]["has_more"] is True
+    cursor = first["pagination"]["next_cursor"]
+
+    dates = [item["date"] for item in first["items"]]
+    while cursor:
+        page = weather_service.get_weather_data(
+            station_ids=[station.id],
+            page_size=2,
+            cursor=decode_cursor(cursor),
+        )
+        assert "total_items" not in page["pagination"]
+        dates.extend(item["date"] for item in page["items"])
+        cursor = page["pagination"]["next_cursor"]
+
+    assert dates == [f"2024-01-0{day}" for day in range(1, 6)]
+
+
+def test_get_weather_data_keyset_total(sample_data):
+    result = weather_service.get_weather_data(
+        page_size=10,
+        cursor=(date(2024, 1, 2), 0, 0),
+        include_total=True,
+    )
+    assert result["pagination"]["total_items"] == 5
+    assert result["pagination"]["has_more"] is False
+    assert result["pagination"]["next_cursor"] is None
+    assert len(result["items"]) == 4
+
+
+def test_get_latest_values_from_snapshot(session, sample_data):
+    station, _ = sample_data
+    expected = weather_service.get_station_latest_values(metric="rainfall")
+
+    StationLatestRepository(session).rebuild()
+    session.commit()
+
+    assert weather_service.get_station_latest_values(metric="rainfall") == expected
+    assert expected == [
+        {
+            "station_id": station.id,
+            "station_name": "Melbourne",
+            "latitude": station.latitude,
+            "longitude": station.longitude,
+            "state": "VIC",
+            "value": 4.0,
+        }
+    ]
+
+
+def test_interpolate_point_weights_by_distance(session, sample_data):
+    station, _ = sample_data
+    geelong = Station(
+        id=2, state="VIC", station_name="Geelong", latitude=-38.1499, longitude=144.3617
+    )
+    session.add(geelong)
+    session.add_all(
+        WeatherData(station_id=2, date=date(2024, 1, day), temp_max_c=20.0) for day in (1, 2)
+    )
+    session.commit()
+    station_catalog.refresh_catalog()
+
+    result = weather_service.interpolate_point(
+        latitude=-38.0,
+        longitude=144.6,
+        k=2,
+        start_date="2024-01-01",
+        end_date="2024-01-05",
+        metrics=["temperature", "rainfall"],
+    )
+    distances = haversine_km(-38.0, 144.6, [station.latitude, -38.1499], [station.longitude, 144.3617])
+    weights = 1.0 / distances**2
+    expected = (27.0 * weights[0] + 20.0 * weights[1]) / weights.sum()
+
+    assert result["values"]["temp_max_c"] == round(expected, 2)
+    # Geelong has no rainfall, so Melbourne's mean is used on its own.
+    assert result["values"]["rainfall_mm"] == 2.0
+    assert result["values"]["temp_min_c"] == 17.0
+    assert sorted(item["station_id"] for item in result["stations"]) == [1, 2]
+
+    at_station = weather_service.interpolate_point(
+        latitude=station.latitude, longitude=station.longitude, k=2
+    )
+    assert at_station["values"]["temp_max_c"] == 27.0
+    assert at_station["stations"][0]["weight"] == 1.0
+
+
+def test_point_endpoint(test_app, sample_data):
+    client = test_app.test_client()
+    payload = client.get(
+        "/api/v1/weather/point?lat=-37.9&lon=145.0&metrics=wind&start_date=2024-01-02"
+    ).get_json()
+    assert payload["values"] == {"wind_speed_ms": 7.5}
+    assert payload["start_date"] == "2024-01-02"
+    assert client.get("/api/v1/weather/point?lat=-37.9&lon=200").status_code == 400
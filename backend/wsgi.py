@@ -1,8 +1,16 @@
+import logging
 import os
+
 from app import create_app
+from app.services import station_catalog
 
 config_name = os.getenv('FLASK_CONFIG', 'development')
 app = create_app(config_name)
 
+try:
+    station_catalog.get_catalog()
+except Exception:  # pragma: no cover - the catalog loads lazily on first request instead
+    logging.getLogger(__name__).warning("Station catalog warm-up failed", exc_info=True)
+
 if __name__ == '__main__':
-    app.run()
\ No newline at end of file
+    app.run()
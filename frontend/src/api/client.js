@@ -25,4 +25,6 @@ apiClient.interceptors.response.use(
   },
 )
 
+export { baseURL as apiBaseURL }
+
 export default apiClient
@@ -1,10 +1,9 @@
-import { useEffect, useRef } from 'react'
+import { useEffect, useState } from 'react'
 import { MapContainer, TileLayer, Marker, useMap, useMapEvents } from 'react-leaflet'
-import MarkerClusterGroup from 'react-leaflet-cluster'
 import L from 'leaflet'
-import 'leaflet.heat'
 import { useFilters } from '../../context/FilterContext'
-import { useHeatmapData } from '../../hooks/useStations'
+import { apiBaseURL } from '../../api/client'
+import { useHeatmapData, useStationClusters } from '../../hooks/useStations'
 import { metricConfig } from '../../constants/metrics'
 
 const stationIcon = L.divIcon({
@@ -21,85 +20,24 @@ const selectedStationIcon = L.divIcon({
   iconAnchor: [10, 20],
 })
 
-const HeatmapLayer = ({ data, metric }) => {
+const HeatmapLayer = ({ metric, startDate, endDate }) => {
   const map = useMap()
-  const heatLayerRef = useRef(null)
 
   useEffect(() => {
-    const removeLayer = () => {
-      if (heatLayerRef.current) {
-        map.removeLayer(heatLayerRef.current)
-        heatLayerRef.current = null
-      }
-    }
-
-    if (!data?.length) {
-      removeLayer()
-      return undefined
-    }
-
-    const buildHeatLayer = () => {
-      removeLayer()
+    const params = new URLSearchParams({ metric })
+    if (startDate) params.set('start_date', startDate)
+    if (endDate) params.set('end_date', endDate)
 
-      const heatData = data
-        .filter((entry) => entry.value !== null && entry.value !== undefined)
-        .map((entry) => [entry.latitude, entry.longitude, entry.value || 0])
+    // The surface is interpolated and coloured on the server, which caches each tile.
+    const layer = L.tileLayer(`${apiBaseURL}/weather/heatmap/tiles/{z}/{x}/{y}?${params}`, {
+      opacity: 0.65,
+      zIndex: 10,
+    }).addTo(map)
 
-      if (!heatData.length) {
-        return
-      }
-
-      const values = heatData.map((entry) => entry[2])
-      const sortedValues = [...values].sort((a, b) => a - b)
-      const p10 = sortedValues[Math.floor(sortedValues.length * 0.1)]
-      const p90 = sortedValues[Math.floor(sortedValues.length * 0.9)]
-
-      const normalisedData = heatData.map((entry) => {
-        let value = entry[2]
-        value = Math.max(p10, Math.min(p90, value))
-        const normalised = p90 === p10 ? 0.5 : (value - p10) / (p90 - p10)
-        return [entry[0], entry[1], normalised]
-      })
-
-      heatLayerRef.current = L.heatLayer(normalisedData, {
-        radius: 45,
-        blur: 60,
-        max: 0.8,
-        minOpacity: 0.4,
-        gradient: {
-          0.0: '#0072B2',
-          0.25: '#009E73',
-          0.5: '#F0E442',
-          0.75: '#E69F00',
-          1.0: '#D55E00',
-        },
-      }).addTo(map)
-    }
-
-    const size = map.getSize()
-    if (!size.x || !size.y) {
-      const handleResize = () => {
-        map.off('resize', handleResize)
-        buildHeatLayer()
-      }
-
-      map.on('resize', handleResize)
-      if (typeof requestAnimationFrame === 'function') {
-        requestAnimationFrame(() => map.invalidateSize())
-      } else {
-        setTimeout(() => map.invalidateSize(), 0)
-      }
-
-      return () => {
-        map.off('resize', handleResize)
-        removeLayer()
-      }
+    return () => {
+      map.removeLayer(layer)
     }
-
-    buildHeatLayer()
-
-    return removeLayer
-  }, [data, metric, map])
+  }, [metric, startDate, endDate, map])
 
   useEffect(() => {
     const resizeHandler = () => {
@@ -135,63 +73,92 @@ const getMetricUnit = (metric) => {
   }
 }
 
-const StationMarkers = ({ stations, onStationClick, clusteringEnabled, selectedMetric }) => {
-  const unit = getMetricUnit(selectedMetric)
+const clusterIcon = (count) => {
+  let size = 'small'
+  if (count > 50) size = 'large'
+  else if (count > 20) size = 'medium'
+
+  const dimension = size === 'large' ? 50 : size === 'medium' ? 40 : 30
+  const fontSize = size === 'large' ? 16 : size === 'medium' ? 14 : 12
+
+  return L.divIcon({
+    html: `<div style="
+      width: ${dimension}px;
+      height: ${dimension}px;
+      background: #5865F2;
+      border-radius: 50%;
+      display: flex;
+      align-items: center;
+      justify-content: center;
+      color: white;
+      font-weight: bold;
+      font-size: ${fontSize}px;
+    ">${count}</div>`,
+    className: 'custom-cluster-icon',
+    iconSize: L.point(dimension, dimension),
+  })
+}
 
-  const markers = stations?.map((station) => (
-    <Marker
-      key={station.station_id}
-      position={[station.latitude, station.longitude]}
-      icon={stationIcon}
-      eventHandlers={{
-        click: () => onStationClick(station.station_id),
-      }}
-    />
-  ))
-
-  if (!clusteringEnabled) {
-    return <>{markers}</>
-  }
+const formatClusterValue = (value, unit) => {
+  if (!value) return 'No data'
+  return `mean ${value.mean} ${unit} (min ${value.min}, max ${value.max})`
+}
+
+// Clusters are precomputed on the server for the current zoom and viewport.
+const ClusterMarkers = ({ clusters, onStationClick, selectedMetric }) => {
+  const map = useMap()
+  const unit = getMetricUnit(selectedMetric)
 
   return (
-    <MarkerClusterGroup
-      chunkedLoading
-      maxClusterRadius={60}
-      spiderfyOnMaxZoom
-      showCoverageOnHover={false}
-      zoomToBoundsOnClick
-      iconCreateFunction={(cluster) => {
-        const count = cluster.getChildCount()
-        let size = 'small'
-        if (count > 50) size = 'large'
-        else if (count > 20) size = 'medium'
-
-        const dimension = size === 'large' ? 50 : size === 'medium' ? 40 : 30
-        const fontSize = size === 'large' ? 16 : size === 'medium' ? 14 : 12
-
-        return L.divIcon({
-          html: `<div style="
-            width: ${dimension}px;
-            height: ${dimension}px;
-            background: #5865F2;
-            border-radius: 50%;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            color: white;
-            font-weight: bold;
-            font-size: ${fontSize}px;
-          ">${count}</div>`,
-          className: 'custom-cluster-icon',
-          iconSize: L.point(dimension, dimension),
-        })
-      }}
-    >
-      {markers}
-    </MarkerClusterGroup>
+    <>
+      {clusters?.map((cluster) => {
+        if (cluster.station_id !== null) {
+          return (
+            <Marker
+              key={`station-${cluster.station_id}`}
+              position={[cluster.latitude, cluster.longitude]}
+              icon={stationIcon}
+              eventHandlers={{
+                click: () => onStationClick(cluster.station_id),
+              }}
+            />
+          )
+        }
+
+        return (
+          <Marker
+            key={`cluster-${cluster.latitude}-${cluster.longitude}`}
+            position={[cluster.latitude, cluster.longitude]}
+            icon={clusterIcon(cluster.count)}
+            title={`${cluster.count} stations: ${formatClusterValue(cluster.value, unit)}`}
+            eventHandlers={{
+              click: () => map.setView(
+                [cluster.latitude, cluster.longitude],
+                cluster.expansion_zoom ?? map.getZoom() + 2,
+              ),
+            }}
+          />
+        )
+      })}
+    </>
   )
 }
 
+const StationMarkers = ({ stations, onStationClick }) => (
+  <>
+    {stations?.map((station) => (
+      <Marker
+        key={station.station_id}
+        position={[station.latitude, station.longitude]}
+        icon={stationIcon}
+        eventHandlers={{
+          click: () => onStationClick(station.station_id),
+        }}
+      />
+    ))}
+  </>
+)
+
 const mapStyles = {
   standard: {
     url: 'https://{s}.tile.openstreetmap.org/{z}/{x}/{y}.png',
@@ -211,6 +178,37 @@ const mapStyles = {
   },
 }
 
+const clamp = (value, min, max) => Math.min(max, Math.max(min, value))
+const roundCoordinate = (value) => Math.round(value * 100) / 100
+
+// Padded, rounded viewport so small pans reuse cached responses.
+const getViewport = (map) => {
+  const bounds = map.getBounds().pad(0.25)
+  return {
+    bbox: [
+      clamp(bounds.getWest(), -180, 180),
+      clamp(bounds.getSouth(), -90, 90),
+      clamp(bounds.getEast(), -180, 180),
+      clamp(bounds.getNorth(), -90, 90),
+    ].map(roundCoordinate).join(','),
+    zoom: map.getZoom(),
+  }
+}
+
+const ViewportTracker = ({ onViewportChange }) => {
+  const map = useMapEvents({
+    moveend() {
+      onViewportChange(getViewport(map))
+    },
+  })
+
+  useEffect(() => {
+    map.whenReady(() => onViewportChange(getViewport(map)))
+  }, [map, onViewportChange])
+
+  return null
+}
+
 const MapInteractionLayer = ({ onMapClick }) => {
   useMapEvents({
     click(event) {
@@ -226,8 +224,11 @@ const MapInteractionLayer = ({ onMapClick }) => {
 
 export default function StationMap() {
   const { selectedMetric, setSelectedStationId, selectedStationId, mapStyle, clusteringEnabled, showStations, showHeatmap, startDate, endDate } = useFilters()
-  const shouldFetchHeatmap = showHeatmap || showStations || Boolean(selectedStationId)
-  const { data: heatmapData = [], isLoading } = useHeatmapData(selectedMetric, startDate, endDate, { enabled: shouldFetchHeatmap })
+  const showClusters = showStations && clusteringEnabled
+  const shouldFetchHeatmap = (showStations && !clusteringEnabled) || Boolean(selectedStationId)
+  const [viewport, setViewport] = useState(null)
+  const { data: heatmapData = [], isLoading } = useHeatmapData(selectedMetric, startDate, endDate, { enabled: shouldFetchHeatmap, viewport })
+  const { data: clusters = [] } = useStationClusters(selectedMetric, startDate, endDate, { enabled: showClusters, viewport })
 
   const handleStationClick = (stationId) => {
     setSelectedStationId(stationId)
@@ -283,16 +284,19 @@ export default function StationMap() {
         attributionControl={false}
       >
         <MapInteractionLayer onMapClick={handleClearSelection} />
+        <ViewportTracker onViewportChange={setViewport} />
         <TileLayer url={currentMapStyle.url} attribution={currentMapStyle.attribution} />
-        {showHeatmap && <HeatmapLayer data={heatmapData} metric={selectedMetric} />}
-        {showStations && (
-        <StationMarkers
-          stations={heatmapData}
+        {showHeatmap && <HeatmapLayer metric={selectedMetric} startDate={startDate} endDate={endDate} />}
+        {showClusters && (
+        <ClusterMarkers
+          clusters={clusters}
           onStationClick={handleStationClick}
-          clusteringEnabled={clusteringEnabled}
           selectedMetric={selectedMetric}
         />
         )}
+        {showStations && !clusteringEnabled && (
+        <StationMarkers stations={heatmapData} onStationClick={handleStationClick} />
+        )}
         {selectedStationData && (
           <Marker
             key={`selected-${selectedStationData.station_id}`}
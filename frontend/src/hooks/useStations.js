@@ -1,4 +1,4 @@
-import { useQuery } from '@tanstack/react-query'
+import { keepPreviousData, useQuery } from '@tanstack/react-query'
 import apiClient from '../api/client'
 
 export const useStations = (state = '') => {
@@ -25,19 +25,44 @@ export const useStates = () => {
 }
 
 export const useHeatmapData = (metric = 'temperature', startDate = null, endDate = null, options = {}) => {
-  const { enabled = true } = options
+  const { enabled = true, viewport = null } = options
 
   return useQuery({
-    queryKey: ['heatmap', metric, startDate, endDate],
+    queryKey: ['heatmap', metric, startDate, endDate, viewport?.bbox ?? null, viewport?.zoom ?? null],
     queryFn: async () => {
       const params = { metric }
       if (startDate) params.start_date = startDate
       if (endDate) params.end_date = endDate
+      if (viewport) {
+        params.bbox = viewport.bbox
+        params.zoom = viewport.zoom
+      }
 
       const response = await apiClient.get('weather/heatmap', { params })
       return response.data
     },
     staleTime: 5 * 60 * 1000,
+    // Keep the current markers on screen while the next viewport loads.
+    placeholderData: keepPreviousData,
     enabled,
   })
 }
+
+export const useStationClusters = (metric = 'temperature', startDate = null, endDate = null, options = {}) => {
+  const { enabled = true, viewport = null } = options
+
+  return useQuery({
+    queryKey: ['station-clusters', metric, startDate, endDate, viewport?.bbox ?? null, viewport?.zoom ?? null],
+    queryFn: async () => {
+      const params = { metric, zoom: viewport.zoom, bbox: viewport.bbox }
+      if (startDate) params.start_date = startDate
+      if (endDate) params.end_date = endDate
+
+      const response = await apiClient.get('stations/clusters', { params })
+      return response.data.items
+    },
+    staleTime: 5 * 60 * 1000,
+    placeholderData: keepPreviousData,
+    enabled: enabled && Boolean(viewport),
+  })
+}